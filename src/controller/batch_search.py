@@ -0,0 +1,91 @@
+'''
+Batch matching banyak requisition sekaligus, hasil di-stream ke JSON Lines atau CSV.
+
+Contoh (dari folder src):
+    python -m controller.batch_search requisitions.json -o matches.csv --format csv --top 10
+
+requisitions.json berisi {"nama requisition": "python, sql", ...} atau
+[{"name": "...", "keywords": "..."}, ...].
+'''
+
+import sys
+import argparse
+import contextlib
+import csv
+import json
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent
+sys.path.insert(0, str(project_root))
+
+# stdout dipakai untuk hasil, jadi pesan progress dan warning modul lain dialihkan ke stderr
+with contextlib.redirect_stdout(sys.stderr):
+    from controller.searcher import SearchController, RANKING_COUNT, RANKING_BM25
+
+CSV_FIELDS = ["requisition", "rank", "cv_id", "name", "score", "matched_keywords"]
+
+def load_requisitions(path) -> dict:
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    if isinstance(data, list):
+        return {item["name"]: item["keywords"] for item in data}
+    return dict(data)
+
+def _rows(controller, name, results):
+    cv_names = controller.get_applicant_names([result["cv_id"] for result in results])
+    for rank, result in enumerate(results, start=1):
+        yield {
+            "requisition": name,
+            "rank": rank,
+            "cv_id": result["cv_id"],
+            "name": cv_names[result["cv_id"]],
+            "score": result["total_score"],
+            "matches": {kw: count for kw, count in result["matches"].items() if count > 0},
+        }
+
+def write_batch_json(controller, batch_iter, out):
+    # satu baris JSON per requisition, ditulis begitu hasilnya siap
+    for name, results in batch_iter:
+        record = {"requisition": name, "results": [
+            {key: value for key, value in row.items() if key != "requisition"}
+            for row in _rows(controller, name, results)
+        ]}
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+
+def write_batch_csv(controller, batch_iter, out):
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for name, results in batch_iter:
+        for row in _rows(controller, name, results):
+            row["matched_keywords"] = "; ".join(f"{kw}:{count}" for kw, count in row.pop("matches").items())
+            writer.writerow(row)
+        out.flush()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Match many requisitions against the CV pool in one pass")
+    parser.add_argument("requisitions", help="JSON file with requisition keyword lists")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--top", type=int, default=5, help="top-k CVs per requisition")
+    parser.add_argument("--ranking", choices=[RANKING_COUNT, RANKING_BM25], default=RANKING_COUNT)
+    args = parser.parse_args(argv)
+
+    requisitions = load_requisitions(args.requisitions)
+    write = write_batch_csv if args.format == "csv" else write_batch_json
+    stdout = sys.stdout
+
+    with contextlib.redirect_stdout(sys.stderr):
+        controller = SearchController(parallel_workers=0)
+        batch_iter = controller.iter_batch_search(requisitions, args.top, args.ranking)
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", newline="") as out:
+                write(controller, batch_iter, out)
+            print(f"Wrote {len(requisitions)} requisitions to {args.output}")
+        else:
+            write(controller, batch_iter, stdout)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+'''
+Registry engine pencarian beserta kapabilitas dan cost model untuk algoritma "Auto"
+'''
+
+from collections import deque
+import json
+import os
+import time
+
+# kapabilitas engine
+EXACT = "exact"                 # hasil setara pencarian substring exact
+FUZZY = "fuzzy"                 # menerima q-gram index dan stats (Levenshtein)
+MULTI_PATTERN = "multi_pattern" # semua keyword dicari dalam satu automaton
+
+# file JSON Lines untuk mencatat keputusan planner dan waktu terukur, kosong = hanya di memori
+PLANNER_LOG_PATH = os.environ.get("SIGNHIRE_PLANNER_LOG", "")
+PLANNER_HISTORY_SIZE = 1000
+
+def corpus_statistics(cv_database: dict) -> dict:
+    return {
+        "cvs": len(cv_database),
+        "chars": sum(len(content) for content in cv_database.values())
+    }
+
+def query_features(corpus_stats: dict, keywords: list) -> dict:
+    lengths = [len(kw.strip()) for kw in keywords if kw.strip()]
+    return {
+        "cvs": corpus_stats["cvs"],
+        "chars": corpus_stats["chars"],
+        "keywords": len(lengths),
+        "keyword_chars": sum(lengths),
+        "inverse_length_sum": sum(1 / length for length in lengths),
+    }
+
+class SearchEngine:
+    '''
+    Sebuah matcher di registry. cost_terms(features) mengembalikan komponen biaya (jumlah
+    operasi per jenis) dan coefficients berisi ms per operasi, sehingga estimasi biaya
+    adalah jumlah perkalian keduanya. Koefisien awal berasal dari pengukuran dan bisa
+    dikalibrasi ulang dari log waktu terukur.
+    '''
+    def __init__(self, name: str, search_fn, capabilities: set, cost_terms=None, coefficients: dict = None):
+        self.name = name
+        self.search_fn = search_fn
+        self.capabilities = frozenset(capabilities)
+        self.cost_terms = cost_terms
+        self.coefficients = dict(coefficients or {})
+
+    def has(self, capability: str) -> bool:
+        return capability in self.capabilities
+
+    def estimate_ms(self, features: dict) -> float:
+        if self.cost_terms is None:
+            return float("inf")
+        terms = self.cost_terms(features)
+        return sum(self.coefficients.get(term, 0.0) * value for term, value in terms.items())
+
+class EngineRegistry:
+    def __init__(self, log_path: str = PLANNER_LOG_PATH):
+        self.engines = {}
+        self.log_path = log_path
+        self.history = deque(maxlen=PLANNER_HISTORY_SIZE)
+
+    def register(self, engine: SearchEngine):
+        self.engines[engine.name] = engine
+
+    def get(self, name: str) -> SearchEngine:
+        return self.engines.get(name)
+
+    def names(self) -> list:
+        return list(self.engines)
+
+    def plan(self, keywords: list, corpus_stats: dict, capability: str = EXACT) -> tuple:
+        '''
+        Memilih engine termurah di antara engine dengan kapabilitas tersebut.
+        Mengembalikan (engine, fitur query, estimasi ms per engine).
+        '''
+        features = query_features(corpus_stats, keywords)
+        estimates = {
+            name: engine.estimate_ms(features)
+            for name, engine in self.engines.items()
+            if engine.has(capability) and engine.cost_terms is not None
+        }
+        if not estimates:
+            return None, features, estimates
+        best = min(estimates, key=estimates.get)
+        return self.engines[best], features, estimates
+
+    def record(self, engine_name: str, features: dict, measured_ms: float, auto: bool, estimates: dict = None):
+        engine = self.engines.get(engine_name)
+        if engine is None or engine.cost_terms is None:
+            return
+        entry = {
+            "timestamp": round(time.time(), 3),
+            "engine": engine_name,
+            "auto": auto,
+            "features": features,
+            "predicted_ms": round(engine.estimate_ms(features), 2),
+            "measured_ms": measured_ms,
+        }
+        if estimates:
+            entry["estimates"] = {name: round(ms, 2) for name, ms in estimates.items()}
+        self.history.append(entry)
+
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as log_file:
+                    log_file.write(json.dumps(entry) + "\n")
+            except OSError as e:
+                print(f"Could not write planner log: {e}")
+
+    def load_history(self, path: str = None) -> list:
+        path = path or self.log_path
+        if not path or not os.path.exists(path):
+            return list(self.history)
+        with open(path, "r", encoding="utf-8") as log_file:
+            return [json.loads(line) for line in log_file if line.strip()]
+
+    def recalibrate(self, entries: list = None) -> dict:
+        '''
+        Menskalakan koefisien tiap engine agar estimasi paling dekat (least squares) dengan
+        waktu terukur di log. Mengembalikan faktor skala per engine.
+        '''
+        entries = self.load_history() if entries is None else entries
+        sums = {}
+        for entry in entries:
+            engine = self.engines.get(entry["engine"])
+            if engine is None or engine.cost_terms is None:
+                continue
+            predicted = engine.estimate_ms(entry["features"])
+            if predicted <= 0:
+                continue
+            cross, square = sums.get(engine.name, (0.0, 0.0))
+            sums[engine.name] = (cross + predicted * entry["measured_ms"], square + predicted * predicted)
+
+        scales = {}
+        for name, (cross, square) in sums.items():
+            if square > 0 and cross > 0:
+                scale = cross / square
+                engine = self.engines[name]
+                engine.coefficients = {term: coef * scale for term, coef in engine.coefficients.items()}
+                scales[name] = round(scale, 4)
+        return scales
+
+# cost model default, koefisien (ms per operasi) diukur pada korpus CV sintetis
+def kmp_cost_terms(features: dict) -> dict:
+    # satu lintasan linear per keyword
+    return {"scan": features["chars"] * features["keywords"]}
+
+def boyer_moore_cost_terms(features: dict) -> dict:
+    # lompatan bad-character rata-rata sebanding dengan panjang keyword
+    return {
+        "skip": features["chars"] * features["inverse_length_sum"],
+        "scan": features["chars"] * features["keywords"],
+    }
+
+def aho_corasick_cost_terms(features: dict) -> dict:
+    # satu lintasan automaton per CV, automaton dibangun per CV, posisi dicari dengan str.find
+    return {
+        "automaton": features["chars"],
+        "build": features["cvs"] * features["keyword_chars"],
+        "find": features["chars"] * features["keywords"],
+    }
+
+KMP_COEFFICIENTS = {"scan": 1.4e-4}
+BOYER_MOORE_COEFFICIENTS = {"skip": 4.5e-4, "scan": 1.0e-5}
+AHO_CORASICK_COEFFICIENTS = {"automaton": 5.5e-5, "build": 1.0e-3, "find": 2.2e-5}
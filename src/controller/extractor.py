@@ -13,32 +13,48 @@ except ImportError:
 
 _SPACES: Final = re.compile(r"\s+")
 
-def _read_pdf(pdf_path: str | Path) -> str:
+# versi normalisasi teks, naikkan jika aturan normalisasi berubah agar teks CV tersimpan dianggap basi
+EXTRACTOR_VERSION: Final = "1"
+
+def _read_pdf_pages(pdf_path: str | Path) -> list[str]:
     if fitz is None:
         raise ImportError("PyMuPDF not installed. Cannot extract PDF content.")
     
     try:
         doc = fitz.open(pdf_path)
-        text_content = "\n".join([page.get_text("text") for page in doc])
+        pages = [page.get_text("text") for page in doc]
         doc.close()
-        return text_content
+        return pages
     except Exception as e:
         raise Exception(f"Error reading PDF {pdf_path}: {str(e)}")
 
+def _read_pdf(pdf_path: str | Path) -> str:
+    return "\n".join(_read_pdf_pages(pdf_path))
+
+def normalize_text(raw: str, use_regex: bool = False) -> str:
+    if use_regex:
+        cleaned_lines = [ln.strip() for ln in raw.splitlines() if ln.strip()]
+        return "\n".join(cleaned_lines)
+    return _SPACES.sub(" ", raw).strip().lower()
+
 def extract_cv_content_direct(pdf_path: str | Path, use_regex: bool = False) -> str:
     try:
-        raw = _read_pdf(pdf_path)
-        
-        if use_regex:
-            cleaned_lines = [ln.strip() for ln in raw.splitlines() if ln.strip()]
-            return "\n".join(cleaned_lines)
-        else:
-            return _SPACES.sub(" ", raw).strip().lower()
+        return normalize_text(_read_pdf(pdf_path), use_regex)
             
     except Exception as e:
         print(f"Error extracting content from {pdf_path}: {e}")
         return f"Error extracting PDF content: {str(e)}"
 
+def extract_cv_text_forms(pdf_path: str | Path) -> dict:
+    # PDF dibaca sekali untuk kedua bentuk teks; error diteruskan agar hasil gagal tidak disimpan
+    pages = _read_pdf_pages(pdf_path)
+    raw = "\n".join(pages)
+    return {
+        "plain": normalize_text(raw, use_regex=False),
+        "regex": normalize_text(raw, use_regex=True),
+        "page_count": len(pages),
+    }
+
 # # Driver
 # if __name__ == "__main__":
 #     print("PDF Extractor Test")
@@ -0,0 +1,147 @@
+import sys
+import os
+from pathlib import Path
+import atexit
+import heapq
+from itertools import chain
+from multiprocessing import Pool, Value, shared_memory
+
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent
+sys.path.insert(0, str(project_root))
+
+from model.knuth_morris_pratt import search_cvs_with_details as search_cvs_with_kmp
+from model.boyer_moore import search_cvs_boyer_moore
+from model.aho_corasick import search_cvs_with_aho_corasick
+from model.levenshtein_distance import search_cvs_with_levenshtein
+
+SHARD_ENGINES = {
+    "KMP": search_cvs_with_kmp,
+    "BM": search_cvs_boyer_moore,
+    "Aho-Corasick": search_cvs_with_aho_corasick,
+    "Levenshtein": search_cvs_with_levenshtein,
+}
+
+# jumlah shard per worker, agar worker yang selesai duluan bisa mengambil shard lain
+SHARDS_PER_WORKER = 2
+# interval pengecekan token pembatalan saat menunggu shard (detik)
+CANCEL_POLL_SECONDS = 0.05
+
+# state per proses worker, diisi sekali oleh initializer pool
+_worker_state = {}
+
+def _attach_corpus(shm_name: str, cv_ids: list, offsets: list, qgram_index, generation):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_state["shm"] = shm
+    _worker_state["cv_ids"] = cv_ids
+    _worker_state["offsets"] = offsets
+    _worker_state["qgram_index"] = qgram_index
+    _worker_state["generation"] = generation
+
+def _read_shard(start: int, stop: int) -> dict:
+    # decode langsung dari shared memory, teks CV tidak pernah dikirim lewat pickle per query
+    buf = _worker_state["shm"].buf
+    cv_ids = _worker_state["cv_ids"]
+    offsets = _worker_state["offsets"]
+    return {
+        cv_ids[i]: bytes(buf[offsets[i]:offsets[i + 1]]).decode("utf-8")
+        for i in range(start, stop)
+    }
+
+def _search_shard(task: tuple) -> list:
+    start, stop, algorithm, keywords, top_n, generation = task
+    # ada pencarian yang dibatalkan sejak shard ini diantrekan: dilewati tanpa dipindai (None)
+    if _worker_state["generation"].value != generation:
+        return None
+    shard = _read_shard(start, stop)
+    if algorithm == "Levenshtein":
+        return search_cvs_with_levenshtein(shard, keywords, top_n, _worker_state["qgram_index"])
+    return SHARD_ENGINES[algorithm](shard, keywords, top_n)
+
+class ParallelSearcher:
+    '''
+    Korpus lowercase di-pack sekali ke multiprocessing.shared_memory, lalu pool worker
+    (warm, attach lewat initializer) memindai shard yang saling lepas. Top-k tiap shard
+    digabung di proses utama. Pencarian yang dibatalkan menaikkan generation bersama
+    sehingga shard yang masih antre di pool langsung dilewati worker.
+    '''
+    def __init__(self, cv_database: dict, processes: int = None, qgram_index=None):
+        self.processes = processes or os.cpu_count() or 1
+        self.cv_ids = list(cv_database.keys())
+
+        encoded = [cv_database[cv_id].lower().encode("utf-8") for cv_id in self.cv_ids]
+        offsets = [0]
+        for text in encoded:
+            offsets.append(offsets[-1] + len(text))
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, offsets[-1]))
+        self.shm.buf[:offsets[-1]] = b"".join(encoded)
+        del encoded
+
+        shard_count = min(len(self.cv_ids), self.processes * SHARDS_PER_WORKER) or 1
+        bounds = [len(self.cv_ids) * i // shard_count for i in range(shard_count + 1)]
+        self.shards = [(bounds[i], bounds[i + 1]) for i in range(shard_count) if bounds[i] < bounds[i + 1]]
+
+        self.generation = Value("i", 0)
+        self.pool = Pool(
+            processes=self.processes,
+            initializer=_attach_corpus,
+            initargs=(self.shm.name, self.cv_ids, offsets, qgram_index, self.generation)
+        )
+        atexit.register(self.close)
+        print(f"Parallel search ready: {len(self.cv_ids)} CVs, {len(self.shards)} shards, "
+              f"{self.processes} workers, {offsets[-1]} bytes shared")
+
+    def supports(self, algorithm: str) -> bool:
+        return algorithm in SHARD_ENGINES
+
+    def search(self, algorithm: str, keywords: list, top_n: int = 5, cancel_token=None) -> list:
+        shard_results = [results for results, _ in self.iter_search(algorithm, keywords, top_n, cancel_token)]
+        # nlargest stabil terhadap urutan shard, sama dengan urutan pencarian sekuensial
+        return heapq.nlargest(top_n, chain.from_iterable(shard_results), key=lambda r: r["total_score"])
+
+    def iter_search(self, algorithm: str, keywords: list, top_n: int = 5, cancel_token=None, batch_size: int = None):
+        '''
+        Yield (top-k shard, jumlah CV di shard) berurutan begitu shard tersebut selesai.
+        Jika batch_size diberikan, korpus dipecah menjadi shard kecil agar hasil pertama
+        cepat muncul (dipakai untuk streaming).
+        '''
+        ranges = self.shards if batch_size is None else [
+            (start, min(start + batch_size, len(self.cv_ids)))
+            for start in range(0, len(self.cv_ids), batch_size)
+        ]
+        def submit(start, stop):
+            task = (start, stop, algorithm, keywords, top_n, self.generation.value)
+            return self.pool.apply_async(_search_shard, (task,))
+        
+        pending = [submit(start, stop) for start, stop in ranges]
+        finished = False
+        try:
+            for done, (start, stop) in enumerate(ranges):
+                while True:
+                    # shard yang sudah jalan dibiarkan selesai di worker jika dibatalkan, hasilnya dibuang
+                    while not pending[done].ready():
+                        if cancel_token is not None:
+                            cancel_token.checkpoint(done, len(pending))
+                        pending[done].wait(CANCEL_POLL_SECONDS)
+                    results = pending[done].get()
+                    if results is not None:
+                        break
+                    # dilewati karena pencarian lain dibatalkan: sisa shard dikirim ulang
+                    pending[done:] = [submit(start, stop) for start, stop in ranges[done:]]
+                yield results, stop - start
+            finished = True
+        finally:
+            if not finished:
+                with self.generation.get_lock():
+                    self.generation.value += 1
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
@@ -2,11 +2,15 @@ import sys
 import os
 from pathlib import Path
 import time
+import heapq
+from itertools import chain, islice
 
 current_dir = Path(__file__).resolve().parent
 project_root = current_dir.parent
 sys.path.insert(0, str(project_root))
 
+from model.cancellation import BatchCancellationToken, SearchCancelled
+
 try:
     from model.knuth_morris_pratt import search_cvs_with_details as search_cvs_with_kmp
 except ImportError as e:
@@ -14,10 +18,11 @@ except ImportError as e:
     search_cvs_with_kmp = None
 
 try:
-    from model.aho_corasick import search_cvs_with_aho_corasick
+    from model.aho_corasick import search_cvs_with_aho_corasick, batch_search_with_aho_corasick
 except ImportError as e:
     print(f"Warning: Could not import Aho-Corasick algorithm: {e}")
     search_cvs_with_aho_corasick = None
+    batch_search_with_aho_corasick = None
 
 try:
     from model.boyer_moore import search_cvs_boyer_moore
@@ -26,10 +31,62 @@ except ImportError as e:
     search_cvs_boyer_moore = None
 
 try:
-    from model.levenshtein_distance import search_cvs_with_levenshtein
+    from model.levenshtein_distance import (search_cvs_with_levenshtein, iter_levenshtein_results, build_pass_cache,
+                                            levenshtein_results_from_index)
 except ImportError as e:
     print(f"Warning: Could not import Levenshtein algorithm: {e}")
     search_cvs_with_levenshtein = None
+    iter_levenshtein_results = None
+    build_pass_cache = None
+    levenshtein_results_from_index = None
+
+try:
+    from model.qgram_index import QGramIndex
+except ImportError as e:
+    print(f"Warning: Could not import q-gram index: {e}")
+    QGramIndex = None
+
+try:
+    from model.positional_index import PositionalIndex
+    from model.query_parser import QuerySyntaxError, is_structured_query, parse_query, search_cvs_with_query
+except ImportError as e:
+    print(f"Warning: Could not import query language: {e}")
+    PositionalIndex = None
+    QuerySyntaxError = ValueError
+    is_structured_query = None
+    parse_query = None
+    search_cvs_with_query = None
+
+try:
+    from model.bm25 import search_cvs_with_bm25
+except ImportError as e:
+    print(f"Warning: Could not import BM25 ranking: {e}")
+    search_cvs_with_bm25 = None
+
+try:
+    from model.substring_index import SubstringIndex, search_cvs_with_substring_index
+except ImportError as e:
+    print(f"Warning: Could not import substring index: {e}")
+    SubstringIndex = None
+    search_cvs_with_substring_index = None
+
+try:
+    from model.percolator import Percolator
+except ImportError as e:
+    print(f"Warning: Could not import percolator: {e}")
+    Percolator = None
+
+from controller.engine_registry import (
+    EngineRegistry, SearchEngine, EXACT, FUZZY, MULTI_PATTERN, corpus_statistics, query_features,
+    kmp_cost_terms, boyer_moore_cost_terms, aho_corasick_cost_terms,
+    KMP_COEFFICIENTS, BOYER_MOORE_COEFFICIENTS, AHO_CORASICK_COEFFICIENTS
+)
+
+try:
+    from controller.parallel_search import ParallelSearcher
+except ImportError as e:
+    print(f"Warning: Could not import parallel search: {e}")
+    ParallelSearcher = None
 
 try:
     from database.cv_data_manager import cv_data_manager
@@ -37,11 +94,33 @@ except ImportError as e:
     print(f"Warning: Could not import CV data manager: {e}")
     cv_data_manager = None
 
+# batas waktu fallback Levenshtein per query (ms)
+LEVENSHTEIN_BUDGET_MS = 1500
+# jumlah worker untuk pencarian paralel, 0 = nonaktif (set SIGNHIRE_WORKERS=8 untuk 8 core)
+PARALLEL_WORKERS = int(os.environ.get("SIGNHIRE_WORKERS", "0"))
+# jumlah CV per batch untuk snapshot hasil sementara pada iter_search_cvs
+STREAM_BATCH_SIZE = 64
+# mode ranking: jumlah kemunculan mentah atau BM25 dari positional index
+RANKING_COUNT = "count"
+RANKING_BM25 = "bm25"
+# pilihan algoritma yang diserahkan ke planner (engine exact termurah menurut cost model)
+AUTO_ALGORITHM = "Auto"
+
 class SearchController:
-    def __init__(self):
+    def __init__(self, fallback_budget_ms=LEVENSHTEIN_BUDGET_MS, parallel_workers=PARALLEL_WORKERS):
         self.cv_data_manager = cv_data_manager
+        self.fallback_budget_ms = fallback_budget_ms
+        self.parallel_workers = parallel_workers
+        self.parallel_searcher = None
+        self.substring_index = None
+        self.live_state = {}
         self.cv_database = {}
-        self.applicant_data_cache = {}
+        self.qgram_index = None
+        self.positional_index = None
+        self.percolator = None
+        self.last_percolation = {}
+        self.corpus_stats = corpus_statistics({})
+        self.engines = self._build_engine_registry()
         
         if self.cv_data_manager:
             self._initialize_cv_database()
@@ -49,67 +128,431 @@ class SearchController:
             print("CV Data Manager not available - using empty database")
             
     def _initialize_cv_database(self):
+        self.substring_index = None
+        self.live_state = {}
         try:
             print("Initializing CV database from database...")
             self.cv_database = self.cv_data_manager.get_cv_database_for_search(use_regex=False)
             print(f"SearchController initialized with {len(self.cv_database)} CVs from database")
+            self.corpus_stats = corpus_statistics(self.cv_database)
+            
+            if self.cv_database and PositionalIndex:
+                self.positional_index = PositionalIndex.from_cv_database(self.cv_database)
+                print(f"Built positional index over {len(self.positional_index.postings)} terms")
+            
+            if self.cv_database and QGramIndex:
+                if self.positional_index:
+                    self.qgram_index = QGramIndex.from_terms(self.positional_index.vocabulary())
+                else:
+                    self.qgram_index = QGramIndex.from_cv_database(self.cv_database)
+                print(f"Built q-gram index over {len(self.qgram_index)} vocabulary terms")
+            
+            if self.cv_database and self.parallel_workers:
+                self.enable_parallel_search(self.parallel_workers)
             
             if self.cv_database:
-                detail_ids = [int(cv_id.split('_')[1]) for cv_id in self.cv_database.keys()]
-                self.applicant_data_cache = self.cv_data_manager.get_applicant_data(detail_ids)
-                print(f"Loaded applicant data for {len(self.applicant_data_cache)} applicants")
+                # dibaca streaming per chunk dan tetap terenkripsi sampai ditampilkan
+                detail_ids = {int(cv_id.split('_')[1]) for cv_id in self.cv_database.keys()}
+                loaded = self.cv_data_manager.load_encrypted_applicants(detail_ids)
+                print(f"Loaded encrypted applicant data for {loaded} applicants")
             
         except Exception as e:
             print(f"Error initializing database: {e}")
             self.cv_database = {}
-            self.applicant_data_cache = {}
+            self.qgram_index = None
+            self.positional_index = None
     
-    def search_cvs(self, keywords_str, algorithm="KMP", top_n=5):
+    def search_cvs(self, keywords_str, algorithm="KMP", top_n=5, cancel_token=None, ranking=RANKING_COUNT):
+        if is_structured_query and is_structured_query(keywords_str):
+            try:
+                return self.search_query(keywords_str, top_n, ranking)
+            except QuerySyntaxError as e:
+                # query belum lengkap (mis. "python AND") dilaporkan ke UI lewat summary["error"]
+                result = self.create_empty_result()
+                result["summary"]["error"] = f"Invalid query: {e}"
+                return result
+        
         keywords = self.parse_keywords(keywords_str)
         
         if not keywords or not self.cv_database:
             return self.create_empty_result()
         
+        if ranking == RANKING_BM25:
+            return self.search_bm25(keywords, top_n)
+        
         results = []
         main_time_ms = None
         leven_time_ms = None
+        leven_stats = {}
         
         main_start = time.time()
         
-        if algorithm == "KMP" and search_cvs_with_kmp:
-            results = search_cvs_with_kmp(self.cv_database, keywords, top_n)
-        elif algorithm == "BM" and search_cvs_boyer_moore:
-            results = search_cvs_boyer_moore(self.cv_database, keywords, top_n)
-        elif algorithm == "Aho-Corasick" and search_cvs_with_aho_corasick:
-            results = search_cvs_with_aho_corasick(self.cv_database, keywords, top_n)
-        elif algorithm == "Levenshtein" and search_cvs_with_levenshtein:
-            results = search_cvs_with_levenshtein(self.cv_database, keywords, top_n)
-        else:
-            if search_cvs_with_kmp:
-                results = search_cvs_with_kmp(self.cv_database, keywords, top_n)
-                algorithm = "KMP (fallback)"
-            else:
-                return self.create_empty_result()
+        results, algorithm_used = self._run_main_search(algorithm, keywords, top_n, leven_stats, cancel_token)
+        if results is None:
+            return self.create_empty_result()
 
         main_time_ms = round((time.time() - main_start) * 1000, 2)
 
-        if len(results) < top_n and algorithm != "Levenshtein" and search_cvs_with_levenshtein:
-            print(f"Insufficient results ({len(results)}/{top_n}) with {algorithm}, using Levenshtein to supplement...")
-            leven_start = time.time()
-            leven_results = search_cvs_with_levenshtein(self.cv_database, keywords, top_n)
-            leven_time_ms = round((time.time() - leven_start) * 1000, 2)
+        if len(results) < top_n and algorithm != "Levenshtein" and iter_levenshtein_results:
+            results, algorithm_used, leven_time_ms = self._run_levenshtein_fallback(
+                results, keywords, top_n, algorithm_used, leven_stats, cancel_token
+            )
+
+        return self.format_results_for_ui(results, main_time_ms, algorithm_used, levenshtein_time_ms=leven_time_ms,
+                                          levenshtein_stats=leven_stats)
 
-            existing_ids = {r["cv_id"] for r in results}
-            for res in leven_results:
-                if res["cv_id"] not in existing_ids:
-                    results.append(res)
-                    existing_ids.add(res["cv_id"])
-                    if len(results) >= top_n:
-                        break
+    def search_query(self, query_str, top_n=5, ranking=RANKING_COUNT):
+        # query boolean/phrase dijawab dari positional index, tanpa memindai teks CV
+        if not self.positional_index:
+            return self.create_empty_result()
+        
+        bm25 = ranking == RANKING_BM25
+        start = time.time()
+        results = search_cvs_with_query(self.positional_index, query_str, top_n, bm25)
+        search_time_ms = round((time.time() - start) * 1000, 2)
+        
+        label = "Query + BM25 (positional index)" if bm25 else "Query (positional index)"
+        return self.format_results_for_ui(results, search_time_ms, label)
 
-            algorithm += " + Levenshtein"
+    def search_bm25(self, keywords, top_n=5):
+        # keyword dicocokkan per token (bukan substring), skor dari statistik korpus di index
+        if not self.positional_index or not search_cvs_with_bm25:
+            return self.create_empty_result()
+        
+        start = time.time()
+        results = search_cvs_with_bm25(self.positional_index, keywords, top_n)
+        search_time_ms = round((time.time() - start) * 1000, 2)
+        
+        return self.format_results_for_ui(results, search_time_ms, "BM25 (positional index)")
 
-        return self.format_results_for_ui(results, main_time_ms, algorithm, levenshtein_time_ms=leven_time_ms)
+    def iter_search_cvs(self, keywords_str, algorithm="KMP", top_n=5, cancel_token=None, batch_size=STREAM_BATCH_SIZE,
+                        ranking=RANKING_COUNT):
+        '''
+        Versi streaming dari search_cvs: CV dipindai per batch (atau per shard jika pencarian
+        paralel aktif) dan setiap batch menghasilkan snapshot top-k sementara dengan format
+        yang sama seperti search_cvs (summary["provisional"] = True). Snapshot terakhir
+        adalah hasil final, termasuk fallback Levenshtein jika hasil exact kurang.
+        '''
+        if (is_structured_query and is_structured_query(keywords_str)) or ranking == RANKING_BM25:
+            # dijawab dari index tanpa pemindaian, tidak ada snapshot sementara
+            yield self.search_cvs(keywords_str, algorithm, top_n, cancel_token, ranking)
+            return
+        
+        keywords = self.parse_keywords(keywords_str)
+        
+        if not keywords or not self.cv_database:
+            yield self.create_empty_result()
+            return
+        
+        leven_time_ms = None
+        leven_stats = {}
+        results = []
+        algorithm_used = algorithm
+        scanned = 0
+        
+        main_start = time.time()
+        
+        for batch_results, batch_count, algorithm_used in self._iter_main_search(
+                algorithm, keywords, top_n, leven_stats, cancel_token, batch_size):
+            scanned += batch_count
+            if cancel_token is not None:
+                cancel_token.checkpoint(scanned, len(self.cv_database))
+            # hasil lama didahulukan agar urutan skor yang sama tetap seperti pencarian sekuensial
+            results = heapq.nlargest(top_n, chain(results, batch_results), key=lambda r: r["total_score"])
+            elapsed_ms = round((time.time() - main_start) * 1000, 2)
+            yield self.format_results_for_ui(results, elapsed_ms, algorithm_used, cvs_scanned=scanned)
+        
+        main_time_ms = round((time.time() - main_start) * 1000, 2)
+        
+        if len(results) < top_n and algorithm != "Levenshtein" and iter_levenshtein_results:
+            results, algorithm_used, leven_time_ms = self._run_levenshtein_fallback(
+                results, keywords, top_n, algorithm_used, leven_stats, cancel_token
+            )
+        
+        yield self.format_results_for_ui(results, main_time_ms, algorithm_used, levenshtein_time_ms=leven_time_ms,
+                                         levenshtein_stats=leven_stats)
+
+    def live_search(self, keywords_str, algorithm="KMP", top_n=5, cancel_token=None, ranking=RANKING_COUNT):
+        '''
+        Pencarian untuk mode search-as-you-type. Keyword tanpa spasi dijawab langsung dari
+        SubstringIndex (lookup prefix pada suffix vocabulary) tanpa memindai teks. Jika ada
+        keyword berspasi, algoritma exact dijalankan hanya pada CV kandidat. Jika sebuah
+        keyword hanya bertambah panjang dari keystroke sebelumnya, range suffix dan himpunan
+        CV-nya dipersempit dari hasil sebelumnya. Fallback Levenshtein tidak dijalankan agar
+        setiap keystroke tetap murah.
+        '''
+        if is_structured_query and is_structured_query(keywords_str):
+            # query yang belum lengkap saat diketik (mis. kurung belum ditutup) diabaikan
+            try:
+                return self.search_query(keywords_str, top_n, ranking)
+            except QuerySyntaxError:
+                return self.create_empty_result()
+        
+        if ranking == RANKING_BM25:
+            return self.search_cvs(keywords_str, algorithm, top_n, cancel_token, ranking)
+        
+        keywords = self.parse_keywords(keywords_str)
+        
+        if not keywords or not self.cv_database:
+            self.live_state = {}
+            return self.create_empty_result()
+        
+        if not SubstringIndex or algorithm == "Levenshtein":
+            return self.search_cvs(keywords_str, algorithm, top_n, cancel_token)
+        
+        main_start = time.time()
+        
+        if self.substring_index is None:
+            self.substring_index = SubstringIndex.from_cv_database(self.cv_database)
+            print(f"Built substring index over {len(self.substring_index)} tokens")
+        
+        live_state = {}
+        candidate_ids = set()
+        for keyword in keywords:
+            keyword_lower = keyword.lower()
+            previous = self._find_live_prefix(keyword_lower)
+            
+            if SubstringIndex.supports(keyword_lower):
+                lo, hi = previous["range"] if previous and previous["range"] else (0, None)
+                suffix_range = self.substring_index.prefix_range(keyword_lower, lo, hi)
+                cv_ids = self.substring_index.cv_ids_in_range(suffix_range)
+            else:
+                # keyword berisi spasi: subset dari hasil keyword sebelumnya jika ada
+                suffix_range = None
+                cv_ids = set(previous["cv_ids"]) if previous else set(self.cv_database)
+            
+            live_state[keyword_lower] = {"range": suffix_range, "cv_ids": cv_ids}
+            candidate_ids |= cv_ids
+        
+        self.live_state = live_state
+        
+        search_fn, algorithm_used = self._resolve_engine(algorithm, {}, keywords)
+        if search_fn is None:
+            return self.create_empty_result()
+        
+        if all(state["range"] for state in live_state.values()):
+            suffix_ranges = {keyword: state["range"] for keyword, state in live_state.items()}
+            results = search_cvs_with_substring_index(self.substring_index, keywords, top_n, suffix_ranges)
+            main_time_ms = round((time.time() - main_start) * 1000, 2)
+            return self.format_results_for_ui(results, main_time_ms, f"{algorithm_used} (live, indexed)")
+        
+        candidates = {cv_id: content for cv_id, content in self.cv_database.items() if cv_id in candidate_ids}
+        results = search_fn(candidates, keywords, top_n, cancel_token)
+        main_time_ms = round((time.time() - main_start) * 1000, 2)
+        
+        return self.format_results_for_ui(results, main_time_ms, f"{algorithm_used} (live)")
+
+    def iter_batch_search(self, requisitions, top_n=5, ranking=RANKING_COUNT, cancel_token=None):
+        '''
+        Pencarian banyak requisition (nama -> string keyword) dalam satu kali jalan.
+        Requisition keyword biasa dikompilasi menjadi satu automaton Aho-Corasick dan korpus
+        dipindai sekali; query terstruktur dan ranking BM25 dijawab per requisition dari
+        positional index tanpa pemindaian. Yield (nama, hasil detail) sesuai urutan input.
+        Fallback Levenshtein tidak dijalankan pada mode batch.
+        '''
+        if not self.cv_database:
+            for name in requisitions:
+                yield name, []
+            return
+        
+        indexed = {}
+        scanned = {}
+        for name, keywords_str in requisitions.items():
+            if (is_structured_query and is_structured_query(keywords_str)) or ranking == RANKING_BM25:
+                indexed[name] = keywords_str
+            else:
+                scanned[name] = self.parse_keywords(keywords_str)
+        
+        if scanned and not batch_search_with_aho_corasick:
+            raise RuntimeError("Aho-Corasick algorithm is not available for batch search")
+        if indexed and not self.positional_index:
+            raise RuntimeError("Positional index is not available for structured or BM25 batch search")
+        
+        scanned_results = {}
+        if scanned:
+            start = time.time()
+            scanned_results = batch_search_with_aho_corasick(self.cv_database, scanned, top_n, cancel_token)
+            print(f"Batch scan of {len(scanned)} requisitions over {len(self.cv_database)} CVs "
+                  f"took {round((time.time() - start) * 1000, 2)}ms", file=sys.stderr)
+        
+        bm25 = ranking == RANKING_BM25
+        for name in requisitions:
+            if name in scanned_results:
+                yield name, scanned_results[name]
+            elif is_structured_query and is_structured_query(indexed[name]):
+                yield name, search_cvs_with_query(self.positional_index, indexed[name], top_n, bm25)
+            else:
+                yield name, search_cvs_with_bm25(self.positional_index, self.parse_keywords(indexed[name]), top_n)
+
+    def _find_live_prefix(self, keyword_lower):
+        # keyword dari keystroke sebelumnya yang merupakan prefix terpanjang keyword sekarang
+        best = None
+        for previous_keyword, state in self.live_state.items():
+            if keyword_lower.startswith(previous_keyword):
+                if best is None or len(previous_keyword) > len(best[0]):
+                    best = (previous_keyword, state)
+        return best[1] if best else None
+
+    def _run_levenshtein_fallback(self, results, keywords, top_n, algorithm_used, leven_stats, cancel_token=None):
+        print(f"Insufficient results ({len(results)}/{top_n}) with {algorithm_used}, using Levenshtein to supplement...")
+        leven_start = time.time()
+        
+        # fuzzy hanya untuk CV yang belum cocok secara exact
+        existing_ids = {r["cv_id"] for r in results}
+        unmatched_cvs = {
+            cv_id: content for cv_id, content in self.cv_database.items()
+            if cv_id not in existing_ids
+        }
+        deadline = None
+        if self.fallback_budget_ms is not None:
+            deadline = leven_start + self.fallback_budget_ms / 1000
+        
+        # semua CV sisa diberi skor agar yang terbaik yang dipilih, bukan yang pertama ditemukan
+        needed = top_n - len(results)
+        if self.positional_index and levenshtein_results_from_index:
+            leven_results = levenshtein_results_from_index(self.positional_index, unmatched_cvs, keywords, needed,
+                                                           self.qgram_index, leven_stats, deadline, cancel_token)
+        else:
+            leven_results = heapq.nlargest(
+                needed,
+                iter_levenshtein_results(unmatched_cvs, keywords, self.qgram_index, leven_stats, deadline,
+                                         cancel_token),
+                key=lambda r: r["total_score"]
+            )
+        leven_time_ms = round((time.time() - leven_start) * 1000, 2)
+        leven_stats["cvs_total"] = len(unmatched_cvs)
+        
+        return results + leven_results, algorithm_used + " + Levenshtein", leven_time_ms
+
+    def _build_engine_registry(self):
+        engines = EngineRegistry()
+        if search_cvs_with_kmp:
+            engines.register(SearchEngine("KMP", search_cvs_with_kmp, {EXACT}, kmp_cost_terms, KMP_COEFFICIENTS))
+        if search_cvs_boyer_moore:
+            engines.register(SearchEngine("BM", search_cvs_boyer_moore, {EXACT},
+                                          boyer_moore_cost_terms, BOYER_MOORE_COEFFICIENTS))
+        if search_cvs_with_aho_corasick:
+            engines.register(SearchEngine("Aho-Corasick", search_cvs_with_aho_corasick, {EXACT, MULTI_PATTERN},
+                                          aho_corasick_cost_terms, AHO_CORASICK_COEFFICIENTS))
+        if search_cvs_with_levenshtein:
+            engines.register(SearchEngine("Levenshtein", search_cvs_with_levenshtein, {FUZZY}))
+        return engines
+
+    def _plan_algorithm(self, algorithm, keywords):
+        # "Auto" diganti engine exact termurah; mengembalikan (nama engine, label, estimasi per engine)
+        if algorithm != AUTO_ALGORITHM:
+            return algorithm, algorithm, None
+        engine, features, estimates = self.engines.plan(keywords, self.corpus_stats)
+        if engine is None:
+            return "KMP", "KMP (fallback)", None
+        print(f"Auto planner chose {engine.name}: " +
+              ", ".join(f"{name}~{ms:.1f}ms" for name, ms in sorted(estimates.items(), key=lambda x: x[1])))
+        return engine.name, f"Auto: {engine.name}", estimates
+
+    def _resolve_engine(self, algorithm, leven_stats, keywords=None, pass_cache=None):
+        # fungsi pencarian (cv_database, keywords, top_n, cancel_token) beserta label algoritmanya
+        algorithm, label, _ = self._plan_algorithm(algorithm, keywords or [])
+        engine = self.engines.get(algorithm)
+        if engine is not None and engine.has(FUZZY):
+            def search_fn(cv_database, keywords, top_n, cancel_token=None):
+                return engine.search_fn(cv_database, keywords, top_n, self.qgram_index, leven_stats, cancel_token,
+                                        pass_cache)
+            return search_fn, label
+        elif engine is not None:
+            return engine.search_fn, label
+        elif self.engines.get("KMP"):
+            return self.engines.get("KMP").search_fn, "KMP (fallback)"
+        return None, algorithm
+
+    def _record_engine_timing(self, algorithm, keywords, measured_ms, auto, estimates=None):
+        # waktu terukur dicatat agar cost model bisa dikalibrasi ulang (EngineRegistry.recalibrate)
+        features = query_features(self.corpus_stats, keywords)
+        self.engines.record(algorithm, features, measured_ms, auto, estimates)
+
+    def _run_main_search(self, algorithm, keywords, top_n, leven_stats, cancel_token=None):
+        requested = algorithm
+        algorithm, label, estimates = self._plan_algorithm(algorithm, keywords)
+        start = time.time()
+        
+        results = None
+        if self.parallel_searcher and self.parallel_searcher.supports(algorithm):
+            try:
+                results = self.parallel_searcher.search(algorithm, keywords, top_n, cancel_token)
+                algorithm_used = f"{label} (parallel x{self.parallel_searcher.processes})"
+            except SearchCancelled:
+                raise
+            except Exception as e:
+                print(f"Parallel search failed, falling back to single process: {e}")
+        
+        if results is None:
+            search_fn, algorithm_used = self._resolve_engine(algorithm, leven_stats)
+            if search_fn is None:
+                return None, algorithm_used
+            if algorithm_used == algorithm:
+                algorithm_used = label
+            results = search_fn(self.cv_database, keywords, top_n, cancel_token)
+            # waktu paralel tidak sebanding dengan cost model satu proses, jadi tidak dicatat
+            self._record_engine_timing(algorithm, keywords, round((time.time() - start) * 1000, 2),
+                                       requested == AUTO_ALGORITHM, estimates)
+        return results, algorithm_used
+
+    def _iter_main_search(self, algorithm, keywords, top_n, leven_stats, cancel_token, batch_size):
+        requested = algorithm
+        algorithm, label, estimates = self._plan_algorithm(algorithm, keywords)
+        
+        if self.parallel_searcher and self.parallel_searcher.supports(algorithm):
+            label = f"{label} (parallel x{self.parallel_searcher.processes})"
+            for shard_results, shard_size in self.parallel_searcher.iter_search(algorithm, keywords, top_n,
+                                                                                cancel_token, batch_size):
+                yield shard_results, shard_size, label
+            return
+        
+        engine = self.engines.get(algorithm)
+        pass_cache = None
+        engine_ms = 0.0
+        if engine is not None and engine.has(FUZZY) and build_pass_cache:
+            # pass_cache dan kandidat q-gram dibangun sekali per query lalu dipakai semua batch
+            start = time.time()
+            pass_cache = build_pass_cache(keywords, self.qgram_index, leven_stats, cancel_token=cancel_token)
+            engine_ms += (time.time() - start) * 1000
+        
+        search_fn, algorithm_used = self._resolve_engine(algorithm, leven_stats, pass_cache=pass_cache)
+        if search_fn is None:
+            return
+        if algorithm_used == algorithm:
+            algorithm_used = label
+        
+        scanned = 0
+        cv_items = iter(self.cv_database.items())
+        while True:
+            batch = dict(islice(cv_items, batch_size))
+            if not batch:
+                break
+            batch_token = None
+            if cancel_token is not None:
+                batch_token = BatchCancellationToken(cancel_token, scanned, len(self.cv_database))
+            start = time.time()
+            batch_results = search_fn(batch, keywords, top_n, batch_token)
+            engine_ms += (time.time() - start) * 1000
+            scanned += len(batch)
+            yield batch_results, len(batch), algorithm_used
+        
+        self._record_engine_timing(algorithm, keywords, round(engine_ms, 2), requested == AUTO_ALGORITHM, estimates)
+
+    def enable_parallel_search(self, processes=None):
+        if not ParallelSearcher or not self.cv_database:
+            return
+        self.disable_parallel_search()
+        try:
+            self.parallel_searcher = ParallelSearcher(self.cv_database, processes, self.qgram_index)
+        except Exception as e:
+            print(f"Could not start parallel search: {e}")
+            self.parallel_searcher = None
+
+    def disable_parallel_search(self):
+        if self.parallel_searcher:
+            self.parallel_searcher.close()
+            self.parallel_searcher = None
 
     
     def parse_keywords(self, keywords_str):
@@ -125,12 +568,14 @@ class SearchController:
         # print(f"Parsed keywords: {keywords}")
         return keywords
     
-    def format_results_for_ui(self, search_results, search_time_ms, algorithm, levenshtein_time_ms=None):
+    def format_results_for_ui(self, search_results, search_time_ms, algorithm, levenshtein_time_ms=None, levenshtein_stats=None,
+                              cvs_scanned=None):
         ui_results = []
+        cv_names = self.get_applicant_names([result["cv_id"] for result in search_results])
 
         for result in search_results:
             cv_id = result["cv_id"]
-            cv_name = self.get_applicant_name_from_database(cv_id)
+            cv_name = cv_names[cv_id]
             
             matched_keywords_formatted = [
                 f"• {match_info['keyword']} ({match_info['count']})"
@@ -140,12 +585,16 @@ class SearchController:
             ui_result = {
                 "cv_id": cv_id,
                 "name": cv_name,
-                "total_matches": result["total_score"],
+                "total_matches": result.get("match_count", result["total_score"]),
                 "matched_keywords": matched_keywords_formatted,
                 "match_details": result["matches"],
                 "positions": result["keyword_positions"]
             }
             
+            if "match_count" in result:
+                # ranking BM25: total_score adalah skor relevansi, bukan jumlah kemunculan
+                ui_result["score"] = result["total_score"]
+            
             ui_results.append(ui_result)
 
         total_cvs = len(self.cv_database)
@@ -168,29 +617,51 @@ class SearchController:
         if levenshtein_time_ms is not None:
             formatted_response["timing"]["levenshtein_time_ms"] = levenshtein_time_ms
 
+        if cvs_scanned is not None:
+            # snapshot sementara dari iter_search_cvs, tidak perlu dicetak ke console
+            formatted_response["summary"]["provisional"] = True
+            formatted_response["summary"]["cvs_scanned"] = cvs_scanned
+            return formatted_response
+
+        pruning_ratio = None
+        if levenshtein_stats and levenshtein_stats.get("candidates"):
+            pruning_ratio = round(1 - levenshtein_stats["survivors"] / levenshtein_stats["candidates"], 4)
+            formatted_response["timing"]["qgram_pruning_ratio"] = pruning_ratio
+
         print(f"Search completed: {cvs_with_matches}/{total_cvs} CVs matched in {search_time_ms}ms using {algorithm}")
         if levenshtein_time_ms is not None:
             print(f"Levenshtein additional time: {levenshtein_time_ms}ms")
+        if pruning_ratio is not None:
+            print(f"q-gram filter pruned {pruning_ratio:.1%} of fuzzy candidates")
+        if levenshtein_stats and "cvs_total" in levenshtein_stats:
+            examined = levenshtein_stats.get("cvs_examined", 0)
+            formatted_response["timing"]["levenshtein_cvs_examined"] = examined
+            formatted_response["timing"]["levenshtein_budget_exhausted"] = levenshtein_stats.get("budget_exhausted", False)
+            print(f"Levenshtein examined {examined}/{levenshtein_stats['cvs_total']} unmatched CVs"
+                  f"{' (time budget exhausted)' if levenshtein_stats.get('budget_exhausted') else ''}")
 
         return formatted_response
 
     def get_applicant_name_from_database(self, cv_id):
+        return self.get_applicant_names([cv_id])[cv_id]
+    
+    def get_applicant_names(self, cv_ids):
+        # satu panggilan untuk semua kartu hasil: hanya nama yang ditampilkan yang didekripsi,
+        # dan applicant yang belum dimuat diambil dalam satu query batch
         try:
-            detail_id = int(cv_id.split('_')[1])
-            
-            if detail_id in self.applicant_data_cache:
-                return self.applicant_data_cache[detail_id]["name"]
+            detail_ids = {cv_id: int(cv_id.split('_')[1]) for cv_id in cv_ids}
+            applicant_data = {}
+            if self.cv_data_manager and detail_ids:
+                applicant_data = self.cv_data_manager.get_applicant_data(list(dict.fromkeys(detail_ids.values())))
             
-            if self.cv_data_manager:
-                applicant_data = self.cv_data_manager.get_applicant_data([detail_id])
-                if detail_id in applicant_data:
-                    return applicant_data[detail_id]["name"]
-            
-            return f"Applicant {detail_id}"
+            return {
+                cv_id: applicant_data[detail_id]["name"] if detail_id in applicant_data else f"Applicant {detail_id}"
+                for cv_id, detail_id in detail_ids.items()
+            }
             
         except Exception as e:
-            print(f"Error getting applicant name for {cv_id}: {e}")
-            return cv_id.replace('_', ' ').title()
+            print(f"Error getting applicant names for {cv_ids}: {e}")
+            return {cv_id: cv_id.replace('_', ' ').title() for cv_id in cv_ids}
     
     def create_empty_result(self):
         total_cvs = len(self.cv_database) if self.cv_database else 0
@@ -256,8 +727,97 @@ class SearchController:
     def refresh_database(self):
         print("Refreshing CV database...")
         if self.cv_data_manager:
+            previous = self.cv_database
             self.cv_data_manager.clear_cache()
+            if not previous or not self.positional_index:
+                self._initialize_cv_database()
+                return
+            new_ids = self._update_cv_database(previous)
+            if new_ids:
+                self.last_percolation = self.percolate_new_cvs(new_ids)
+    
+    def _update_cv_database(self, previous):
+        '''
+        Refresh inkremental: teks CV dimuat ulang, tetapi positional index dan q-gram index
+        hanya diperbarui untuk CV yang baru, berubah, atau dihapus. Mengembalikan cv_id CV
+        baru untuk dipercolate.
+        '''
+        self.substring_index = None
+        self.live_state = {}
+        try:
+            self.cv_database = self.cv_data_manager.get_cv_database_for_search(use_regex=False)
+            self.corpus_stats = corpus_statistics(self.cv_database)
+            
+            removed = [cv_id for cv_id in previous if cv_id not in self.cv_database]
+            changed = [cv_id for cv_id, content in self.cv_database.items() if previous.get(cv_id) != content]
+            for cv_id in removed:
+                self.positional_index.remove_document(cv_id)
+            for cv_id in changed:
+                self.positional_index.add_document(cv_id, self.cv_database[cv_id])
+                if self.qgram_index:
+                    for term in self.positional_index.doc_terms[cv_id]:
+                        self.qgram_index.add_term(term)
+            
+            new_ids = [cv_id for cv_id in changed if cv_id not in previous]
+            print(f"Updated positional index: {len(new_ids)} added, {len(changed) - len(new_ids)} changed, "
+                  f"{len(removed)} removed")
+            
+            if self.parallel_workers:
+                self.enable_parallel_search(self.parallel_workers)
+            
+            detail_ids = {int(cv_id.split('_')[1]) for cv_id in self.cv_database.keys()}
+            loaded = self.cv_data_manager.load_encrypted_applicants(detail_ids)
+            print(f"Loaded encrypted applicant data for {loaded} applicants")
+            return new_ids
+            
+        except Exception as e:
+            print(f"Incremental refresh failed, rebuilding indexes: {e}")
             self._initialize_cv_database()
+            return []
+    
+    def _get_percolator(self):
+        # dibangun sekali dari SavedSearch, lalu diperbarui bersama save/delete
+        if self.percolator is None and Percolator and self.cv_data_manager:
+            self.percolator = Percolator.from_saved_searches(self.cv_data_manager.get_saved_searches())
+        return self.percolator
+    
+    def save_search(self, name, keywords_str, min_score=1):
+        # query terstruktur divalidasi sebelum disimpan; QuerySyntaxError diteruskan ke pemanggil
+        if is_structured_query and is_structured_query(keywords_str):
+            parse_query(keywords_str)
+        if not self.cv_data_manager:
+            return None
+        search_id = self.cv_data_manager.save_search(name, keywords_str, min_score)
+        percolator = self._get_percolator()
+        if search_id is not None and percolator is not None:
+            percolator.add_search(search_id, name, keywords_str, min_score)
+        return search_id
+    
+    def delete_saved_search(self, search_id):
+        if not self.cv_data_manager:
+            return False
+        deleted = self.cv_data_manager.delete_saved_search(search_id)
+        if deleted and self.percolator is not None:
+            self.percolator.remove_search(search_id)
+        return deleted
+    
+    def percolate_cv(self, cv_content):
+        percolator = self._get_percolator()
+        if not percolator:
+            return []
+        return percolator.percolate(cv_content)
+    
+    def percolate_new_cvs(self, cv_ids):
+        # setiap CV baru dipindai sekali terhadap semua saved search
+        start = time.time()
+        percolation = {}
+        for cv_id in cv_ids:
+            matched = self.percolate_cv(self.cv_database.get(cv_id, ""))
+            if matched:
+                percolation[cv_id] = matched
+        print(f"Percolated {len(cv_ids)} new CVs against {len(self.percolator or [])} saved searches "
+              f"in {round((time.time() - start) * 1000, 2)}ms: {len(percolation)} matched")
+        return percolation
     
     def get_cv_summary_by_id(self, cv_id):
         try:
@@ -270,11 +830,12 @@ class SearchController:
     def get_search_statistics(self):
         return {
             "total_cvs": len(self.cv_database),
-            "cached_applicants": len(self.applicant_data_cache),
+            "cached_applicants": len(self.cv_data_manager.applicant_cache) if self.cv_data_manager else 0,
             "available_algorithms": {
                 "KMP": search_cvs_with_kmp is not None,
                 "Boyer-Moore": search_cvs_boyer_moore is not None,
                 "Aho-Corasick": search_cvs_with_aho_corasick is not None,
-                "Levenshtein": search_cvs_with_levenshtein is not None
+                "Levenshtein": search_cvs_with_levenshtein is not None,
+                AUTO_ALGORITHM: bool(self.engines.names())
             }
         }
\ No newline at end of file
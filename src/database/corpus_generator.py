@@ -0,0 +1,331 @@
+'''
+Generator korpus sintetis untuk uji skala ingest, indexing, dan pencarian.
+
+Membuat N ApplicantProfile, N teks CV, dan satu ApplicationDetail per CV. Kategori CV
+diambil dari folder di data/ dengan proporsi sesuai jumlah PDF-nya, dan struktur section
+meniru CV asli (judul, Summary, Skills/Highlights, Experience, Education, Accomplishments)
+sehingga regex summary dan pencarian berperilaku sama. Teks disimpan langsung ke CVText,
+atau ditulis sebagai PDF dengan --pdf agar jalur ekstraksi ikut terukur.
+
+Contoh (dari root project):
+    python src/database/corpus_generator.py --count 100000 --seed 42
+    python src/database/corpus_generator.py --count 10000 --seed 42 --pdf
+'''
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import argparse
+import hashlib
+import random
+import time
+
+from faker import Faker
+from db_setup import get_db_connection
+from seeder import (BULK_BATCH_SIZE, DATA_ROOT, applicant_profile_rows, bulk_load, clean_db,
+                    fake, report_throughput)
+from controller.extractor import EXTRACTOR_VERSION, fitz, normalize_text
+
+SYNTHETIC_DIR = "synthetic"   # subfolder data/ untuk cv_path (dan PDF) sintetis
+SENTENCE_POOL_SIZE = 3000
+COMPANY_POOL_SIZE = 1000
+PDF_LINES_PER_PAGE = 60
+
+# kategori -> (jabatan, skill inti terurut dari yang paling umum)
+CATEGORY_PROFILES = {
+    "ACCOUNTANT": (["Accountant", "Senior Accountant", "Staff Accountant"],
+                   ["Accounts Payable", "Accounts Receivable", "General Ledger", "Reconciliation", "QuickBooks",
+                    "Financial Reporting", "Payroll", "Tax Preparation", "GAAP", "Auditing", "Budgeting"]),
+    "ADVOCATE": (["Advocate", "Legal Advocate", "Patient Advocate"],
+                 ["Case Management", "Legal Research", "Client Advocacy", "Crisis Intervention", "Mediation",
+                  "Documentation", "Litigation Support", "Counseling", "Compliance", "Negotiation"]),
+    "AGRICULTURE": (["Agriculture Specialist", "Farm Manager", "Agronomist"],
+                    ["Crop Management", "Soil Analysis", "Irrigation", "Pest Control", "Harvesting",
+                     "Livestock Care", "Farm Equipment", "Sustainability", "Inventory Control", "GIS"]),
+    "APPAREL": (["Apparel Designer", "Merchandiser", "Production Coordinator"],
+                ["Merchandising", "Textiles", "Visual Merchandising", "Retail Sales", "Trend Analysis",
+                 "Sourcing", "Pattern Making", "Quality Control", "Inventory Control", "Adobe Illustrator"]),
+    "ARTS": (["Art Director", "Artist", "Arts Coordinator"],
+             ["Illustration", "Painting", "Adobe Photoshop", "Event Planning", "Curriculum Development",
+              "Photography", "Art History", "Exhibition Design", "Grant Writing", "Sculpture"]),
+    "AUTOMOBILE": (["Automotive Technician", "Service Advisor", "Automotive Engineer"],
+                   ["Diagnostics", "Engine Repair", "Brake Systems", "Preventive Maintenance", "Electrical Systems",
+                    "AutoCAD", "Customer Service", "Parts Inventory", "Welding", "Safety Inspection"]),
+    "AVIATION": (["Aviation Technician", "Flight Operations Officer", "Aircraft Mechanic"],
+                 ["Aircraft Maintenance", "FAA Regulations", "Flight Planning", "Avionics", "Safety Management",
+                  "Ground Operations", "Inspection", "Troubleshooting", "Logistics", "Technical Documentation"]),
+    "BANKING": (["Banking Officer", "Personal Banker", "Branch Manager"],
+                ["Customer Service", "Cash Handling", "Loan Processing", "Credit Analysis", "Compliance",
+                 "Sales", "Risk Management", "Account Management", "Anti Money Laundering", "Microsoft Excel"]),
+    "BPO": (["BPO Associate", "Call Center Agent", "Team Leader"],
+            ["Customer Service", "Call Handling", "CRM", "Data Entry", "Quality Assurance",
+             "Escalation Management", "Typing", "Communication", "Salesforce", "Reporting"]),
+    "BUSINESS-DEVELOPMENT": (["Business Development Manager", "Business Development Executive", "Account Executive"],
+                             ["Lead Generation", "Sales", "Negotiation", "Market Research", "CRM",
+                              "Strategic Planning", "Partnerships", "Proposal Writing", "Salesforce", "Forecasting"]),
+    "CHEF": (["Chef", "Sous Chef", "Line Cook"],
+             ["Food Preparation", "Menu Planning", "Sanitation", "Kitchen Management", "Catering",
+              "Inventory Control", "Food Safety", "Baking", "Plate Presentation", "Cost Control"]),
+    "CONSTRUCTION": (["Construction Manager", "Site Supervisor", "Project Engineer"],
+                     ["Project Management", "Blueprint Reading", "Scheduling", "OSHA", "Estimating",
+                      "Subcontractor Management", "AutoCAD", "Quality Control", "Budgeting", "Safety Inspection"]),
+    "CONSULTANT": (["Consultant", "Senior Consultant", "Management Consultant"],
+                   ["Business Analysis", "Process Improvement", "Stakeholder Management", "Project Management",
+                    "Data Analysis", "Change Management", "SAP", "Microsoft Excel", "PowerPoint", "Strategy"]),
+    "DESIGNER": (["Designer", "Graphic Designer", "UX Designer"],
+                 ["Adobe Photoshop", "Adobe Illustrator", "Figma", "Typography", "Branding",
+                  "Sketch", "User Research", "Prototyping", "InDesign", "HTML"]),
+    "DIGITAL-MEDIA": (["Digital Media Specialist", "Content Producer", "Social Media Manager"],
+                      ["Social Media", "Content Creation", "Video Editing", "SEO", "Google Analytics",
+                       "Copywriting", "Adobe Premiere", "Photography", "Email Marketing", "WordPress"]),
+    "ENGINEERING": (["Engineer", "Mechanical Engineer", "Project Engineer"],
+                    ["AutoCAD", "SolidWorks", "MATLAB", "Project Management", "Root Cause Analysis",
+                     "Quality Control", "Python", "Technical Documentation", "Testing", "Lean Manufacturing"]),
+    "FINANCE": (["Financial Analyst", "Finance Manager", "Financial Planner"],
+                ["Financial Analysis", "Forecasting", "Budgeting", "Microsoft Excel", "Financial Modeling",
+                 "Variance Analysis", "SAP", "Accounting", "Risk Management", "SQL"]),
+    "FITNESS": (["Fitness Trainer", "Personal Trainer", "Fitness Manager"],
+                ["Personal Training", "Nutrition", "Group Fitness", "CPR", "Strength Training",
+                 "Client Assessment", "Sales", "Customer Service", "Yoga", "Program Design"]),
+    "HEALTHCARE": (["Healthcare Administrator", "Registered Nurse", "Medical Assistant"],
+                   ["Patient Care", "Medical Terminology", "EMR", "HIPAA", "Scheduling",
+                    "Vital Signs", "Billing", "CPR", "Case Management", "Infection Control"]),
+    "HR": (["HR Generalist", "HR Manager", "Recruiter"],
+           ["Recruiting", "Onboarding", "Employee Relations", "Payroll", "Benefits Administration",
+            "HRIS", "Performance Management", "Training", "Compliance", "Workday"]),
+    "INFORMATION-TECHNOLOGY": (["Software Developer", "IT Specialist", "System Administrator"],
+                               ["Python", "Java", "SQL", "JavaScript", "Linux", "AWS", "Docker",
+                                "Git", "Networking", "React", "Kubernetes", "Windows Server"]),
+    "PUBLIC-RELATIONS": (["Public Relations Manager", "PR Specialist", "Communications Coordinator"],
+                         ["Media Relations", "Press Releases", "Crisis Communication", "Event Planning",
+                          "Social Media", "Copywriting", "Brand Management", "Public Speaking",
+                          "Content Strategy", "Stakeholder Engagement"]),
+    "SALES": (["Sales Associate", "Sales Manager", "Account Manager"],
+              ["Sales", "Customer Service", "Negotiation", "CRM", "Lead Generation",
+               "Cold Calling", "Retail Sales", "Salesforce", "Forecasting", "Product Knowledge"]),
+    "TEACHER": (["Teacher", "Elementary Teacher", "Substitute Teacher"],
+                ["Lesson Planning", "Classroom Management", "Curriculum Development", "Differentiated Instruction",
+                 "Student Assessment", "Special Education", "Microsoft Office", "Tutoring", "Parent Communication",
+                 "Educational Technology"]),
+}
+
+# skill lintas kategori, sama dengan pola di model/regex.py
+COMMON_SKILLS = ["Microsoft Excel", "Communication", "Project Management", "Team Leadership",
+                 "Problem Solving", "PowerPoint", "Word", "Outlook", "Time Management"]
+
+DUTY_TEMPLATES = [
+    "Managed {skill} for {n} clients and internal teams.",
+    "Applied {skill} to improve team efficiency by {p}%.",
+    "Led {skill} initiatives across {n} locations.",
+    "Trained {n} new staff members in {skill}.",
+    "Handled daily {skill} tasks with strict attention to detail.",
+    "Reduced costs by {p}% through better {skill}.",
+]
+
+DEGREES = ["Bachelor of Science", "Bachelor of Arts", "Master of Science", "Master of Business Administration",
+           "Associate Degree", "High School Diploma", "Certificate"]
+
+def category_weights() -> dict:
+    # proporsi kategori mengikuti jumlah PDF per folder di data/, seragam jika folder kosong
+    counts = {
+        category: sum(1 for _ in (DATA_ROOT / category).glob("*.pdf"))
+        for category in CATEGORY_PROFILES
+    }
+    if not any(counts.values()):
+        return dict.fromkeys(CATEGORY_PROFILES, 1)
+    return {category: count for category, count in counts.items() if count}
+
+class CVTextGenerator:
+    '''
+    Pembuat teks CV deterministik: CV ke-i selalu sama untuk seed yang sama, sehingga teks
+    bisa dibuat ulang saat detail_id-nya sudah diketahui tanpa menyimpan seluruh korpus
+    di memori. Kalimat dan nama perusahaan diambil dari pool Faker yang dibuat sekali.
+    '''
+    def __init__(self, seed: int):
+        self.seed = seed
+        weights = category_weights()
+        self.categories = list(weights)
+        self.category_weights = list(weights.values())
+        self.sentences = [fake.sentence(nb_words=12) for _ in range(SENTENCE_POOL_SIZE)]
+        self.companies = [fake.company() for _ in range(COMPANY_POOL_SIZE)]
+        self.cities = [f"{fake.city()} , {fake.state_abbr()}" for _ in range(COMPANY_POOL_SIZE)]
+        self.universities = [f"{fake.city()} University" for _ in range(COMPANY_POOL_SIZE)]
+
+    def _rng(self, i: int) -> random.Random:
+        return random.Random(f"{self.seed}-{i}")
+
+    def _skills(self, rng: random.Random, category: str) -> list:
+        # skill inti berbobot Zipf (1/peringkat), sesekali ditambah skill kategori lain
+        core = CATEGORY_PROFILES[category][1]
+        picked = rng.choices(core, weights=[1 / (rank + 1) for rank in range(len(core))], k=rng.randint(5, 10))
+        picked += rng.sample(COMMON_SKILLS, rng.randint(1, 3))
+        if rng.random() < 0.15:
+            other = CATEGORY_PROFILES[rng.choice(self.categories)][1]
+            picked += rng.sample(other, 2)
+        return list(dict.fromkeys(picked))
+
+    def _header(self, rng: random.Random) -> tuple:
+        category = rng.choices(self.categories, self.category_weights)[0]
+        return category, rng.choice(CATEGORY_PROFILES[category][0])
+
+    def header(self, i: int) -> tuple:
+        # (kategori, jabatan) CV ke-i tanpa membuat teksnya
+        return self._header(self._rng(i))
+
+    def generate(self, i: int) -> tuple:
+        '''(kategori, jabatan, teks CV berbaris seperti hasil ekstraksi PDF)'''
+        rng = self._rng(i)
+        category, title = self._header(rng)
+        titles = CATEGORY_PROFILES[category][0]
+        skills = self._skills(rng, category)
+
+        lines = [title.upper()]
+        if rng.random() < 0.9:
+            lines += ["Summary", f"{title} with {rng.randint(1, 20)}+ years of experience in {skills[0].lower()}."]
+            lines += rng.sample(self.sentences, rng.randint(1, 3))
+
+        lines.append("Skills" if rng.random() < 0.6 else "Highlights")
+        if rng.random() < 0.5:
+            lines.append(", ".join(skills))
+        else:
+            lines += skills
+
+        lines.append("Experience")
+        year = rng.randint(2000, 2018)
+        for _ in range(rng.randint(1, 4)):
+            end = year + rng.randint(1, 5)
+            lines.append(f"{rng.randint(1, 12):02d}/{year} - {rng.randint(1, 12):02d}/{end}")
+            lines.append(f"{rng.choice(self.companies)} {rng.choice(self.cities)} {rng.choice(titles)}")
+            for _ in range(rng.randint(2, 4)):
+                lines.append(rng.choice(DUTY_TEMPLATES).format(
+                    skill=rng.choice(skills).lower(), n=rng.randint(2, 50), p=rng.randint(5, 40)))
+            lines += rng.sample(self.sentences, rng.randint(0, 2))
+            year = end
+
+        lines.append("Education")
+        graduated = rng.randint(1990, 2015)
+        lines.append(f"{rng.choice(DEGREES)} : {category.replace('-', ' ').title()} , {graduated}")
+        lines.append(rng.choice(self.universities))
+
+        if rng.random() < 0.5:
+            lines.append("Accomplishments")
+            lines += rng.sample(self.sentences, rng.randint(1, 4))
+
+        return category, title, "\n".join(lines)
+
+    def cv_path(self, i: int, category: str) -> str:
+        return f"{DATA_ROOT.name}/{SYNTHETIC_DIR}/{category}/{i:07d}.pdf"
+
+def write_pdf(path: Path, text: str) -> int:
+    # satu halaman per PDF_LINES_PER_PAGE baris, mengembalikan jumlah halaman
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = text.split("\n")
+    doc = fitz.open()
+    for start in range(0, len(lines), PDF_LINES_PER_PAGE):
+        page = doc.new_page()
+        page.insert_text((50, 60), "\n".join(lines[start:start + PDF_LINES_PER_PAGE]), fontsize=9)
+    page_count = doc.page_count
+    doc.save(path)
+    doc.close()
+    return page_count
+
+def _max_id(table: str, column: str) -> int:
+    conn = get_db_connection()
+    if conn is None:
+        return 0
+    cur = conn.cursor()
+    cur.execute(f"SELECT COALESCE(MAX({column}), 0) FROM {table}")
+    max_id = cur.fetchone()[0]
+    cur.close()
+    conn.close()
+    return max_id
+
+def _ids_after(table: str, column: str, after_id: int) -> list:
+    conn = get_db_connection()
+    if conn is None:
+        return []
+    cur = conn.cursor()
+    cur.execute(f"SELECT {column} FROM {table} WHERE {column} > %s ORDER BY {column}", (after_id,))
+    ids = [row[0] for row in cur.fetchall()]
+    cur.close()
+    conn.close()
+    return ids
+
+def generate_corpus(count: int, seed: int, write_pdfs: bool = False,
+                    batch_size: int = BULK_BATCH_SIZE, use_load_data: bool = False) -> int:
+    '''
+    Menyisipkan count applicant, count ApplicationDetail (satu per applicant), lalu teks
+    CV-nya ke CVText, atau file PDF di data/synthetic/ jika write_pdfs=True.
+    Mengembalikan jumlah CV yang dibuat.
+    '''
+    if write_pdfs and fitz is None:
+        print("PyMuPDF is required for --pdf")
+        return 0
+
+    generator = CVTextGenerator(seed)
+    started = time.perf_counter()
+
+    last_applicant_id = _max_id("ApplicantProfile", "applicant_id")
+    bulk_load("ApplicantProfile",
+              ["first_name", "last_name", "date_of_birth", "address", "phone_number"],
+              applicant_profile_rows(count, batch_size), batch_size, use_load_data)
+    applicant_ids = _ids_after("ApplicantProfile", "applicant_id", last_applicant_id)[:count]
+
+    def detail_rows():
+        for i, applicant_id in enumerate(applicant_ids):
+            category, title = generator.header(i)
+            yield (applicant_id, title, generator.cv_path(i, category))
+
+    last_detail_id = _max_id("ApplicationDetail", "detail_id")
+    bulk_load("ApplicationDetail", ["applicant_id", "application_role", "cv_path"],
+              detail_rows(), batch_size, use_load_data)
+    detail_ids = _ids_after("ApplicationDetail", "detail_id", last_detail_id)
+
+    if write_pdfs:
+        pdf_started = time.perf_counter()
+        for i in range(len(detail_ids)):
+            category, _, text = generator.generate(i)
+            write_pdf(DATA_ROOT.parent / generator.cv_path(i, category), text)
+        report_throughput("PDF files", len(detail_ids), time.perf_counter() - pdf_started)
+    else:
+        def text_rows():
+            # file PDF tidak ada, sehingga get_cv_database_for_search langsung memakai teks ini
+            for i, detail_id in enumerate(detail_ids):
+                _, _, text = generator.generate(i)
+                fingerprint = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+                yield (detail_id, fingerprint, None, 1, EXTRACTOR_VERSION,
+                       normalize_text(text), normalize_text(text, use_regex=True))
+
+        # CVText selalu lewat executemany karena teksnya bisa berisi koma dan baris baru
+        bulk_load("CVText",
+                  ["detail_id", "fingerprint", "file_size", "page_count", "extractor_version",
+                   "plain_text", "regex_text"],
+                  text_rows(), batch_size)
+
+    report_throughput("Synthetic corpus", len(detail_ids), time.perf_counter() - started)
+    return len(detail_ids)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic CV corpus for scale testing")
+    parser.add_argument("--count", type=int, default=10000, help="number of applicants and CVs")
+    parser.add_argument("--seed", type=int, default=None, help="random seed, printed when omitted")
+    parser.add_argument("--pdf", action="store_true",
+                        help=f"write PDFs under data/{SYNTHETIC_DIR}/ instead of storing text in CVText")
+    parser.add_argument("--batch-size", type=int, default=BULK_BATCH_SIZE, help="rows per executemany and commit")
+    parser.add_argument("--load-data-infile", action="store_true",
+                        help="load profiles and applications with LOAD DATA LOCAL INFILE (MySQL)")
+    parser.add_argument("--keep", action="store_true", help="do not delete existing rows first")
+    args = parser.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 31)
+    print(f"Generating {args.count} CVs with seed {seed}")
+    Faker.seed(seed)
+    random.seed(seed)
+
+    if not args.keep:
+        clean_db()
+    generate_corpus(args.count, seed, args.pdf, args.batch_size, args.load_data_infile)
+
+if __name__ == "__main__":
+    main()
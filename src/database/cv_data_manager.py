@@ -1,154 +1,331 @@
 import sys
 import os
 from pathlib import Path
+from collections import OrderedDict
+import hashlib
 import re
+import threading
 
 current_dir = Path(__file__).resolve().parent
 project_root = current_dir.parent
 sys.path.insert(0, str(project_root))
 
 try:
-    from database.db_setup import get_db_connection
+    from database.db_setup import pooled_connection
 except ImportError:
     try:
         import database.db_setup as db_setup
-        get_db_connection = db_setup.get_db_connection
+        pooled_connection = db_setup.pooled_connection
     except ImportError:
         sys.path.insert(0, str(current_dir))
-        from db_setup import get_db_connection
+        from db_setup import pooled_connection
 
 try:
-    from controller.extractor import extract_cv_content_direct
+    from controller.extractor import EXTRACTOR_VERSION, extract_cv_content_direct, extract_cv_text_forms
 except ImportError:
     try:
         import controller.extractor as extractor
         extract_cv_content_direct = extractor.extract_cv_content_direct
+        extract_cv_text_forms = extractor.extract_cv_text_forms
+        EXTRACTOR_VERSION = extractor.EXTRACTOR_VERSION
     except ImportError:
+        EXTRACTOR_VERSION = "mock"
         def extract_cv_content_direct(pdf_path, use_regex=False):
             return f"Mock content from {pdf_path}"
+        def extract_cv_text_forms(pdf_path):
+            content = f"Mock content from {pdf_path}"
+            return {"plain": content, "regex": content, "page_count": 0}
         
 from model.encryptor import Encryptor
 from model.regex import extract_information_group, generate_summary, extract_education, extract_job_history, extract_skill
 
+# jumlah baris per fetchmany / jumlah detail_id per klausa IN saat memuat data applicant
+APPLICANT_CHUNK_SIZE = int(os.environ.get("SIGNHIRE_APPLICANT_CHUNK", "1000"))
+# jumlah maksimum data applicant terdekripsi yang disimpan di memori (LRU)
+APPLICANT_CACHE_SIZE = int(os.environ.get("SIGNHIRE_APPLICANT_CACHE", "512"))
+
+# jumlah baris CVText per executemany/commit saat menyimpan hasil ekstraksi
+CV_TEXT_BATCH_SIZE = int(os.environ.get("SIGNHIRE_CV_TEXT_BATCH", "100"))
+
+CV_PATH_QUERY = """
+    SELECT detail_id, cv_path
+    FROM ApplicationDetail
+"""
+
+CV_PATH_BY_ID_QUERY = """
+    SELECT cv_path
+    FROM ApplicationDetail
+    WHERE detail_id = %s
+"""
+
+APPLICANT_DATA_QUERY = """
+    SELECT ad.detail_id, first_name, last_name, date_of_birth, 
+           address, phone_number, application_role
+    FROM ApplicantProfile ap 
+    JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id
+"""
+
+def file_fingerprint(path: Path) -> tuple:
+    # (hash isi file, ukuran byte); hash isi tetap sama di semua workstation, berbeda dengan mtime
+    digest = hashlib.blake2b(digest_size=16)
+    size = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+            size += len(block)
+    return digest.hexdigest(), size
 
 class CVDataManager:
     def __init__(self):
         self.cv_cache = {} 
-        self.applicant_cache = {}  
+        self.applicant_cache = OrderedDict()   # detail_id -> data terdekripsi, LRU berukuran APPLICANT_CACHE_SIZE
+        # applicant_cache dipakai thread Tk dan thread executor pencarian sekaligus
+        self._applicant_cache_lock = threading.Lock()
+        self.encrypted_applicants = {}          # detail_id -> kolom applicant yang masih terenkripsi
         self.skills_cache = {}
         self.encryptor = Encryptor("SIGNHIRE")
+        self.cv_path_index = {}         # cv_id -> cv_path
+        self.cv_path_index_loaded = False
+        self.max_detail_id = 0
         
     def get_cv_paths(self) -> dict:
+        # index path di memori: dimuat penuh sekali, selanjutnya hanya baris baru yang dibaca
+        if self.cv_path_index_loaded:
+            self.refresh_cv_path_index()
+        else:
+            self._load_cv_paths()
+        return dict(self.cv_path_index)
+
+    def _load_cv_paths(self, after_detail_id: int = None) -> int:
         try:
-            conn = get_db_connection()
-            if not conn:
-                print("Database connection failed")
-                return {}
+            with pooled_connection() as conn:
+                if not conn:
+                    print("Database connection failed")
+                    return 0
+                    
+                cur = conn.cursor(prepared=True)
+                if after_detail_id is None:
+                    cur.execute(CV_PATH_QUERY)
+                else:
+                    cur.execute(f"{CV_PATH_QUERY} WHERE detail_id > %s", (after_detail_id,))
                 
-            cur = conn.cursor(prepared=True)
-            cur.execute("""
-                SELECT detail_id, cv_path
-                FROM ApplicationDetail
-            """)
+                result = cur.fetchall()
+                cur.close()
             
-            result = cur.fetchall()
+            if after_detail_id is None:
+                self.cv_path_index = {}
+                self.max_detail_id = 0
             
-            formatted_result = {}
             for row in result:
                 detail_id = row[0]
                 cv_path = row[1] 
-                formatted_result[f"cv_{detail_id}"] = cv_path
+                self.cv_path_index[f"cv_{detail_id}"] = cv_path
+                self.max_detail_id = max(self.max_detail_id, detail_id)
             
-            if cur:
-                cur.close()
-            if conn:
-                conn.close()
-                
-            print(f"Loaded {len(formatted_result)} CV paths from database")
-            return formatted_result
+            self.cv_path_index_loaded = True
+            print(f"Loaded {len(result)} CV paths from database")
+            return len(result)
             
         except Exception as e:
             print(f"Error getting CV paths: {e}")
-            return {}
+            return 0
 
-    def get_applicant_data(self, detail_ids: list) -> dict:
-        if not detail_ids:
-            return {}
+    def refresh_cv_path_index(self):
+        # baris baru diambil lewat detail_id > max; jika jumlah baris tidak cocok (ada yang dihapus), muat ulang
+        self._load_cv_paths(after_detail_id=self.max_detail_id)
+        try:
+            with pooled_connection() as conn:
+                if not conn:
+                    return
+                cur = conn.cursor(prepared=True)
+                cur.execute("SELECT COUNT(*) FROM ApplicationDetail")
+                row_count = cur.fetchone()[0]
+                cur.close()
             
+            if row_count != len(self.cv_path_index):
+                print("CV path index out of sync, reloading")
+                self._load_cv_paths()
+                
+        except Exception as e:
+            print(f"Error refreshing CV path index: {e}")
+
+    def get_cv_path(self, detail_id: int) -> str:
+        cv_id = f"cv_{detail_id}"
+        if cv_id in self.cv_path_index:
+            return self.cv_path_index[cv_id]
+        
         try:
-            placeholder = ','.join(['%s'] * len(detail_ids))
-            conn = get_db_connection()
-            if not conn:
-                print("Database connection failed")
-                return {}
+            with pooled_connection() as conn:
+                if not conn:
+                    print("Database connection failed")
+                    return None
+                    
+                cur = conn.cursor(prepared=True)
+                cur.execute(CV_PATH_BY_ID_QUERY, (detail_id,))
                 
-            cur = conn.cursor(prepared=True)
-            cur.execute(f"""
-                SELECT ad.detail_id, first_name, last_name, date_of_birth, 
-                       address, phone_number, application_role
-                FROM ApplicantProfile ap 
-                JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id
-                WHERE ad.detail_id IN ({placeholder})
-            """, detail_ids)
+                row = cur.fetchone()
+                cur.close()
             
-            result = cur.fetchall()
+            if row is None:
+                return None
             
-            formatted_result = {}
-            for row in result:
-                detail_id = row[0]
-                dob = row[3]
-                # dob_str = dob.strftime("%d %B %Y") if dob else "N/A"
-                
-                first_name = self.encryptor.decrypt(row[1]) if row[1] else ""
-                last_name = self.encryptor.decrypt(row[2]) if row[2] else ""
-                address = self.encryptor.decrypt(row[4]) if row[4] else ""
-                phone = self.encryptor.decrypt(row[5]) if row[5] else ""
-                role = row[6] if row[6] else ""  # applicant_role is not encrypted
-
-                formatted_result[detail_id] = {
-                    "name": f"{first_name} {last_name}".strip(),
-                    "date_of_birth": dob,
-                    "address": address,
-                    "phone_number": phone,
-                    "role": role
-                }
-            
-            if cur:
-                cur.close()
-            if conn:
-                conn.close()
-                
-            self.applicant_cache.update(formatted_result)
-            return formatted_result
+            self.cv_path_index[cv_id] = row[0]
+            return row[0]
             
         except Exception as e:
-            print(f"Error getting applicant data: {e}")
+            print(f"Error getting CV path for detail {detail_id}: {e}")
+            return None
+
+    def get_applicant_data(self, detail_ids: list) -> dict:
+        '''
+        Data applicant terdekripsi untuk detail_ids saja. Urutan sumber: cache terdekripsi,
+        record terenkripsi yang sudah dimuat (didekripsi saat ini), lalu satu query batch
+        untuk semua sisanya.
+        '''
+        if not detail_ids:
             return {}
+        
+        formatted_result = {}
+        to_decrypt = []
+        missing = []
+        with self._applicant_cache_lock:
+            for detail_id in detail_ids:
+                if detail_id in self.applicant_cache:
+                    self.applicant_cache.move_to_end(detail_id)
+                    formatted_result[detail_id] = self.applicant_cache[detail_id]
+                elif detail_id in self.encrypted_applicants:
+                    to_decrypt.append(detail_id)
+                else:
+                    missing.append(detail_id)
+        
+        if missing:
+            for detail_id, encrypted in self.iter_applicant_data(missing, decrypt=False):
+                self.encrypted_applicants[detail_id] = encrypted
+                to_decrypt.append(detail_id)
+        
+        formatted_result.update(self._decrypt_applicants(to_decrypt))
+        return formatted_result
 
-    def extract_cv_content(self, cv_path: str, use_regex: bool = False) -> str:
+    def load_encrypted_applicants(self, detail_ids: set = None) -> int:
+        # dimuat tanpa dekripsi; PII baru didekripsi saat kartu hasil atau summary membutuhkannya
+        for detail_id, encrypted in self.iter_applicant_data(decrypt=False):
+            if detail_ids is None or detail_id in detail_ids:
+                self.encrypted_applicants[detail_id] = encrypted
+        return len(self.encrypted_applicants)
+
+    def _decrypt_applicants(self, detail_ids: list) -> dict:
+        records = self._decrypt_records([self.encrypted_applicants[detail_id] for detail_id in detail_ids])
+        decrypted = dict(zip(detail_ids, records))
+        with self._applicant_cache_lock:
+            for detail_id, data in decrypted.items():
+                self.applicant_cache[detail_id] = data
+                self.applicant_cache.move_to_end(detail_id)
+                if len(self.applicant_cache) > APPLICANT_CACHE_SIZE:
+                    self.applicant_cache.popitem(last=False)
+        return decrypted
+
+    def iter_applicant_data(self, detail_ids: list = None, chunk_size: int = APPLICANT_CHUNK_SIZE,
+                            decrypt: bool = True):
+        '''
+        Yield (detail_id, data applicant) per baris begitu selesai didekripsi, atau kolom
+        mentahnya yang masih terenkripsi jika decrypt=False. Tanpa
+        detail_ids seluruh tabel dibaca dengan cursor unbuffered (server-side) per
+        fetchmany; dengan detail_ids query dipecah per chunk_size agar klausa IN tidak
+        membengkak. Memori dan ukuran query dibatasi chunk_size.
+        '''
+        if detail_ids is not None and not detail_ids:
+            return
+        
         try:
-            if not os.path.isabs(cv_path):
-                possible_roots = [
-                    project_root,
-                    project_root.parent,
-                    Path.cwd()
-                ]
+            with pooled_connection() as conn:
+                if not conn:
+                    print("Database connection failed")
+                    return
                 
-                full_path = None
-                for root in possible_roots:
-                    test_path = root / cv_path
-                    if test_path.exists():
-                        full_path = test_path
-                        break
+                if detail_ids is None:
+                    cur = conn.cursor(buffered=False)
+                    try:
+                        cur.execute(APPLICANT_DATA_QUERY)
+                        yield from self._iter_applicant_rows(cur, chunk_size, decrypt)
+                    finally:
+                        cur.close()
+                    return
                 
-                if full_path is None:
-                    print(f"CV file not found in any location: {cv_path}")
-                    return f"CV file not found: {cv_path}"
-            else:
-                full_path = Path(cv_path)
+                cur = conn.cursor(prepared=True)
+                try:
+                    for start in range(0, len(detail_ids), chunk_size):
+                        chunk = detail_ids[start:start + chunk_size]
+                        placeholder = ','.join(['%s'] * len(chunk))
+                        cur.execute(f"{APPLICANT_DATA_QUERY} WHERE ad.detail_id IN ({placeholder})", chunk)
+                        yield from self._iter_applicant_rows(cur, chunk_size, decrypt)
+                finally:
+                    cur.close()
+            
+        except Exception as e:
+            print(f"Error getting applicant data: {e}")
+
+    def _iter_applicant_rows(self, cur, chunk_size: int, decrypt: bool = True):
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                break
+            encrypted_records = [tuple(row[1:]) for row in rows]
+            if decrypt:
+                encrypted_records = self._decrypt_records(encrypted_records)
+            for row, record in zip(rows, encrypted_records):
+                yield row[0], record
+
+    def _decrypt_records(self, encrypted_records: list) -> list:
+        # (first_name, last_name, date_of_birth, address, phone_number, application_role)
+        # kolom terenkripsi semua record didekripsi sekaligus lewat decrypt_many
+        ciphertexts = [
+            field for encrypted in encrypted_records
+            for field in (encrypted[0], encrypted[1], encrypted[3], encrypted[4]) if field
+        ]
+        plaintexts = iter(self.encryptor.decrypt_many(ciphertexts))
+        
+        records = []
+        for encrypted in encrypted_records:
+            dob = encrypted[2]
+            # dob_str = dob.strftime("%d %B %Y") if dob else "N/A"
             
-            if not full_path.exists():
-                print(f"CV file not found: {full_path}")
+            first_name = next(plaintexts) if encrypted[0] else ""
+            last_name = next(plaintexts) if encrypted[1] else ""
+            address = next(plaintexts) if encrypted[3] else ""
+            phone = next(plaintexts) if encrypted[4] else ""
+            role = encrypted[5] if encrypted[5] else ""  # applicant_role is not encrypted
+
+            records.append({
+                "name": f"{first_name} {last_name}".strip(),
+                "date_of_birth": dob,
+                "address": address,
+                "phone_number": phone,
+                "role": role
+            })
+        return records
+
+    def _resolve_cv_path(self, cv_path: str) -> Path:
+        # None jika file tidak ditemukan di semua root yang mungkin
+        if os.path.isabs(cv_path):
+            full_path = Path(cv_path)
+            return full_path if full_path.exists() else None
+        
+        possible_roots = [
+            project_root,
+            project_root.parent,
+            Path.cwd()
+        ]
+        for root in possible_roots:
+            test_path = root / cv_path
+            if test_path.exists():
+                return test_path
+        return None
+
+    def extract_cv_content(self, cv_path: str, use_regex: bool = False) -> str:
+        try:
+            full_path = self._resolve_cv_path(cv_path)
+            if full_path is None:
+                print(f"CV file not found in any location: {cv_path}")
                 return f"CV file not found: {cv_path}"
             
             try:
@@ -162,6 +339,13 @@ class CVDataManager:
             return f"Error extracting CV: {str(e)}"
 
     def get_cv_database_for_search(self, use_regex: bool = False) -> dict:
+        '''
+        Teks CV dibaca massal dari tabel CVText. PDF hanya diekstrak jika barisnya belum ada
+        atau basi (fingerprint isi file atau EXTRACTOR_VERSION berbeda), lalu hasilnya
+        disimpan kembali sehingga workstation lain tidak perlu mengekstrak ulang. File hanya
+        di-hash jika ukuran atau mtime-nya berbeda dari yang tersimpan. Jika file tidak ada
+        di workstation ini, teks tersimpan tetap dipakai.
+        '''
         cv_paths = self.get_cv_paths()
         cv_database = {}
         
@@ -169,24 +353,158 @@ class CVDataManager:
             print("No CV paths found in database")
             return {}
         
-        print(f"Extracting content from {len(cv_paths)} CVs...")
+        pending = [cv_id for cv_id in cv_paths if f"{cv_id}_{use_regex}" not in self.cv_cache]
+        stored = self.load_cv_texts(use_regex) if pending else {}
+        
+        if pending:
+            print(f"Loading content of {len(pending)} CVs ({len(stored)} stored texts)...")
         
+        new_rows = []
+        stat_rows = []
+        reused = 0
         for cv_id, cv_path in cv_paths.items():
             cache_key = f"{cv_id}_{use_regex}"
             if cache_key in self.cv_cache:
                 cv_database[cv_id] = self.cv_cache[cache_key]
                 continue
             
-            content = self.extract_cv_content(cv_path, use_regex)
+            detail_id = int(cv_id.split("_", 1)[1])
+            stored_row = stored.get(detail_id)
+            full_path = self._resolve_cv_path(cv_path)
+            
+            if full_path is None:
+                if stored_row is not None:
+                    content = stored_row[2]
+                    reused += 1
+                else:
+                    print(f"CV file not found in any location: {cv_path}")
+                    content = f"CV file not found: {cv_path}"
+            else:
+                valid, fingerprint, file_size, file_mtime = self._check_cv_file(full_path, stored_row)
+                if valid:
+                    content = stored_row[2]
+                    reused += 1
+                    if stored_row[3:] != (file_size, file_mtime):
+                        # isi sama tetapi stat berubah (mis. file disalin ulang): stat baru disimpan
+                        stat_rows.append((file_size, file_mtime, detail_id))
+                else:
+                    try:
+                        forms = extract_cv_text_forms(full_path)
+                    except Exception as e:
+                        # hasil gagal tidak disimpan agar dicoba lagi di pemanggilan berikutnya
+                        print(f"Error extracting content from {full_path}: {e}")
+                        content = f"Error extracting PDF content: {str(e)}"
+                    else:
+                        content = forms["regex" if use_regex else "plain"]
+                        new_rows.append((
+                            detail_id, fingerprint, file_size, file_mtime, forms["page_count"],
+                            EXTRACTOR_VERSION, forms["plain"], forms["regex"]
+                        ))
             
             self.cv_cache[cache_key] = content
             cv_database[cv_id] = content
-            
-            # print(f"Extracted {cv_id}: {len(content)} characters")
+        
+        if new_rows:
+            self.save_cv_texts(new_rows)
+        if stat_rows:
+            self.update_cv_file_stats(stat_rows)
+        if pending:
+            print(f"Reused {reused} stored CV texts, extracted {len(new_rows)} CVs")
         
         print(f"CV database ready with {len(cv_database)} CVs")
         return cv_database
 
+    def _check_cv_file(self, full_path: Path, stored_row) -> tuple:
+        '''
+        (teks tersimpan masih berlaku, fingerprint, file_size, file_mtime) untuk file CV.
+        stored_row berbentuk seperti nilai load_cv_texts atau None. Jika ukuran dan mtime
+        sama dengan yang tersimpan, fingerprint tersimpan dipakai tanpa membaca isi file.
+        '''
+        stat = full_path.stat()
+        if stored_row is not None and stored_row[3:] == (stat.st_size, stat.st_mtime):
+            return stored_row[1] == EXTRACTOR_VERSION, stored_row[0], stat.st_size, stat.st_mtime
+        fingerprint, file_size = file_fingerprint(full_path)
+        valid = stored_row is not None and stored_row[:2] == (fingerprint, EXTRACTOR_VERSION)
+        return valid, fingerprint, file_size, stat.st_mtime
+
+    def load_cv_texts(self, use_regex: bool = False) -> dict:
+        # detail_id -> (fingerprint, extractor_version, teks, file_size, file_mtime), hanya kolom teks yang dibutuhkan
+        text_column = "regex_text" if use_regex else "plain_text"
+        stored = {}
+        try:
+            with pooled_connection() as conn:
+                if not conn:
+                    print("Database connection failed")
+                    return {}
+                
+                cur = conn.cursor(buffered=False)
+                try:
+                    cur.execute(f"""
+                        SELECT detail_id, fingerprint, extractor_version, {text_column}, file_size, file_mtime
+                        FROM CVText
+                    """)
+                    while True:
+                        rows = cur.fetchmany(APPLICANT_CHUNK_SIZE)
+                        if not rows:
+                            break
+                        for row in rows:
+                            stored[row[0]] = tuple(row[1:])
+                finally:
+                    cur.close()
+            
+        except Exception as e:
+            print(f"Error loading stored CV texts: {e}")
+        return stored
+
+    def save_cv_texts(self, rows: list) -> int:
+        '''
+        rows berisi (detail_id, fingerprint, file_size, file_mtime, page_count,
+        extractor_version, plain_text, regex_text). REPLACE INTO berlaku di MySQL maupun SQLite.
+        '''
+        saved = 0
+        try:
+            with pooled_connection() as conn:
+                if not conn:
+                    print("Database connection failed")
+                    return 0
+                
+                cur = conn.cursor(prepared=True)
+                for start in range(0, len(rows), CV_TEXT_BATCH_SIZE):
+                    batch = rows[start:start + CV_TEXT_BATCH_SIZE]
+                    cur.executemany("""
+                        REPLACE INTO CVText (detail_id, fingerprint, file_size, file_mtime, page_count,
+                                            extractor_version, plain_text, regex_text)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    """, batch)
+                    conn.commit()
+                    saved += len(batch)
+                cur.close()
+            
+        except Exception as e:
+            print(f"Error saving CV texts: {e}")
+        return saved
+
+    def update_cv_file_stats(self, rows: list) -> int:
+        # rows berisi (file_size, file_mtime, detail_id) untuk teks yang isinya tidak berubah
+        updated = 0
+        try:
+            with pooled_connection() as conn:
+                if not conn:
+                    print("Database connection failed")
+                    return 0
+                
+                cur = conn.cursor(prepared=True)
+                for start in range(0, len(rows), CV_TEXT_BATCH_SIZE):
+                    batch = rows[start:start + CV_TEXT_BATCH_SIZE]
+                    cur.executemany("UPDATE CVText SET file_size = %s, file_mtime = %s WHERE detail_id = %s", batch)
+                    conn.commit()
+                    updated += len(batch)
+                cur.close()
+            
+        except Exception as e:
+            print(f"Error updating CV file stats: {e}")
+        return updated
+
     def get_applicant_summary_data(self, detail_id: int) -> dict:
         applicant_data = self.get_applicant_data([detail_id])
         
@@ -198,13 +516,21 @@ class CVDataManager:
         if detail_id in self.skills_cache:
             return self.skills_cache[detail_id]
         
-        cv_paths = self.get_cv_paths()
-        cv_id = f"cv_{detail_id}"
-        
-        if cv_id not in cv_paths:
-            return []
+        # teks tersimpan di CVText dipakai lebih dulu; PDF hanya diekstrak jika barisnya belum ada
+        # atau dibuat oleh extractor versi lama (CV dari corpus_generator tidak punya PDF)
+        content = self.cv_cache.get(f"cv_{detail_id}_True")
+        if content is None:
+            content = self.load_cv_text(detail_id, use_regex=True)
         
-        info_groups = self.extract_cv_content_and_process(cv_paths[cv_id], use_regex=True)
+        if content is not None:
+            info_groups = self.process_cv_content(content)
+        else:
+            cv_path = self.get_cv_path(detail_id)
+            
+            if cv_path is None:
+                return []
+            
+            info_groups = self.extract_cv_content_and_process(cv_path, use_regex=True)
         
         print("DEBUG: get info groups done")
         print(info_groups)
@@ -228,10 +554,49 @@ class CVDataManager:
         
         return formatted_data
 
+    def load_cv_text(self, detail_id: int, use_regex: bool = False) -> str:
+        # teks CVText satu CV, None jika belum ada, extractor_version basi, atau file PDF-nya sudah diganti
+        text_column = "regex_text" if use_regex else "plain_text"
+        try:
+            with pooled_connection() as conn:
+                if not conn:
+                    print("Database connection failed")
+                    return None
+                
+                cur = conn.cursor(prepared=True)
+                cur.execute(f"""
+                    SELECT fingerprint, extractor_version, {text_column}, file_size, file_mtime
+                    FROM CVText
+                    WHERE detail_id = %s
+                """, (detail_id,))
+                row = cur.fetchone()
+                cur.close()
+            
+        except Exception as e:
+            print(f"Error loading stored CV text for detail_id {detail_id}: {e}")
+            return None
+        
+        if row is None:
+            return None
+        
+        cv_path = self.get_cv_path(detail_id)
+        full_path = self._resolve_cv_path(cv_path) if cv_path else None
+        if full_path is None:
+            valid = row[1] == EXTRACTOR_VERSION
+        else:
+            valid = self._check_cv_file(full_path, tuple(row))[0]
+        return row[2] if valid else None
+
     def extract_cv_content_and_process(self, cv_path: str, use_regex: bool = False) -> dict:
         try:
             content = self.extract_cv_content(cv_path, use_regex)
-            
+            return self.process_cv_content(content)
+        except Exception as e:
+            print(f"Error processing CV content: {e}")
+            return {}
+
+    def process_cv_content(self, content: str) -> dict:
+        try:
             import tempfile
             with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as temp_file:
                 temp_file.write(content)
@@ -269,9 +634,78 @@ class CVDataManager:
         ]
 
     def get_cv_file_path(self, detail_id: int) -> str:
-        cv_paths = self.get_cv_paths()
-        cv_id = f"cv_{detail_id}"
-        return cv_paths.get(cv_id)
+        return self.get_cv_path(detail_id)
+
+    def get_saved_searches(self) -> dict:
+        try:
+            with pooled_connection() as conn:
+                if not conn:
+                    print("Database connection failed")
+                    return {}
+                    
+                cur = conn.cursor(prepared=True)
+                cur.execute("""
+                    SELECT search_id, name, keywords, min_score
+                    FROM SavedSearch
+                """)
+                
+                result = cur.fetchall()
+                cur.close()
+            
+            formatted_result = {}
+            for row in result:
+                formatted_result[row[0]] = {
+                    "name": row[1],
+                    "keywords": row[2],
+                    "min_score": row[3]
+                }
+                
+            return formatted_result
+            
+        except Exception as e:
+            print(f"Error getting saved searches: {e}")
+            return {}
+
+    def save_search(self, name: str, keywords: str, min_score: int = 1) -> int:
+        try:
+            with pooled_connection() as conn:
+                if not conn:
+                    print("Database connection failed")
+                    return None
+                    
+                cur = conn.cursor(prepared=True)
+                cur.execute("""
+                    INSERT INTO SavedSearch (name, keywords, min_score)
+                    VALUES (%s, %s, %s)
+                """, (name, keywords, min_score))
+                conn.commit()
+                search_id = cur.lastrowid
+                cur.close()
+                
+            return search_id
+            
+        except Exception as e:
+            print(f"Error saving search: {e}")
+            return None
+
+    def delete_saved_search(self, search_id: int) -> bool:
+        try:
+            with pooled_connection() as conn:
+                if not conn:
+                    print("Database connection failed")
+                    return False
+                    
+                cur = conn.cursor(prepared=True)
+                cur.execute("DELETE FROM SavedSearch WHERE search_id = %s", (search_id,))
+                conn.commit()
+                deleted = cur.rowcount > 0
+                cur.close()
+                
+            return deleted
+            
+        except Exception as e:
+            print(f"Error deleting saved search: {e}")
+            return False
 
     def get_fallback_summary_data(self) -> dict:
         return {
@@ -287,8 +721,14 @@ class CVDataManager:
 
     def clear_cache(self):
         self.cv_cache.clear()
-        self.applicant_cache.clear()
+        with self._applicant_cache_lock:
+            self.applicant_cache.clear()
+        self.encrypted_applicants.clear()
         self.skills_cache.clear()
+        # path yang diubah in-place (UPDATE) tidak terdeteksi refresh inkremental, jadi muat ulang penuh
+        self.cv_path_index = {}
+        self.cv_path_index_loaded = False
+        self.max_detail_id = 0
         print("Cache cleared")
 
 cv_data_manager = CVDataManager()
\ No newline at end of file
@@ -1,4 +1,20 @@
-import mysql.connector
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+
+try:
+    import mysql.connector
+except ImportError:
+    print("Warning: mysql-connector-python not installed. Only the SQLite backend is available.")
+    print("Install with: pip install mysql-connector-python")
+    mysql = None
 
 # sementara ini db bersifat lokal krn pas mau dibikin remote gt aku butuh public key kalian buat bikin tunnel ssh nya
 
@@ -10,27 +26,328 @@ import mysql.connector
 # GRANT ALL PRIVILEGES ON cv_db.* TO 'cv_app'@'localhost';
 # FLUSH PRIVILEGES;
 # trs bisa lgsg jalanin file ini trs seeder.py
-def get_db_connection():
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "cv_app",
+    "password": "signingout",
+    "database": "cv_db",
+    "auth_plugin": "mysql_native_password",
+}
+
+# backend database: "mysql" (server di atas) atau "sqlite" (file lokal, tanpa server)
+# contoh: SIGNHIRE_DB_BACKEND=sqlite python database/db_setup.py && python app.py
+DB_BACKEND = os.environ.get("SIGNHIRE_DB_BACKEND", "mysql").strip().lower()
+SQLITE_PATH = os.environ.get(
+    "SIGNHIRE_SQLITE_PATH", str(Path(__file__).resolve().parents[2] / "data" / "signhire.db"))
+# jumlah statement terkompilasi yang di-cache per koneksi SQLite (prepared statement)
+SQLITE_STATEMENT_CACHE = int(os.environ.get("SIGNHIRE_SQLITE_STATEMENT_CACHE", "256"))
+
+# ukuran pool koneksi dan batas waktu menunggu koneksi kosong (detik)
+POOL_SIZE = int(os.environ.get("SIGNHIRE_DB_POOL_SIZE", "5"))
+POOL_TIMEOUT = float(os.environ.get("SIGNHIRE_DB_POOL_TIMEOUT", "10"))
+# koneksi yang menganggur lebih lama dari ini dicek dulu sebelum dipakai ulang (detik)
+POOL_HEALTH_CHECK_SECONDS = float(os.environ.get("SIGNHIRE_DB_HEALTH_CHECK", "30"))
+
+def get_db_connection(**options):
+    # options menimpa DB_CONFIG untuk MySQL (mis. allow_local_infile=True), diabaikan oleh SQLite
+    if DB_BACKEND == "sqlite":
+        return get_sqlite_connection()
+    if mysql is None:
+        print("Error: mysql-connector-python is not installed (set SIGNHIRE_DB_BACKEND=sqlite)")
+        return None
     try:
-        connection = mysql.connector.connect(
-            host='localhost',
-            user='cv_app',
-            password='signingout',
-            database='cv_db',
-            auth_plugin= 'mysql_native_password'
-        )
+        connection = mysql.connector.connect(**{**DB_CONFIG, **options})
         return connection
     except mysql.connector.Error as err:
         print(f"Error: {err}")
         return None
+
+@lru_cache(maxsize=256)
+def _to_qmark(query: str) -> str:
+    # placeholder gaya mysql.connector (%s) -> gaya sqlite3 (?)
+    return query.replace("%s", "?")
+
+def _convert_date(value: bytes):
+    # kolom DATE dikembalikan sebagai datetime.date seperti di mysql.connector
+    try:
+        return date.fromisoformat(value.decode())
+    except ValueError:
+        return value.decode()
+
+def _convert_timestamp(value: bytes):
+    try:
+        return datetime.fromisoformat(value.decode())
+    except ValueError:
+        return value.decode()
+
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("DATE", _convert_date)
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
+
+class SQLiteCursor:
+    '''
+    Cursor sqlite3 dengan antarmuka yang dipakai dari mysql.connector: placeholder %s,
+    fetchone/fetchmany/fetchall, description, lastrowid, rowcount, dan context manager.
+    '''
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, query: str, params=()):
+        self._cursor.execute(_to_qmark(query), tuple(params or ()))
+        return self
+
+    def executemany(self, query: str, seq_params):
+        self._cursor.executemany(_to_qmark(query), seq_params)
+        return self
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size: int = 1):
+        return self._cursor.fetchmany(size)
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def close(self):
+        self._cursor.close()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class SQLiteConnection:
+    '''
+    Koneksi sqlite3 yang bisa menggantikan koneksi mysql.connector di seluruh kode database.
+    Argumen cursor(prepared=..., buffered=...) diterima lalu diabaikan: sqlite3 selalu
+    menyimpan statement terkompilasi di cache per koneksi dan membaca baris secara bertahap.
+    '''
+    def __init__(self, path: str = SQLITE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(
+            path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,  # koneksi dipakai bergantian antar thread lewat pool
+            cached_statements=SQLITE_STATEMENT_CACHE,
+        )
+        # WAL: pembaca tidak diblok penulis, synchronous NORMAL cukup aman untuk WAL
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+
+    def cursor(self, prepared: bool = False, buffered: bool = None, **kwargs) -> SQLiteCursor:
+        return SQLiteCursor(self._conn.cursor())
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        self._conn.close()
+
+    def is_connected(self) -> bool:
+        try:
+            self._conn.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def get_sqlite_connection(path: str = None):
+    path = path or SQLITE_PATH
+    try:
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        return SQLiteConnection(path)
+    except sqlite3.Error as err:
+        print(f"Error: {err}")
+        return None
+
+_AUTO_INCREMENT_RX = re.compile(r"\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b", re.I)
+_TABLE_OPTIONS_RX = re.compile(r"\)\s*ENGINE\s*=.*$", re.I | re.S)
+
+def adapt_sql(statement: str, backend: str = None) -> str:
+    '''
+    Menyesuaikan statement berdialek MySQL (DDL dan file seeding) dengan backend aktif.
+    Mengembalikan None untuk statement yang tidak berlaku di backend tersebut.
+    '''
+    backend = backend or DB_BACKEND
+    if backend != "sqlite":
+        return statement
+    if re.match(r"\s*SET\s", statement, re.I):
+        return None  # SET NAMES / SET FOREIGN_KEY_CHECKS khusus MySQL
+    statement = _AUTO_INCREMENT_RX.sub("INTEGER PRIMARY KEY AUTOINCREMENT", statement)
+    return _TABLE_OPTIONS_RX.sub(")", statement)
+
+def _is_connected(conn) -> bool:
+    try:
+        return conn.is_connected()
+    except Exception:
+        return False
+
+class ConnectionPool:
+    '''
+    Pool koneksi thread-safe. Koneksi dibuat saat dibutuhkan sampai batas size, lalu dipakai
+    ulang sehingga handshake TCP/auth tidak dibayar di setiap query. Koneksi yang sudah lama
+    menganggur dicek dengan health_check saat checkout dan diganti jika sudah putus.
+    '''
+    def __init__(self, connect=get_db_connection, size: int = POOL_SIZE, timeout: float = POOL_TIMEOUT,
+                 health_check=_is_connected, health_check_after: float = POOL_HEALTH_CHECK_SECONDS):
+        self.connect = connect
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.health_check = health_check
+        self.health_check_after = health_check_after
+        self._idle = queue.LifoQueue()  # (koneksi, waktu terakhir dikembalikan)
+        self._lock = threading.Lock()
+        self._created = 0
+
+    def _acquire(self):
+        try:
+            conn, returned_at = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                conn = self.connect()
+                if conn is None:
+                    with self._lock:
+                        self._created -= 1
+                return conn
+            try:
+                conn, returned_at = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                print(f"Connection pool exhausted ({self.size} connections in use)")
+                return None
+
+        if time.monotonic() - returned_at > self.health_check_after and not self.health_check(conn):
+            self._discard(conn)
+            return self._acquire()
+        return conn
+
+    def _release(self, conn):
+        try:
+            # akhiri transaksi yang masih terbuka agar snapshot baca tidak terbawa ke pemakai berikutnya
+            conn.rollback()
+        except Exception:
+            self._discard(conn)
+            return
+        self._idle.put((conn, time.monotonic()))
+
+    def _discard(self, conn):
+        with self._lock:
+            self._created -= 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def connection(self):
+        # yield None jika koneksi gagal dibuat, sama seperti get_db_connection
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn is not None:
+                self._release(conn)
+
+    def close_all(self):
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_connection_pool() -> ConnectionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
+
+def pooled_connection():
+    # with pooled_connection() as conn: ... koneksi otomatis kembali ke pool
+    return get_connection_pool().connection()
     
-def create_tables():
-    conn = get_db_connection()
-    if conn is None:
-        return
+def _index_exists(cur, table: str, name: str) -> bool:
+    if DB_BACKEND == "sqlite":
+        cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = %s", (name,))
+    else:
+        cur.execute("""
+            SELECT 1 FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+            LIMIT 1
+        """, (table, name))
+    return cur.fetchone() is not None
 
-    cur = conn.cursor()
+def _create_index(name: str, table: str, columns: list):
+    # MySQL tidak punya CREATE INDEX IF NOT EXISTS, jadi keberadaan index dicek dulu
+    def step(cur):
+        if not _index_exists(cur, table, name):
+            cur.execute(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})")
+    return step
+
+def _drop_index(name: str, table: str):
+    def step(cur):
+        if _index_exists(cur, table, name):
+            cur.execute(f"DROP INDEX {name}" if DB_BACKEND == "sqlite" else f"DROP INDEX {name} ON {table}")
+    return step
+
+def _column_exists(cur, table: str, name: str) -> bool:
+    if DB_BACKEND == "sqlite":
+        cur.execute(f"PRAGMA table_info({table})")
+        return any(row[1] == name for row in cur.fetchall())
     cur.execute("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s
+        LIMIT 1
+    """, (table, name))
+    return cur.fetchone() is not None
+
+def _add_column(name: str, table: str, definition: str):
+    def step(cur):
+        if not _column_exists(cur, table, name):
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+    return step
+
+# (versi, deskripsi, langkah). Langkah berupa SQL berdialek MySQL (lewat adapt_sql) atau
+# fungsi yang menerima cursor. Semua langkah idempotent sehingga bisa dijalankan ulang.
+MIGRATIONS = [
+    (1, "initial schema", [
+    """
         CREATE TABLE IF NOT EXISTS ApplicantProfile (
         applicant_id INT AUTO_INCREMENT PRIMARY KEY,
         first_name VARCHAR(100) DEFAULT NULL,
@@ -38,20 +355,104 @@ def create_tables():
         date_of_birth DATE DEFAULT NULL,
         address VARCHAR(255) DEFAULT NULL,
         phone_number VARCHAR(20) DEFAULT NULL
-        );
-    """)
-    cur.execute("""
+        )
+    """,
+    """
         CREATE TABLE IF NOT EXISTS ApplicationDetail (
         detail_id INT AUTO_INCREMENT PRIMARY KEY,
         applicant_id INT NOT NULL,
         application_role VARCHAR(100) DEFAULT NULL,
         cv_path TEXT NOT NULL,
         FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id) ON DELETE CASCADE
-        );
-    """)
-    conn.commit()
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS SavedSearch (
+        search_id INT AUTO_INCREMENT PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        keywords TEXT NOT NULL,
+        min_score INT NOT NULL DEFAULT 1,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    ]),
+    # teks hasil ekstraksi CV dipakai bersama semua workstation; fingerprint = hash isi file
+    (2, "shared CV text", [
+    """
+        CREATE TABLE IF NOT EXISTS CVText (
+        detail_id INT PRIMARY KEY,
+        fingerprint CHAR(32) NOT NULL,
+        file_size BIGINT DEFAULT NULL,
+        page_count INT DEFAULT NULL,
+        extractor_version VARCHAR(20) NOT NULL,
+        plain_text MEDIUMTEXT NOT NULL,
+        regex_text MEDIUMTEXT NOT NULL,
+        extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (detail_id) REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE
+        )
+    """,
+    ]),
+    # index sekunder selalu memuat primary key (detail_id), sehingga join applicant di
+    # CVDataManager terjawab dari index saja tanpa membaca baris tabel
+    (3, "covering index for applicant join", [
+        _create_index("idx_detail_applicant_role", "ApplicationDetail", ["applicant_id", "application_role"]),
+        # index FK lama khusus SQLite, sudah tercakup idx_detail_applicant_role
+        _drop_index("idx_detail_applicant", "ApplicationDetail"),
+    ]),
+    # ukuran dan mtime file saat fingerprint terakhir dihitung; file hanya di-hash ulang jika berubah
+    (4, "CV file mtime", [
+        _add_column("file_mtime", "CVText", "DOUBLE DEFAULT NULL"),
+    ]),
+]
+
+SCHEMA_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS SchemaVersion (
+    version INT PRIMARY KEY,
+    description VARCHAR(255) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+def schema_version(cur) -> int:
+    cur.execute("SELECT COALESCE(MAX(version), 0) FROM SchemaVersion")
+    return cur.fetchone()[0]
+
+def migrate(reapply: bool = False) -> int:
+    '''
+    Menjalankan migrasi yang belum tercatat di SchemaVersion secara berurutan dan
+    mengembalikan versi skema akhir. reapply=True menjalankan ulang semua langkah, misalnya
+    setelah file seeding men-drop dan membuat ulang tabel beserta index-nya.
+    '''
+    conn = get_db_connection()
+    if conn is None:
+        return 0
+
+    cur = conn.cursor()
+    cur.execute(SCHEMA_VERSION_TABLE)
+    current = 0 if reapply else schema_version(cur)
+    for version, description, steps in MIGRATIONS:
+        if version <= current:
+            continue
+        for step in steps:
+            if callable(step):
+                step(cur)
+            else:
+                statement = adapt_sql(step)
+                if statement:
+                    cur.execute(statement)
+        cur.execute("REPLACE INTO SchemaVersion (version, description) VALUES (%s, %s)", (version, description))
+        conn.commit()
+        print(f"Applied migration {version}: {description}")
+        current = version
+
+    version = schema_version(cur)
     cur.close()
     conn.close()
+    return version
+
+def create_tables():
+    version = migrate()
+    print(f"Database schema at version {version}")
 
 if __name__ == "__main__":
     create_tables()
\ No newline at end of file
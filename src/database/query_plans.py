@@ -0,0 +1,104 @@
+'''
+Laporan query plan untuk query yang dijalankan CVDataManager.
+
+Setiap statement dijalankan dengan EXPLAIN (MySQL) atau EXPLAIN QUERY PLAN (SQLite).
+Lookup yang seharusnya memakai index tetapi ternyata memindai seluruh tabel ditandai
+FULL SCAN dan membuat exit code 1, sehingga bisa dipakai sebagai pengecekan setelah migrasi.
+
+Contoh (dari root project):
+    python src/database/query_plans.py
+'''
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from database.db_setup import DB_BACKEND, get_db_connection
+from database.cv_data_manager import APPLICANT_DATA_QUERY, CV_PATH_BY_ID_QUERY, CV_PATH_QUERY
+
+# (nama, statement, parameter, full scan memang diharapkan)
+HOT_QUERIES = [
+    ("cv paths", CV_PATH_QUERY, (), True),
+    ("new cv paths", f"{CV_PATH_QUERY} WHERE detail_id > %s", (0,), False),
+    ("cv path by id", CV_PATH_BY_ID_QUERY, (1,), False),
+    ("application count", "SELECT COUNT(*) FROM ApplicationDetail", (), True),
+    ("applicant data", APPLICANT_DATA_QUERY, (), True),
+    ("applicant data by id", f"{APPLICANT_DATA_QUERY} WHERE ad.detail_id IN (%s, %s, %s)", (1, 2, 3), False),
+    ("stored cv text", "SELECT detail_id, fingerprint, extractor_version, plain_text, file_size, file_mtime FROM CVText",
+     (), True),
+]
+
+def explain(cur, statement: str, params=()) -> list:
+    '''
+    Langkah plan sebagai list dict {table, detail, full_scan, covering}. full_scan berarti
+    baris tabel dibaca seluruhnya, covering berarti hasil diambil dari index saja.
+    '''
+    if DB_BACKEND == "sqlite":
+        cur.execute(f"EXPLAIN QUERY PLAN {statement}", params)
+        steps = []
+        for row in cur.fetchall():
+            detail = row[-1]
+            steps.append({
+                "table": detail.split()[1] if len(detail.split()) > 1 else "",
+                "detail": detail,
+                "full_scan": detail.startswith("SCAN") and "INDEX" not in detail,
+                "covering": "COVERING INDEX" in detail,
+            })
+        return steps
+
+    cur.execute(f"EXPLAIN {statement}", params)
+    columns = [column[0] for column in cur.description]
+    steps = []
+    for row in cur.fetchall():
+        plan = dict(zip(columns, row))
+        extra = plan.get("Extra") or ""
+        steps.append({
+            "table": plan.get("table") or "",
+            "detail": f"type={plan.get('type')} key={plan.get('key')} rows={plan.get('rows')} {extra}".strip(),
+            "full_scan": plan.get("type") == "ALL",
+            "covering": "Using index" in extra,
+        })
+    return steps
+
+def report_query_plans(queries: list = HOT_QUERIES) -> list:
+    # mencetak plan tiap statement dan mengembalikan nama statement yang full scan tanpa diharapkan
+    conn = get_db_connection()
+    if conn is None:
+        print("Database connection failed")
+        return [name for name, _, _, _ in queries]
+
+    flagged = []
+    cur = conn.cursor()
+    print(f"Query plans ({DB_BACKEND})")
+    for name, statement, params, scan_expected in queries:
+        try:
+            steps = explain(cur, statement, params)
+        except Exception as e:
+            print(f"\n{name}: ERROR {e}")
+            flagged.append(name)
+            continue
+
+        full_scan = any(step["full_scan"] for step in steps)
+        if full_scan and not scan_expected:
+            verdict = "FULL SCAN"
+            flagged.append(name)
+        elif full_scan:
+            verdict = "ok (full scan expected)"
+        else:
+            verdict = "ok"
+        print(f"\n{name}: {verdict}")
+        for step in steps:
+            marker = " [covering]" if step["covering"] else ""
+            print(f"    {step['table']}: {step['detail']}{marker}")
+    cur.close()
+    conn.close()
+    return flagged
+
+def main():
+    flagged = report_query_plans()
+    if flagged:
+        print(f"\nUnexpected full scans: {', '.join(flagged)} (run python src/database/db_setup.py to migrate)")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
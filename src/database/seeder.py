@@ -2,19 +2,37 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+import argparse
+import csv
 import itertools
+import os
+import random
 import re
+import tempfile
+import time
 from pathlib import Path
 from faker import Faker
-from db_setup import get_db_connection
+from db_setup import DB_BACKEND, adapt_sql, get_db_connection, migrate
 from model.encryptor import Encryptor
 
 
 fake = Faker()
 DATA_ROOT = Path(__file__).resolve().parents[2] / "data"
 encryptor = Encryptor("SIGNHIRE")
-input_sql = Path("src/database/tubes3_seeding.sql")
-output_sql = Path("src/database/tubes3_seeding_encrypted.sql")
+input_sql = Path(__file__).resolve().parent / "tubes3_seeding.sql"
+output_sql = Path(__file__).resolve().parent / "tubes3_seeding_encrypted.sql"
+# jumlah baris per executemany dan per commit pada seeding massal
+BULK_BATCH_SIZE = int(os.environ.get("SIGNHIRE_SEED_BATCH", "1000"))
+# jumlah nilai Faker per kolom; profil massal dirangkai acak dari pool ini (Faker ~0.5 ms per profil)
+PROFILE_POOL_SIZE = 2000
+
+ROLES = [
+    "Accountant", "Engineer", "Designer", "Teacher", "Healthcare",
+    "Information-Technology", "HR", "Finance", "Sales", "Consultant", 
+    "Marketing", "Legal", "Project-Manager", "Data-Analyst", "Researcher", 
+    "Developer", "System-Administrator", "Network-Engineer", "Business-Analyst", 
+    "Product-Manager", "Operations-Manager", "Customer-Service", "Chef"
+]
 raw_sql = input_sql.read_text(encoding="utf-8")
 
 profile_insert_rx = re.compile(
@@ -29,10 +47,16 @@ profile_tuple_rx = re.compile(
 def seed_profile(m_obj: re.Match) -> str:
     tuples_sql = m_obj.group(1)
     out_rows   = []
-    for tid, first, last, dob, addr, phone in profile_tuple_rx.findall(tuples_sql):
+    profiles   = profile_tuple_rx.findall(tuples_sql)
+    # satu panggilan encrypt_many untuk keempat kolom semua baris
+    encrypted  = iter(encryptor.encrypt_many(
+        [field for _, first, last, _, addr, phone in profiles for field in (first, last, addr, phone)]
+    ))
+    for tid, _, _, dob, _, _ in profiles:
+        first, last, addr, phone = next(encrypted), next(encrypted), next(encrypted), next(encrypted)
         out_rows.append(
-            f"({tid}, '{encryptor.encrypt(first)}', '{encryptor.encrypt(last)}', "
-            f"'{dob}', '{encryptor.encrypt(addr)}', '{encryptor.encrypt(phone)}')"
+            f"({tid}, '{first}', '{last}', "
+            f"'{dob}', '{addr}', '{phone}')"
         )
     return f"INSERT INTO ApplicantProfile (applicant_id, first_name, last_name," \
            f" date_of_birth, address, phone_number) VALUES\n" + ",\n".join(out_rows) + ";"
@@ -51,115 +75,257 @@ def clean_db():
     if conn is None:
         return
     cur = conn.cursor()
-    clean_db()
-    # cur.execute("SET FOREIGN_KEY_CHECKS = 0;")
-    # cur.execute("TRUNCATE TABLE ApplicationDetail")
-    # cur.execute("TRUNCATE TABLE ApplicantProfile")
-    # cur.execute("SET FOREIGN_KEY_CHECKS = 1;")
+    # tabel anak dulu agar foreign key tidak dilanggar; DELETE berlaku di MySQL maupun SQLite
+    for table in ("CVText", "ApplicationDetail", "ApplicantProfile"):
+        try:
+            cur.execute(f"DELETE FROM {table}")
+        except Exception as e:
+            print(f"Could not clean {table}: {e}")
     conn.commit()
     cur.close()
     conn.close()
 
+_SQL_TOKEN_RX = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|--[^\n]*|/\*.*?\*/|;", re.S)
+
+def split_sql_statements(sql_text: str) -> list:
+    # memecah di ';' yang tidak berada di dalam string literal atau komentar
+    statements = []
+    start = 0
+    for token in _SQL_TOKEN_RX.finditer(sql_text):
+        if token.group() == ";":
+            statement = sql_text[start:token.start()].strip()
+            if statement:
+                statements.append(statement)
+            start = token.end()
+    tail = sql_text[start:].strip()
+    if tail:
+        statements.append(tail)
+    return statements
+
 def run_sql_file(sql_path: Path):
     sql_text = Path(sql_path).read_text(encoding="utf-8")
 
-    statements = [s.strip() for s in sql_text.split(";") if s.strip()]
+    statements = [adapt_sql(s) for s in split_sql_statements(sql_text)]
 
+    started = time.perf_counter()
+    inserted = 0
+    # satu transaksi untuk seluruh file; INSERT di file seeding sudah berbentuk multi-row VALUES
     with get_db_connection() as conn:
         with conn.cursor() as cur:
             for stmt in statements:
-                cur.execute(stmt)
+                if stmt:
+                    cur.execute(stmt)
+                    if stmt.lstrip().upper().startswith("INSERT"):
+                        inserted += max(cur.rowcount, 0)
         conn.commit()
+    report_throughput(Path(sql_path).name, inserted, time.perf_counter() - started)
 
-def seed_applicant_profiles(n: int = 250):
-    conn = get_db_connection()
-    cur = conn.cursor(prepared=True)
-    insert_stmt = """
-        INSERT INTO ApplicantProfile
-        (first_name, last_name, email, date_of_birth, address, phone_number)
-        VALUES (%s, %s, %s, %s, %s, %s)
-    """
-    for _ in range(n):
-        profile = fake.simple_profile()
-        first, *last = profile["name"].split()
-        cur.execute(insert_stmt, (
-            encryptor.encrypt(first),
-            encryptor.encrypt(" ".join(last)) if last else "",
-            encryptor.encrypt(profile["mail"]),
-            profile["birthdate"],
-            encryptor.encrypt(profile["address"].replace("\n", ", ")),
-            encryptor.encrypt(clean_phone())
+def report_throughput(label: str, rows: int, elapsed: float):
+    rate = rows / elapsed if elapsed > 0 else float("inf")
+    print(f"{label}: {rows} rows in {elapsed:.2f}s ({rate:,.0f} rows/sec)")
+
+def bulk_insert(conn, table: str, columns: list, rows, batch_size: int = BULK_BATCH_SIZE) -> int:
+    '''
+    Insert massal per batch_size baris dengan satu executemany dan satu commit per batch.
+    Cursor biasa (bukan prepared) sengaja dipakai: mysql.connector menulis ulang
+    executemany INSERT menjadi satu INSERT multi-row VALUES, sedangkan sqlite3 memakai
+    ulang satu statement terkompilasi. rows boleh berupa generator.
+    '''
+    insert_stmt = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))})"
+    )
+    rows = iter(rows)
+    inserted = 0
+    cur = conn.cursor()
+    try:
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                break
+            cur.executemany(insert_stmt, batch)
+            conn.commit()
+            inserted += len(batch)
+    finally:
+        cur.close()
+    return inserted
+
+def load_data_infile(conn, table: str, columns: list, rows) -> int:
+    '''
+    Jalur tercepat untuk MySQL: baris ditulis ke CSV sementara lalu dimuat dengan satu
+    LOAD DATA LOCAL INFILE. Server harus mengizinkan local_infile dan koneksi dibuka
+    dengan allow_local_infile=True.
+    '''
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file, lineterminator="\n")
+        count = 0
+        for row in rows:
+            writer.writerow(["NULL" if value is None else value for value in row])
+            count += 1
+        csv_path = csv_file.name
+
+    try:
+        cur = conn.cursor()
+        cur.execute(f"""
+            LOAD DATA LOCAL INFILE %s INTO TABLE {table}
+            CHARACTER SET utf8mb4
+            FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY ''
+            LINES TERMINATED BY '\\n'
+            ({', '.join(columns)})
+        """, (csv_path,))
+        conn.commit()
+        cur.close()
+    finally:
+        os.unlink(csv_path)
+    return count
+
+def bulk_load(table: str, columns: list, rows, batch_size: int = BULK_BATCH_SIZE,
+              use_load_data: bool = False) -> int:
+    # LOAD DATA LOCAL INFILE hanya ada di MySQL, backend lain memakai bulk_insert
+    if use_load_data and DB_BACKEND == "sqlite":
+        print("LOAD DATA LOCAL INFILE is MySQL only, using batched executemany")
+        use_load_data = False
+
+    conn = get_db_connection(allow_local_infile=True) if use_load_data else get_db_connection()
+    if conn is None:
+        print("DB connection failed — aborting.")
+        return 0
+
+    started = time.perf_counter()
+    try:
+        if use_load_data:
+            inserted = load_data_infile(conn, table, columns, rows)
+        else:
+            inserted = bulk_insert(conn, table, columns, rows, batch_size)
+    finally:
+        conn.close()
+    report_throughput(table, inserted, time.perf_counter() - started)
+    return inserted
+
+def applicant_profile_rows(n: int, batch_size: int = BULK_BATCH_SIZE):
+    # (first_name, last_name, date_of_birth, address, phone_number), dienkripsi per batch
+    pool_size = min(n, PROFILE_POOL_SIZE)
+    first_names = [fake.first_name() for _ in range(pool_size)]
+    last_names = [fake.last_name() for _ in range(pool_size)]
+    birthdates = [fake.date_of_birth(minimum_age=20, maximum_age=60) for _ in range(pool_size)]
+    addresses = [fake.address().replace("\n", ", ") for _ in range(pool_size)]
+    phones = [clean_phone() for _ in range(pool_size)]
+
+    for start in range(0, n, batch_size):
+        count = min(batch_size, n - start)
+        profiles = list(zip(
+            random.choices(first_names, k=count),
+            random.choices(last_names, k=count),
+            random.choices(birthdates, k=count),
+            random.choices(addresses, k=count),
+            random.choices(phones, k=count)
         ))
-    conn.commit()
-    print(f"Seeded {n} ApplicantProfile rows.")
-    cur.close()
-    conn.close()
+        encrypted = iter(encryptor.encrypt_many(
+            [field for first, last, _, addr, phone in profiles for field in (first, last, addr, phone)]
+        ))
+        for _, _, dob, _, _ in profiles:
+            first, last, addr, phone = next(encrypted), next(encrypted), next(encrypted), next(encrypted)
+            yield (first, last, dob, addr, phone)
+
+def seed_applicant_profiles(n: int = 250, batch_size: int = BULK_BATCH_SIZE, use_load_data: bool = False) -> int:
+    inserted = bulk_load(
+        "ApplicantProfile",
+        ["first_name", "last_name", "date_of_birth", "address", "phone_number"],
+        applicant_profile_rows(n, batch_size),
+        batch_size, use_load_data
+    )
+    print(f"Seeded {inserted} ApplicantProfile rows.")
+    return inserted
 
 
-def seed_application_details(max_roles_per_applicant: int = 2):
+def get_applicant_ids() -> list:
     conn = get_db_connection()
     if conn is None:
         print("DB connection failed — aborting.")
-        return
-
-    cur = conn.cursor(prepared=True)
+        return []
+    cur = conn.cursor()
     cur.execute("SELECT applicant_id FROM ApplicantProfile ORDER BY applicant_id")
     applicants = [row[0] for row in cur.fetchall()]
+    cur.close()
+    conn.close()
+    return applicants
 
+def seed_application_details(max_roles_per_applicant: int = 2, count: int = None,
+                             batch_size: int = BULK_BATCH_SIZE, use_load_data: bool = False) -> int:
+    '''
+    Satu ApplicationDetail per PDF di data/, atau tepat count baris dengan PDF dipakai
+    bergiliran (untuk database uji berukuran besar). Tiap applicant mendapat paling
+    banyak max_roles_per_applicant baris.
+    '''
+    applicants = get_applicant_ids()
     if not applicants:
         print("No ApplicantProfile rows yet — seed them first.")
-        return
+        return 0
 
-    app_cycle = itertools.cycle(applicants)
-    roles_count = {aid: 0 for aid in applicants}
-
-    def next_applicant() -> int:
-        """Return an applicant_id that still has quota left."""
-        while True:
-            aid = next(app_cycle)
-            if roles_count[aid] < max_roles_per_applicant:
-                roles_count[aid] += 1
-                return aid
-
-    insert_stmt = """
-        INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path)
-        VALUES (%s, %s, %s)
-    """
-
-    pdf_paths = sorted(DATA_ROOT.glob("*.pdf"))
+    pdf_paths = sorted(DATA_ROOT.rglob("*.pdf"))
     if not pdf_paths:
         print(f"No PDFs found under {DATA_ROOT}")
-        return
-    
-    ROLES = [
-        "Accountant", "Engineer", "Designer", "Teacher", "Healthcare",
-        "Information-Technology", "HR", "Finance", "Sales", "Consultant", 
-        "Marketing", "Legal", "Project-Manager", "Data-Analyst", "Researcher", 
-        "Developer", "System-Administrator", "Network-Engineer", "Business-Analyst", 
-        "Product-Manager", "Operations-Manager", "Customer-Service", "Chef"
-    ]
-    role_cycle = itertools.cycle(ROLES)
-    for i, pdf in enumerate(pdf_paths, start=1):
-        role = next(role_cycle)
-        applicant_id = next_applicant()
-        cur.execute(
-            insert_stmt,
-            (applicant_id, role, str(pdf.relative_to(DATA_ROOT.parent)))
-        )
-        if i % 50 == 0:
-            print(f"Inserted {i} rows…")
+        return 0
 
-    conn.commit()
-    print(f"Inserted total {len(pdf_paths)} ApplicationDetail rows "
+    capacity = len(applicants) * max_roles_per_applicant
+    total = len(pdf_paths) if count is None else count
+    if total > capacity:
+        print(f"Only {capacity} applications fit {len(applicants)} applicants "
+              f"with max {max_roles_per_applicant} roles each, skipping {total - capacity}")
+        total = capacity
+
+    def detail_rows():
+        # applicant diisi bergiliran sehingga kuota tiap applicant terpakai merata
+        app_cycle = itertools.cycle(applicants)
+        role_cycle = itertools.cycle(ROLES)
+        for pdf in itertools.islice(itertools.cycle(pdf_paths), total):
+            yield (next(app_cycle), next(role_cycle), pdf.relative_to(DATA_ROOT.parent).as_posix())
+
+    inserted = bulk_load(
+        "ApplicationDetail",
+        ["applicant_id", "application_role", "cv_path"],
+        detail_rows(),
+        batch_size, use_load_data
+    )
+    print(f"Inserted total {inserted} ApplicationDetail rows "
           f"using {len(applicants)} applicants "
           f"(max {max_roles_per_applicant} roles each).")
+    return inserted
 
-    cur.close()
-    conn.close()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed the SignHire database")
+    parser.add_argument("--bulk", action="store_true",
+                        help="seed synthetic applicants and applications instead of running the SQL file")
+    parser.add_argument("--profiles", type=int, default=250, help="number of ApplicantProfile rows (--bulk)")
+    parser.add_argument("--applications", type=int, default=None,
+                        help="number of ApplicationDetail rows, default one per PDF in data/ (--bulk)")
+    parser.add_argument("--max-roles", type=int, default=2, help="maximum applications per applicant (--bulk)")
+    parser.add_argument("--batch-size", type=int, default=BULK_BATCH_SIZE, help="rows per executemany and commit")
+    parser.add_argument("--load-data-infile", action="store_true",
+                        help="use LOAD DATA LOCAL INFILE (MySQL with local_infile enabled)")
+    parser.add_argument("--keep", action="store_true", help="do not delete existing rows first")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for reproducible data")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        Faker.seed(args.seed)
+        random.seed(args.seed)
+
+    if not args.bulk:
+        output_sql.write_text(raw_sql, encoding="utf-8")
+        print("✅  Encrypted SQL saved to", output_sql)
+        clean_db()
+        run_sql_file(output_sql)
+        # file seeding men-drop dan membuat ulang tabel, sehingga index dari migrasi dipasang lagi
+        migrate(reapply=True)
+        return
+
+    if not args.keep:
+        clean_db()
+    started = time.perf_counter()
+    rows = seed_applicant_profiles(args.profiles, args.batch_size, args.load_data_infile)
+    rows += seed_application_details(args.max_roles, args.applications, args.batch_size, args.load_data_infile)
+    report_throughput("Total", rows, time.perf_counter() - started)
 
 if __name__ == "__main__":
-    output_sql.write_text(raw_sql, encoding="utf-8")
-    print("✅  Encrypted SQL saved to", output_sql)
-    clean_db()
-    run_sql_file(output_sql)
-    
+    main()
@@ -1,4 +1,13 @@
 import customtkinter as ctk
+from concurrent.futures import ThreadPoolExecutor
+import queue
+
+from model.cancellation import CancellationToken, SearchCancelled
+
+# interval polling hasil pencarian di background (ms)
+SEARCH_POLL_MS = 50
+# jeda setelah keystroke terakhir sebelum live search dijalankan (ms)
+LIVE_DEBOUNCE_MS = 250
 
 class HomePage(ctk.CTkScrollableFrame):
     def __init__(self, parent, **kwargs):
@@ -7,10 +16,16 @@ class HomePage(ctk.CTkScrollableFrame):
         
         self.selected_algorithm = ctk.StringVar(value="KMP")
         self.matches_count = ctk.IntVar(value=5)  # Default to 5
+        self.live_mode = ctk.BooleanVar(value=False)
+        self.bm25_mode = ctk.BooleanVar(value=False)
+        self.live_job = None
         
         self.main_window = None
         self.search_controller = None
         self.current_results = []
+        self.search_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="search")
+        self.search_token = None
+        self.displayed_ranking = None
         self.setup_ui()
     
     def set_main_window(self, main_window):
@@ -41,7 +56,7 @@ class HomePage(ctk.CTkScrollableFrame):
         
         self.search_entry = ctk.CTkEntry(
             search_frame,
-            placeholder_text="e.g. python, javascript, react",
+            placeholder_text="e.g. python, react  or  python AND \"machine learning\"",
             height=30,
             width=300,
             font=("Inter", 10, "bold"),
@@ -50,7 +65,34 @@ class HomePage(ctk.CTkScrollableFrame):
             placeholder_text_color="#92400E",
             corner_radius=18
         )
-        self.search_entry.pack(anchor="w", pady=(0, 12))
+        self.search_entry.pack(anchor="w", pady=(0, 6))
+        self.search_entry.bind("<KeyRelease>", self.on_keyword_typed)
+        
+        live_switch = ctk.CTkSwitch(
+            search_frame,
+            text="Live search",
+            variable=self.live_mode,
+            font=("Inter", 11, "bold"),
+            text_color="white",
+            progress_color="#DC2626",
+            button_color="#F5E2C8",
+            button_hover_color="#FDE68A",
+            command=self.on_live_mode_toggled
+        )
+        live_switch.pack(anchor="w", pady=(0, 6))
+        
+        bm25_switch = ctk.CTkSwitch(
+            search_frame,
+            text="BM25 ranking",
+            variable=self.bm25_mode,
+            font=("Inter", 11, "bold"),
+            text_color="white",
+            progress_color="#DC2626",
+            button_color="#F5E2C8",
+            button_hover_color="#FDE68A",
+            command=self.on_keyword_typed
+        )
+        bm25_switch.pack(anchor="w", pady=(0, 12))
         
         algo_label = ctk.CTkLabel(
             search_frame,
@@ -107,7 +149,23 @@ class HomePage(ctk.CTkScrollableFrame):
             font=("Inter", 11, "bold"),
             command=lambda: self.select_algorithm("Aho-Corasick")
         )
-        self.aho_corasick_btn.pack(side="left")
+        self.aho_corasick_btn.pack(side="left", padx=(0, 8))
+        
+        self.auto_btn = ctk.CTkButton(
+            algo_frame,
+            text="Auto",
+            width=60,
+            height=28,
+            corner_radius=16,
+            fg_color="transparent",
+            border_color="#F5E2C8",
+            border_width=2,
+            text_color="white",
+            hover_color="#F5E2C8",
+            font=("Inter", 11, "bold"),
+            command=lambda: self.select_algorithm("Auto")
+        )
+        self.auto_btn.pack(side="left")
         
         matches_frame = ctk.CTkFrame(search_frame, fg_color="transparent")
         matches_frame.pack(anchor="w", pady=(0, 12))
@@ -173,6 +231,16 @@ class HomePage(ctk.CTkScrollableFrame):
         )
         search_btn.pack(anchor="w", pady=5)
         
+        self.search_progress = ctk.CTkProgressBar(
+            search_frame,
+            width=300,
+            height=8,
+            corner_radius=4,
+            fg_color="#F5E2C8",
+            progress_color="#DC2626"
+        )
+        self.search_progress.set(0)
+        
         self.create_results_section(main_container)
     
     def select_algorithm(self, algorithm):
@@ -181,7 +249,8 @@ class HomePage(ctk.CTkScrollableFrame):
         buttons = {
             "KMP": self.kmp_btn,
             "BM": self.bm_btn,
-            "Aho-Corasick": self.aho_corasick_btn
+            "Aho-Corasick": self.aho_corasick_btn,
+            "Auto": self.auto_btn
         }
         
         for name, btn in buttons.items():
@@ -189,6 +258,8 @@ class HomePage(ctk.CTkScrollableFrame):
                 btn.configure(fg_color="#F5E2C8", text_color="#7C2D12", border_width=0)
             else:
                 btn.configure(fg_color="transparent", text_color="white", border_width=2, border_color="#F5E2C8")
+        
+        self.on_keyword_typed()
     
     def increase_matches(self):
         current = self.matches_count.get()
@@ -202,6 +273,43 @@ class HomePage(ctk.CTkScrollableFrame):
             self.matches_count.set(current - 1)
             self.count_label.configure(text=str(current - 1))
     
+    def on_keyword_typed(self, event=None):
+        if not self.live_mode.get():
+            return
+        # debounce: hanya keystroke terakhir dalam LIVE_DEBOUNCE_MS yang memicu pencarian
+        if self.live_job:
+            self.after_cancel(self.live_job)
+        self.live_job = self.after(LIVE_DEBOUNCE_MS, self.perform_live_search)
+    
+    def on_live_mode_toggled(self):
+        if self.live_mode.get():
+            self.on_keyword_typed()
+        elif self.live_job:
+            self.after_cancel(self.live_job)
+            self.live_job = None
+    
+    def perform_live_search(self):
+        self.live_job = None
+        keywords = self.search_entry.get().strip()
+        
+        if not keywords:
+            self.cancel_search()
+            self.show_empty_results()
+            return
+        
+        if not self.search_controller:
+            return
+        
+        self.cancel_search()
+        token = CancellationToken()
+        self.search_token = token
+        
+        future = self.search_executor.submit(
+            self.search_controller.live_search, keywords, self.selected_algorithm.get(),
+            self.matches_count.get(), token, self.selected_ranking()
+        )
+        self.after(SEARCH_POLL_MS, self.poll_search, future, token, queue.Queue())
+    
     def perform_search(self):
         keywords = self.search_entry.get().strip()
         algorithm = self.selected_algorithm.get()
@@ -213,31 +321,117 @@ class HomePage(ctk.CTkScrollableFrame):
         
         if not keywords:
             print("No keywords entered")
+            self.cancel_search()
             self.show_empty_results()
             return
         
-        try:
-            results = self.search_controller.search_cvs(keywords, algorithm, top_matches)
-            
-            self.current_results = results
-            self.display_search_results(results)
-            
-            algorithm_used = results['summary']['algorithm_used']
-            result_count = len(results['results'])
-            main_time = results['timing']['search_time_ms']
-            leven_time = results['timing'].get('levenshtein_time_ms')  # Optional
-
-            print(f"{algorithm_used} search completed: {result_count} results found in {main_time}ms")
-            
-            if leven_time is not None:
-                print(f"Levenshtein additional search took {leven_time}ms")
-            
-            if "+" in algorithm_used:
-                print(f"Fallback mechanism activated: {algorithm_used}")
+        if not self.search_controller:
+            self.show_error_message("Search controller not available")
+            return
+        
+        # pencarian baru menggantikan (dan membatalkan) pencarian yang masih berjalan
+        self.cancel_search()
+        token = CancellationToken()
+        self.search_token = token
+        
+        snapshots = queue.Queue()
+        future = self.search_executor.submit(
+            self.stream_search, keywords, algorithm, top_matches, token, snapshots, self.selected_ranking()
+        )
+        self.show_search_progress()
+        self.after(SEARCH_POLL_MS, self.poll_search, future, token, snapshots)
+    
+    def selected_ranking(self):
+        return "bm25" if self.bm25_mode.get() else "count"
+    
+    def stream_search(self, keywords, algorithm, top_matches, token, snapshots, ranking="count"):
+        # jalan di background thread; snapshot diteruskan ke Tk thread lewat queue
+        results = None
+        for results in self.search_controller.iter_search_cvs(keywords, algorithm, top_matches, token,
+                                                              ranking=ranking):
+            snapshots.put(results)
+        return results
+    
+    def poll_search(self, future, token, snapshots):
+        if token is not self.search_token:
+            return  # sudah digantikan pencarian lain
+        
+        if not future.done():
+            latest = None
+            while not snapshots.empty():
+                latest = snapshots.get_nowait()
+            if latest is not None:
+                self.display_provisional_results(latest)
+            self.search_progress.set(token.progress)
+            self.after(SEARCH_POLL_MS, self.poll_search, future, token, snapshots)
+            return
         
+        self.search_token = None
+        self.hide_search_progress()
+        
+        try:
+            results = future.result()
+        except SearchCancelled:
+            return
         except Exception as e:
             print(f"Search error: {e}")
             self.show_error_message(f"Search failed: {str(e)}")
+            return
+        
+        self.on_search_complete(results)
+    
+    def display_provisional_results(self, results):
+        # kartu hanya di-render ulang jika urutan top-k berubah
+        ranking = [(r["cv_id"], r["total_matches"]) for r in results["results"]]
+        if ranking and ranking != self.displayed_ranking:
+            self.display_search_results(results)
+        summary = results["summary"]
+        self.results_summary.configure(
+            text=f"Searching... {summary['cvs_scanned']}/{summary['total_cvs_searched']} CVs scanned, "
+                 f"{len(ranking)} candidates so far"
+        )
+    
+    def on_search_complete(self, results):
+        if results['summary'].get('error'):
+            self.show_error_message(results['summary']['error'])
+            return
+        
+        self.current_results = results
+        self.display_search_results(results)
+        
+        algorithm_used = results['summary']['algorithm_used']
+        result_count = len(results['results'])
+        main_time = results['timing']['search_time_ms']
+        leven_time = results['timing'].get('levenshtein_time_ms')  # Optional
+
+        print(f"{algorithm_used} search completed: {result_count} results found in {main_time}ms")
+        
+        if leven_time is not None:
+            print(f"Levenshtein additional search took {leven_time}ms")
+        
+        if "+" in algorithm_used:
+            print(f"Fallback mechanism activated: {algorithm_used}")
+    
+    def cancel_search(self):
+        if self.search_token:
+            self.search_token.cancel()
+            self.search_token = None
+            self.hide_search_progress()
+    
+    def show_search_progress(self):
+        self.displayed_ranking = None
+        self.results_summary.configure(text="Searching...")
+        self.search_progress.set(0)
+        self.search_progress.pack(anchor="w", pady=(4, 0))
+    
+    def hide_search_progress(self):
+        self.search_progress.pack_forget()
+    
+    def destroy(self):
+        if self.search_token:
+            self.search_token.cancel()
+        self.search_executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
 
     def show_empty_results(self):
         self.results_summary.configure(text="Please enter keywords to search")
@@ -280,6 +474,7 @@ class HomePage(ctk.CTkScrollableFrame):
     
     def display_search_results(self, results):
         self.clear_results_grid()
+        self.displayed_ranking = [(r["cv_id"], r["total_matches"]) for r in results["results"]]
         
         summary = results['summary']
         timing = results.get('timing', {})
@@ -289,12 +484,18 @@ class HomePage(ctk.CTkScrollableFrame):
         total_cvs = summary['total_cvs_searched']
         matches = summary['cvs_with_matches']
         levenshtein_time = timing.get('levenshtein_time_ms')
+        pruning_ratio = timing.get('qgram_pruning_ratio')
+        leven_examined = timing.get('levenshtein_cvs_examined')
 
         if "→" in algorithm or "+ Levenshtein" in algorithm:
             summary_text = f"{algorithm}: {matches}/{total_cvs} CVs matched\n"
             summary_text += f"Initial algorithm time: {time_ms}ms"
             if levenshtein_time is not None:
                 summary_text += f"\nLevenshtein supplement time: {levenshtein_time}ms"
+            if pruning_ratio is not None:
+                summary_text += f" (q-gram pruned {pruning_ratio:.0%})"
+            if leven_examined is not None:
+                summary_text += f"\nFuzzy fallback examined {leven_examined} CVs"
         else:
             summary_text = f"{algorithm}: {matches}/{total_cvs} CVs matched in {time_ms}ms"
 
@@ -353,6 +554,8 @@ class HomePage(ctk.CTkScrollableFrame):
         
         total_matches = result["total_matches"]
         matches_text = f"{total_matches} Match{'es' if total_matches != 1 else ''}"
+        if "score" in result:
+            matches_text = f"Score {result['score']:.2f} · {matches_text}"
         matches_label = ctk.CTkLabel(
             card,
             text=matches_text,
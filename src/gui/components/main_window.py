@@ -168,6 +168,9 @@ class MainWindow(ctk.CTk):
                 results = self.search_controller.search_cvs(keywords, algorithm, top_matches)
                 
                 home_page = self.pages['home']
+                if results['summary'].get('error'):
+                    home_page.show_error_message(results['summary']['error'])
+                    return
                 home_page.display_search_results(results)
                 
                 algorithm_used = results['summary']['algorithm_used']
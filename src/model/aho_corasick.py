@@ -3,6 +3,7 @@ Implementasi Algoritma Aho Corasick
 '''
 
 from collections import defaultdict, deque
+import heapq
 
 class AhoCorasick:
     def __init__(self):
@@ -10,6 +11,8 @@ class AhoCorasick:
         self.failure = {}
         self.output = defaultdict(list)
         self.keywords = []
+        self.nodes = {id(self.trie): self.trie}  # id node -> node, agar failure link O(1)
+        self.terminal = {}                       # id node -> keyword yang berakhir di node itu
     
     def add_keyword(self, keyword):
         # create trie (keyword tree)
@@ -17,9 +20,12 @@ class AhoCorasick:
         for char in keyword:
             if char not in node:
                 node[char] = {}
+                self.nodes[id(node[char])] = node[char]
             node = node[char]
         node['$'] = True  # end of word
-        self.keywords.append(keyword)
+        if id(node) not in self.terminal:
+            self.terminal[id(node)] = keyword
+            self.keywords.append(keyword)
     
     def build_failure_function(self):
         # the failure function for the automaton
@@ -28,7 +34,10 @@ class AhoCorasick:
         # initialize failure function for first level
         for char in self.trie:
             if char != '$':
-                self.failure[id(self.trie[char])] = id(self.trie)
+                child_id = id(self.trie[char])
+                self.failure[child_id] = id(self.trie)
+                if child_id in self.terminal:
+                    self.output[child_id] = [self.terminal[child_id]]
                 queue.append((self.trie[char], char))
         
         # build failure function for remaining levels
@@ -57,58 +66,20 @@ class AhoCorasick:
                 else:
                     self.failure[child_id] = id(self.trie)
                 
-                # Build output function
+                # Build output function: keyword di node ini + keyword suffix dari failure target
                 failure_target_id = self.failure[child_id]
+                if child_id in self.terminal:
+                    self.output[child_id].append(self.terminal[child_id])
                 if failure_target_id in self.output:
                     self.output[child_id].extend(self.output[failure_target_id])
     
     # helper function to get node by ID
     def _get_node_by_id(self, node_id):   
-        if node_id == id(self.trie):
-            return self.trie
-        
-        def find_node(node, target_id):
-            if id(node) == target_id:
-                return node
-            for key, child in node.items():
-                if key != '$' and isinstance(child, dict):
-                    result = find_node(child, target_id)
-                    if result:
-                        return result
-            return None
-        
-        return find_node(self.trie, node_id)
+        return self.nodes[node_id]
     
     # get all pattern matches at a given node
     def _get_matches_at_node(self, node):
-        matches = []
-        node_id = id(node)
-        
-        if '$' in node:
-            # Find the pattern that ends at this node
-            pattern = self._reconstruct_pattern(node)
-            if pattern:
-                matches.append(pattern)
-        
-        if node_id in self.output:
-            matches.extend(self.output[node_id])
-        
-        return matches
-    
-    def _reconstruct_pattern(self, target_node):
-        # reconstruct pattern from root to target node
-        def dfs(node, path, target_id):
-            if id(node) == target_id:
-                return path
-            
-            for char, child in node.items():
-                if char != '$' and isinstance(child, dict):
-                    result = dfs(child, path + char, target_id)
-                    if result:
-                        return result
-            return None
-        
-        return dfs(self.trie, "", id(target_node))
+        return self.output.get(id(node), [])
     
     def search(self, text):
         if not self.keywords:
@@ -141,6 +112,30 @@ class AhoCorasick:
                         result_counts[match] += 1
         
         return result_counts
+    
+    def search_positions(self, text):
+        # seperti search, tetapi mengembalikan posisi awal setiap kemunculan keyword
+        if not self.keywords:
+            return {}
+        
+        if not self.failure:
+            self.build_failure_function()
+        
+        result_positions = {keyword: [] for keyword in self.keywords}
+        current_node = self.trie
+        
+        for i, char in enumerate(text):
+            while current_node is not self.trie and char not in current_node:
+                current_node = self._get_node_by_id(self.failure[id(current_node)])
+            
+            if char in current_node:
+                current_node = current_node[char]
+                for match in self._get_matches_at_node(current_node):
+                    result_positions[match].append(i - len(match) + 1)
+        
+        for positions in result_positions.values():
+            positions.sort()
+        return result_positions
 
 def aho_corasick_search(text: str, keywords: list) -> dict:
     ac = AhoCorasick()
@@ -162,7 +157,7 @@ def aho_corasick_search(text: str, keywords: list) -> dict:
     
     return final_result
 
-def aho_corasick_search_with_cv_info(cv_database: dict, keywords: list) -> dict:
+def aho_corasick_search_with_cv_info(cv_database: dict, keywords: list, cancel_token=None) -> dict:
 
     results = {
         "matches": {}, 
@@ -179,6 +174,8 @@ def aho_corasick_search_with_cv_info(cv_database: dict, keywords: list) -> dict:
     keywords_clean = [kw.strip() for kw in keywords if kw.strip()]
     
     for cv_id, cv_content in cv_database.items():
+        if cancel_token is not None:
+            cancel_token.checkpoint(len(results["matches"]), len(cv_database))
         cv_matches = aho_corasick_search(cv_content, keywords_clean)
         
         total_score = sum(cv_matches.values())
@@ -215,8 +212,8 @@ def aho_corasick_search_with_cv_info(cv_database: dict, keywords: list) -> dict:
     
     return results
 
-def search_cvs_with_aho_corasick(cv_database: dict, keywords: list, top_n: int = 5) -> list:
-    search_results = aho_corasick_search_with_cv_info(cv_database, keywords)
+def search_cvs_with_aho_corasick(cv_database: dict, keywords: list, top_n: int = 5, cancel_token=None) -> list:
+    search_results = aho_corasick_search_with_cv_info(cv_database, keywords, cancel_token)
     
     detailed_results = []
     
@@ -249,6 +246,82 @@ def search_cvs_with_aho_corasick(cv_database: dict, keywords: list, top_n: int =
     
     return detailed_results
 
+def batch_search_with_aho_corasick(cv_database: dict, requisitions: dict, top_n: int = 5, cancel_token=None) -> dict:
+    '''
+    Pencarian banyak requisition sekaligus: gabungan keyword semua requisition dikompilasi
+    menjadi satu automaton, setiap CV dipindai sekali, lalu count-nya dibagikan ke top-k
+    masing-masing requisition (heap berukuran top_n). Hasil per requisition sama dengan
+    search_cvs_with_aho_corasick untuk keyword requisition tersebut.
+    '''
+    ac = AhoCorasick()
+    requisition_keywords = {}
+    keyword_requisitions = defaultdict(list)
+
+    for name, keywords in requisitions.items():
+        keywords_clean = list(dict.fromkeys(kw.strip() for kw in keywords if kw.strip()))
+        requisition_keywords[name] = keywords_clean
+        for keyword_lower in dict.fromkeys(kw.lower() for kw in keywords_clean):
+            ac.add_keyword(keyword_lower)
+            keyword_requisitions[keyword_lower].append(name)
+
+    top_heaps = {name: [] for name in requisitions}
+
+    for order, (cv_id, cv_content) in enumerate(cv_database.items()):
+        if cancel_token is not None:
+            cancel_token.checkpoint(order, len(cv_database))
+        counts = ac.search(cv_content.lower())
+
+        touched = set()
+        for keyword_lower, count in counts.items():
+            if count:
+                touched.update(keyword_requisitions[keyword_lower])
+
+        for name in touched:
+            score = sum(counts[kw.lower()] for kw in requisition_keywords[name])
+            # urutan CV dipakai sebagai tie-break, sama seperti sort stabil pada pencarian tunggal
+            entry = (score, -order, cv_id)
+            heap = top_heaps[name]
+            if len(heap) < top_n:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+    batch_results = {}
+
+    for name, heap in top_heaps.items():
+        detailed_results = []
+
+        for score, _, cv_id in sorted(heap, reverse=True):
+            # posisi hanya dihitung untuk CV yang masuk top-k
+            cv_positions = ac.search_positions(cv_database[cv_id].lower())
+            cv_matches = {kw: len(cv_positions[kw.lower()]) for kw in requisition_keywords[name]}
+
+            cv_result = {
+                "cv_id": cv_id,
+                "total_score": score,
+                "matches": cv_matches,
+                "keyword_positions": {kw: cv_positions[kw.lower()] for kw in requisition_keywords[name]},
+                "matched_keywords": [
+                    kw for kw, count in cv_matches.items()
+                    if count > 0
+                ],
+                "match_summary": []
+            }
+
+            for keyword, count in cv_matches.items():
+                if count > 0:
+                    cv_result["match_summary"].append({
+                        "keyword": keyword,
+                        "count": count,
+                        "positions": cv_result["keyword_positions"][keyword][:3]
+                    })
+
+            detailed_results.append(cv_result)
+
+        batch_results[name] = detailed_results
+
+    return batch_results
+
 # Driver code
 if __name__ == "__main__":
     words = ["cook", "computer", "food", "culinary"]
@@ -0,0 +1,89 @@
+'''
+Implementasi Ranking BM25 di atas Positional Index
+'''
+
+import heapq
+import math
+
+from model.levenshtein_distance import tokenize_with_offsets
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+def bm25_idf(doc_count: int, doc_freq: int) -> float:
+    # varian Lucene (selalu positif), term yang muncul di semua CV tetap sedikit berkontribusi
+    return math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+def bm25_term_scores(index, postings: dict) -> dict:
+    '''
+    Skor BM25 per cv_id untuk satu term/phrase dari posting-nya (cv_id -> posisi).
+    Hanya CV yang ada di posting yang dihitung, panjang dokumen dan avgdl diambil dari
+    statistik yang dijaga PositionalIndex sehingga korpus tidak dipindai per query.
+    '''
+    if not postings:
+        return {}
+
+    idf = bm25_idf(len(index), len(postings))
+    avgdl = index.avg_doc_length() or 1.0
+
+    scores = {}
+    for cv_id, positions in postings.items():
+        tf = len(positions)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * index.doc_length(cv_id) / avgdl)
+        scores[cv_id] = idf * tf * (BM25_K1 + 1) / (tf + norm)
+    return scores
+
+def search_cvs_with_bm25(index, keywords: list, top_n: int = 5) -> list:
+    '''
+    Keyword dicocokkan per token (keyword berspasi sebagai phrase), lalu skor BM25 tiap
+    keyword dijumlahkan term-at-a-time. total_score berisi skor BM25 dan match_count
+    berisi jumlah kemunculan mentah.
+    '''
+    keyword_postings = {}
+    cv_scores = {}
+
+    for keyword in keywords:
+        words = [word for word, _ in tokenize_with_offsets(keyword)]
+        if not words or keyword in keyword_postings:
+            continue
+        postings = index.phrase_postings(words)
+        keyword_postings[keyword] = postings
+        for cv_id, score in bm25_term_scores(index, postings).items():
+            cv_scores[cv_id] = cv_scores.get(cv_id, 0.0) + score
+
+    ranked_cvs = heapq.nsmallest(top_n, cv_scores.items(), key=lambda x: (-x[1], index.cv_order[x[0]]))
+
+    detailed_results = []
+
+    for cv_id, score in ranked_cvs:
+        cv_matches = {}
+        cv_positions = {}
+        for keyword, postings in keyword_postings.items():
+            token_positions = postings.get(cv_id, [])
+            cv_matches[keyword] = len(token_positions)
+            cv_positions[keyword] = index.char_positions(cv_id, token_positions)
+
+        cv_result = {
+            "cv_id": cv_id,
+            "total_score": round(score, 4),
+            "match_count": sum(cv_matches.values()),
+            "matches": cv_matches,
+            "keyword_positions": cv_positions,
+            "matched_keywords": [
+                kw for kw, count in cv_matches.items()
+                if count > 0
+            ],
+            "match_summary": []
+        }
+
+        for keyword, count in cv_matches.items():
+            if count > 0:
+                cv_result["match_summary"].append({
+                    "keyword": keyword,
+                    "count": count,
+                    "positions": cv_positions[keyword][:3]
+                })
+
+        detailed_results.append(cv_result)
+
+    return detailed_results
@@ -39,7 +39,7 @@ def boyer_moore_search_keyword_list(text: str, keywords: list) -> dict:
     
     return result
 
-def boyer_moore_with_cv_info(cv_database: dict, keywords: list) -> dict:
+def boyer_moore_with_cv_info(cv_database: dict, keywords: list, cancel_token=None) -> dict:
     results = {
         "matches": {},  
         "cv_scores": {},  
@@ -55,6 +55,8 @@ def boyer_moore_with_cv_info(cv_database: dict, keywords: list) -> dict:
     keywords_lower = [kw.lower().strip() for kw in keywords if kw.strip()]
 
     for cv_id, cv_content in cv_database.items():
+        if cancel_token is not None:
+            cancel_token.checkpoint(len(results["matches"]), len(cv_database))
         cv_content_lower = cv_content.lower()
         cv_matches = {}
         cv_positions = {}
@@ -85,8 +87,8 @@ def boyer_moore_with_cv_info(cv_database: dict, keywords: list) -> dict:
 
     return results
 
-def search_cvs_boyer_moore(cv_database: dict, keywords: list, top_n: int = 5) -> list:
-    search_results = boyer_moore_with_cv_info(cv_database, keywords)
+def search_cvs_boyer_moore(cv_database: dict, keywords: list, top_n: int = 5, cancel_token=None) -> list:
+    search_results = boyer_moore_with_cv_info(cv_database, keywords, cancel_token)
     
     detailed_results = []
 
@@ -0,0 +1,44 @@
+'''
+Token pembatalan untuk pencarian yang berjalan di background thread
+'''
+
+import threading
+
+class SearchCancelled(Exception):
+    pass
+
+class CancellationToken:
+    def __init__(self):
+        self._event = threading.Event()
+        self.done = 0
+        self.total = 0
+
+    def cancel(self):
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def checkpoint(self, done: int, total: int):
+        # dipanggil di loop matcher per CV: catat progress, hentikan jika sudah dibatalkan
+        self.done = done
+        self.total = total
+        if self._event.is_set():
+            raise SearchCancelled()
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else 0.0
+
+class BatchCancellationToken:
+    # token untuk satu batch korpus: progress matcher dilaporkan relatif terhadap seluruh korpus
+    def __init__(self, token: CancellationToken, offset: int, total: int):
+        self.token = token
+        self.offset = offset
+        self.total = total
+
+    def is_cancelled(self) -> bool:
+        return self.token.is_cancelled()
+
+    def checkpoint(self, done: int, total: int):
+        self.token.checkpoint(self.offset + done, self.total)
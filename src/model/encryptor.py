@@ -1,8 +1,28 @@
 import base64
 
+try:
+    import numpy as np
+except ImportError:
+    print("Warning: NumPy not installed. Bulk encryption will use translation tables only.")
+    print("Install with: pip install numpy")
+    np = None
+
+_BASE = ord(' ')
+_RANGE_SIZE = 95  # printable ASCII from ' ' (32) to '~' (126)
+
+# jumlah karakter total minimum sebelum encrypt_many/decrypt_many memakai jalur NumPy
+NUMPY_MIN_CHARS = 4096
+
 class Encryptor:
     def __init__(self, key: str):
         self.key = key
+        # satu tabel str.translate per posisi key: karakter ke-i memakai tabel i % len(key)
+        self._encrypt_tables = [self._build_table(k, True) for k in key]
+        self._decrypt_tables = [self._build_table(k, False) for k in key]
+        self._key_shifts = [ord(k) - _BASE for k in key]
+
+    def _build_table(self, k, encrypt=True) -> dict:
+        return {c: self._shift_char(chr(c), k, encrypt) for c in range(32, 127)}
 
     def _shift_char(self, c, k, encrypt=True):
         base = ord(' ')
@@ -14,16 +34,48 @@ class Encryptor:
         return chr(base + shift)
 
     def _apply_cipher(self, text: str, encrypt=True) -> str:
+        # karakter di luar printable ASCII tidak ada di tabel sehingga dibiarkan apa adanya
         text = text or ""
-        result = []
-        for i, c in enumerate(text):
-            if 32 <= ord(c) <= 126:
-                k = self.key[i % len(self.key)]
-                result.append(self._shift_char(c, k, encrypt))
-            else:
-                result.append(c)
+        tables = self._encrypt_tables if encrypt else self._decrypt_tables
+        key_len = len(tables)
+        if len(text) <= key_len:
+            return ''.join(c.translate(tables[i]) for i, c in enumerate(text))
+
+        result = [None] * len(text)
+        for i, table in enumerate(tables):
+            result[i::key_len] = text[i::key_len].translate(table)
         return ''.join(result)
 
+    def _apply_cipher_many(self, texts: list, encrypt=True) -> list:
+        # seluruh kolom diproses sebagai satu array code point; posisi key di-reset per string
+        texts = [text or "" for text in texts]
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        if not lengths.sum():
+            return texts
+
+        codes = np.frombuffer(''.join(texts).encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        positions = np.arange(len(codes)) - starts
+        shifts = np.asarray(self._key_shifts, dtype=np.int64)[positions % len(self._key_shifts)]
+        if not encrypt:
+            shifts = -shifts
+
+        printable = (codes >= 32) & (codes <= 126)
+        codes[printable] = (codes[printable] - _BASE + shifts[printable]) % _RANGE_SIZE + _BASE
+
+        joined = codes.astype(np.uint32).tobytes().decode('utf-32-le')
+        results = []
+        offset = 0
+        for length in lengths.tolist():
+            results.append(joined[offset:offset + length])
+            offset += length
+        return results
+
+    def _cipher_many(self, texts: list, encrypt=True) -> list:
+        if np is not None and sum(len(text or "") for text in texts) >= NUMPY_MIN_CHARS:
+            return self._apply_cipher_many(texts, encrypt)
+        return [self._apply_cipher(text, encrypt) for text in texts]
+
     def encrypt(self, plaintext: str) -> str:
         cipher = self._apply_cipher(plaintext, encrypt=True)
         return base64.urlsafe_b64encode(cipher.encode()).decode()
@@ -34,3 +86,25 @@ class Encryptor:
             return self._apply_cipher(decoded, encrypt=False)
         except Exception:
             return "[DECRYPTION FAILED]"
+
+    def encrypt_many(self, plaintexts: list) -> list:
+        # hasil identik dengan [encrypt(p) for p in plaintexts]
+        ciphers = self._cipher_many(plaintexts, encrypt=True)
+        return [base64.urlsafe_b64encode(cipher.encode()).decode() for cipher in ciphers]
+
+    def decrypt_many(self, ciphertexts: list) -> list:
+        # hasil identik dengan [decrypt(c) for c in ciphertexts], termasuk "[DECRYPTION FAILED]"
+        decoded = []
+        failed = set()
+        for i, ciphertext in enumerate(ciphertexts):
+            try:
+                decoded.append(base64.urlsafe_b64decode(ciphertext.encode()).decode())
+            except Exception:
+                decoded.append("")
+                failed.add(i)
+
+        plaintexts = self._cipher_many(decoded, encrypt=False)
+        return [
+            "[DECRYPTION FAILED]" if i in failed else plaintext
+            for i, plaintext in enumerate(plaintexts)
+        ]
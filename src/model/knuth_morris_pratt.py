@@ -15,7 +15,7 @@ def knuth_morris_pratt(data: str, keyword: list) -> dict:
         
     return result
 
-def knuth_morris_pratt_with_cv_info(cv_database: dict, keyword: list) -> dict:
+def knuth_morris_pratt_with_cv_info(cv_database: dict, keyword: list, cancel_token=None) -> dict:
     results = {
         "matches": {},  
         "cv_scores": {},  
@@ -31,6 +31,8 @@ def knuth_morris_pratt_with_cv_info(cv_database: dict, keyword: list) -> dict:
     keywords_lower = [kw.lower().strip() for kw in keyword if kw.strip()]
     
     for cv_id, cv_content in cv_database.items():
+        if cancel_token is not None:
+            cancel_token.checkpoint(len(results["matches"]), len(cv_database))
         cv_content_lower = cv_content.lower()
         cv_matches = {}
         cv_positions = {}
@@ -64,8 +66,8 @@ def knuth_morris_pratt_with_cv_info(cv_database: dict, keyword: list) -> dict:
     
     return results
 
-def search_cvs_with_details(cv_database: dict, keywords: list, top_n: int = 5) -> list:
-    search_results = knuth_morris_pratt_with_cv_info(cv_database, keywords)
+def search_cvs_with_details(cv_database: dict, keywords: list, top_n: int = 5, cancel_token=None) -> list:
+    search_results = knuth_morris_pratt_with_cv_info(cv_database, keywords, cancel_token)
     detailed_results = []
     
     for cv_id, score in search_results["ranked_cvs"][:top_n]:
@@ -2,14 +2,38 @@
 Implementasi Allgoritma Levenshtein Distance
 '''
 
+from functools import lru_cache
+import re
+import time
+
+from model.cancellation import SearchCancelled
+
+try:
+    import numpy as np
+except ImportError:
+    print("Warning: NumPy not installed. Batch Levenshtein will use the scalar kernel.")
+    print("Install with: pip install numpy")
+    np = None
+
 threshold = 0.6
+# batas panjang string yang muat dalam satu machine word untuk bit-vector Myers
+MYERS_WORD_SIZE = 64
+
+# jumlah kandidat minimum sebelum pengecekan dialihkan ke batch NumPy
+BATCH_MIN_CANDIDATES = 256
+# jumlah kandidat per chunk precompute; deadline dan pembatalan dicek di antara chunk
+PASS_CACHE_CHUNK_SIZE = 4096
+
+_TOKEN_RX = re.compile(r"\S+")
 
 def levenshtein_distance(data: list, keyword: list) -> dict:
     res = {key: 0 for key in keyword}
+    keys_lower = [(key, key.lower()) for key in keyword]
     for word in data:
-        for key in keyword:
-            dist = levenshtein_calculation(word.lower(), key.lower())
-            if is_pass(word.lower(), key.lower(), dist):
+        word_lower = word.lower()
+        for key, key_lower in keys_lower:
+            dist = levenshtein_calculation(word_lower, key_lower)
+            if is_pass(word_lower, key_lower, dist):
                 res[key] += 1
     return res
 
@@ -21,6 +45,163 @@ def is_pass(string1: str, string2: str, dist: int) -> bool:
     return sim > threshold
 
 def levenshtein_calculation(string1: str, string2: str) -> int:
+    # pilih kernel otomatis: bit-vector Myers jika string yang lebih pendek muat dalam satu word
+    if len(string1) > len(string2):
+        string1, string2 = string2, string1
+    if 0 < len(string1) <= MYERS_WORD_SIZE:
+        return myers_calculation(string1, string2)
+    return levenshtein_dp(string1, string2)
+
+@lru_cache(maxsize=1024)
+def _build_peq(pattern: str) -> dict:
+    # bitmask posisi kemunculan tiap karakter di pattern
+    peq = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    return peq
+
+def myers_calculation(pattern: str, text: str) -> int:
+    '''
+    Levenshtein distance dengan algoritma bit-vector Myers (varian Hyyro).
+    Satu kolom DP diproses dengan beberapa operasi word, sehingga kompleksitasnya
+    O(n) untuk pattern dengan panjang <= MYERS_WORD_SIZE.
+    '''
+    m = len(pattern)
+    if m == 0:
+        return len(text)
+    if m > MYERS_WORD_SIZE:
+        return levenshtein_dp(pattern, text)
+
+    peq = _build_peq(pattern)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+
+    pv = mask   # vertical positive delta
+    mv = 0      # vertical negative delta
+    score = m
+
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+
+        # baris 0 pada global edit distance selalu naik 1 per kolom
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+    return score
+
+def pad_terms(terms: list):
+    # matriks uint8 (satu baris per term, di-pad dengan 0) beserta panjang asli tiap term
+    lengths = np.fromiter((len(term) for term in terms), dtype=np.int32, count=len(terms))
+    width = int(lengths.max()) if len(terms) else 0
+    matrix = np.zeros((len(terms), width), dtype=np.uint8)
+    for row, term in enumerate(terms):
+        matrix[row, :len(term)] = np.frombuffer(term.encode("ascii"), dtype=np.uint8)
+    return matrix, lengths
+
+def batch_levenshtein_pass(keyword: str, matrix, lengths):
+    '''
+    DP Levenshtein untuk semua kandidat sekaligus: satu iterasi per karakter keyword,
+    setiap iterasi memproses seluruh baris matrix dengan operasi NumPy. Ketergantungan
+    insert (curr[j - 1] + 1) diselesaikan dengan minimum.accumulate. Mengembalikan
+    mask boolean dengan aturan yang sama seperti is_pass.
+    '''
+    count, width = matrix.shape
+    key_codes = np.frombuffer(keyword.encode("ascii"), dtype=np.uint8)
+    steps = np.arange(width + 1, dtype=np.int32)
+
+    prev = np.broadcast_to(steps, (count, width + 1)).copy()
+    curr = np.empty_like(prev)
+    for i, code in enumerate(key_codes, start=1):
+        curr[:, 0] = i
+        np.minimum(prev[:, :-1] + (matrix != code), prev[:, 1:] + 1, out=curr[:, 1:])
+        curr = np.minimum.accumulate(curr - steps, axis=1) + steps
+        prev, curr = curr, prev
+
+    dist = prev[np.arange(count), lengths]
+    longest = np.maximum(lengths, len(key_codes))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sim = 1 - (dist / longest)
+    return np.where(longest == 0, True, sim > threshold)
+
+def precompute_pass_cache(words, keywords: list, pass_cache: dict, qgram_index=None, stats: dict = None,
+                          deadline: float = None, cancel_token=None) -> dict:
+    '''
+    Isi pass_cache untuk semua pasangan (word, keyword). Jika qgram_index diberikan,
+    term yang gugur oleh count filter langsung ditandai False dan hanya survivor yang
+    dihitung jaraknya; batch NumPy dipakai jika kandidatnya banyak. Survivor diproses
+    per PASS_CACHE_CHUNK_SIZE: pembatalan menghentikan precompute dengan SearchCancelled,
+    deadline yang lewat menghentikannya lebih awal (pasangan sisanya dihitung lazy
+    oleh levenshtein_scan_tokens).
+    '''
+    words = list(set(words))
+
+    for key in keywords:
+        # pasangan yang sudah ada di pass_cache (mis. dari batch sebelumnya) tidak dihitung ulang
+        pending = [word for word in words if (word, key) not in pass_cache]
+        if not pending:
+            continue
+
+        if qgram_index is not None:
+            survivors = qgram_index.candidates(key)
+            candidates = []
+            for word in pending:
+                if word in survivors:
+                    candidates.append(word)
+                else:
+                    pass_cache[(word, key)] = False
+        else:
+            candidates = pending
+
+        if stats is not None:
+            stats["candidates"] = stats.get("candidates", 0) + len(pending)
+            stats["survivors"] = stats.get("survivors", 0) + len(candidates)
+
+        for start in range(0, len(candidates), PASS_CACHE_CHUNK_SIZE):
+            if cancel_token is not None and cancel_token.is_cancelled():
+                raise SearchCancelled()
+            if deadline is not None and time.time() >= deadline:
+                if stats is not None:
+                    stats["budget_exhausted"] = True
+                return pass_cache
+
+            chunk = candidates[start:start + PASS_CACHE_CHUNK_SIZE]
+            if np is not None and key.isascii() and len(chunk) >= BATCH_MIN_CANDIDATES:
+                ascii_words = [word for word in chunk if word.isascii()]
+                matrix, lengths = pad_terms(ascii_words)
+                mask = batch_levenshtein_pass(key, matrix, lengths)
+                for word, passed in zip(ascii_words, mask.tolist()):
+                    pass_cache[(word, key)] = passed
+
+            for word in chunk:
+                if (word, key) not in pass_cache:
+                    pass_cache[(word, key)] = is_pass(word, key, levenshtein_calculation(word, key))
+
+    return pass_cache
+
+def build_pass_cache(keywords: list, qgram_index=None, stats: dict = None, deadline: float = None,
+                     cancel_token=None, terms=None) -> dict:
+    # pass_cache untuk satu query atas terms (default seluruh vocabulary q-gram index),
+    # agar bisa dipakai ulang di setiap batch CV
+    pass_cache = {}
+    if terms is None and qgram_index is not None:
+        terms = qgram_index.terms
+    if terms is not None:
+        keywords_clean = [kw.strip().lower() for kw in keywords if kw.strip()]
+        precompute_pass_cache(terms, keywords_clean, pass_cache, qgram_index, stats, deadline, cancel_token)
+    return pass_cache
+
+def levenshtein_dp(string1: str, string2: str) -> int:
     m = max(len(string1), len(string2))
     n = min(len(string1), len(string2))
     longer = string1
@@ -59,20 +240,45 @@ def levenshtein_calculation(string1: str, string2: str) -> int:
     # last index dari curr adalah nilai akhir levensh dist
     return curr[m]
 
-def levenshtein_search_cv(cv_content: str, keywords: list) -> dict:
-    words = cv_content.lower().replace('\n', ' ').split()
-    
-    clean_words = []
-    for word in words:
-        clean_word = ''.join(char for char in word if char.isalnum())
+def tokenize_with_offsets(cv_content: str) -> list:
+    # token alfanumerik bersih beserta offset karakter awal token aslinya di teks lowercase
+    tokens = []
+    for match in _TOKEN_RX.finditer(cv_content.lower()):
+        clean_word = ''.join(char for char in match.group() if char.isalnum())
         if clean_word:
-            clean_words.append(clean_word)
-    
-    result = levenshtein_distance(clean_words, keywords)
-    
-    return result
+            tokens.append((clean_word, match.start()))
+    return tokens
+
+def levenshtein_scan_tokens(tokens: list, keywords: list, pass_cache: dict = None) -> tuple:
+    '''
+    Satu kali jalan di token stream: count dan posisi dihasilkan dari perhitungan
+    distance yang sama. pass_cache menyimpan hasil is_pass per (word, keyword)
+    sehingga kata yang berulang (di CV yang sama maupun CV lain) tidak dihitung ulang.
+    '''
+    if pass_cache is None:
+        pass_cache = {}
+
+    counts = {key: 0 for key in keywords}
+    positions = {key: [] for key in keywords}
 
-def levenshtein_search_with_cv_info(cv_database: dict, keywords: list) -> dict:
+    for word, start in tokens:
+        for key in keywords:
+            passed = pass_cache.get((word, key))
+            if passed is None:
+                passed = is_pass(word, key, levenshtein_calculation(word, key))
+                pass_cache[(word, key)] = passed
+            if passed:
+                counts[key] += 1
+                positions[key].append(start)
+
+    return counts, positions
+
+def levenshtein_search_cv(cv_content: str, keywords: list) -> dict:
+    counts, _ = levenshtein_scan_tokens(tokenize_with_offsets(cv_content), keywords)
+    return counts
+
+def levenshtein_search_with_cv_info(cv_database: dict, keywords: list, qgram_index=None, stats: dict = None, cancel_token=None,
+                                    pass_cache: dict = None) -> dict:
     results = {
         "matches": {},  
         "cv_scores": {},  
@@ -87,36 +293,25 @@ def levenshtein_search_with_cv_info(cv_database: dict, keywords: list) -> dict:
     
     keywords_clean = [kw.strip().lower() for kw in keywords if kw.strip()]
     
+    cv_tokens = {}
     for cv_id, cv_content in cv_database.items():
-        cv_matches = levenshtein_search_cv(cv_content, keywords_clean)
+        if cancel_token is not None:
+            cancel_token.checkpoint(0, len(cv_database))
+        cv_tokens[cv_id] = tokenize_with_offsets(cv_content)
+    vocabulary = {word for tokens in cv_tokens.values() for word, _ in tokens}
+    if pass_cache is None:
+        pass_cache = {}
+    precompute_pass_cache(vocabulary, keywords_clean, pass_cache, qgram_index, stats, cancel_token=cancel_token)
+    
+    for cv_id, tokens in cv_tokens.items():
+        if cancel_token is not None:
+            cancel_token.checkpoint(len(results["matches"]), len(cv_database))
+        cv_matches, cv_positions = levenshtein_scan_tokens(tokens, keywords_clean, pass_cache)
         
         total_score = sum(cv_matches.values())
         
         results["matches"][cv_id] = cv_matches
         results["cv_scores"][cv_id] = total_score
-        
-        cv_positions = {}
-        cv_content_lower = cv_content.lower()
-        words = cv_content_lower.replace('\n', ' ').split()
-        
-        for keyword in keywords_clean:
-            positions = []
-            char_pos = 0
-            
-            for word_idx, word in enumerate(words):
-                clean_word = ''.join(char for char in word if char.isalnum())
-                if clean_word:
-                    dist = levenshtein_calculation(clean_word, keyword)
-                    if is_pass(clean_word, keyword, dist):
-                        word_start = cv_content_lower.find(word, char_pos)
-                        if word_start != -1:
-                            positions.append(word_start)
-                        char_pos = word_start + len(word) if word_start != -1 else char_pos + len(word)
-                    else:
-                        char_pos += len(word) + 1  # +1 for space
-            
-            cv_positions[keyword] = positions
-        
         results["keyword_positions"][cv_id] = cv_positions
         
         if total_score > 0:
@@ -131,37 +326,125 @@ def levenshtein_search_with_cv_info(cv_database: dict, keywords: list) -> dict:
     
     return results
 
-def search_cvs_with_levenshtein(cv_database: dict, keywords: list, top_n: int = 5) -> list:
-    search_results = levenshtein_search_with_cv_info(cv_database, keywords)
+def build_cv_result(cv_id: str, score: int, cv_matches: dict, cv_positions: dict) -> dict:
+    cv_result = {
+        "cv_id": cv_id,
+        "total_score": score,
+        "matches": cv_matches,
+        "keyword_positions": cv_positions,
+        "matched_keywords": [
+            kw for kw, count in cv_matches.items() 
+            if count > 0
+        ],
+        "match_summary": []
+    }
+    
+    for keyword, count in cv_matches.items():
+        if count > 0:
+            cv_result["match_summary"].append({
+                "keyword": keyword,
+                "count": count,
+                "positions": cv_positions[keyword][:3]  
+            })
+    
+    return cv_result
+
+def search_cvs_with_levenshtein(cv_database: dict, keywords: list, top_n: int = 5, qgram_index=None, stats: dict = None, cancel_token=None,
+                                pass_cache: dict = None) -> list:
+    search_results = levenshtein_search_with_cv_info(cv_database, keywords, qgram_index, stats, cancel_token, pass_cache)
     
     detailed_results = []
     
     for cv_id, score in search_results["ranked_cvs"][:top_n]:
         if score == 0:  
             continue
-            
-        cv_result = {
-            "cv_id": cv_id,
-            "total_score": score,
-            "matches": search_results["matches"][cv_id],
-            "keyword_positions": search_results["keyword_positions"][cv_id],
-            "matched_keywords": [
-                kw for kw, count in search_results["matches"][cv_id].items() 
-                if count > 0
-            ],
-            "match_summary": []
-        }
         
-        for keyword, count in search_results["matches"][cv_id].items():
-            if count > 0:
-                positions = search_results["keyword_positions"][cv_id][keyword]
-                cv_result["match_summary"].append({
-                    "keyword": keyword,
-                    "count": count,
-                    "positions": positions[:3]  
-                })
+        detailed_results.append(build_cv_result(
+            cv_id, score,
+            search_results["matches"][cv_id],
+            search_results["keyword_positions"][cv_id]
+        ))
+    
+    return detailed_results
+
+def iter_levenshtein_results(cv_database: dict, keywords: list, qgram_index=None, stats: dict = None, deadline: float = None,
+                             cancel_token=None):
+    '''
+    Versi generator dari search_cvs_with_levenshtein untuk fallback tanpa positional index:
+    setiap CV yang cocok di-yield, pemanggil memilih top-k dari semua hasil. pass_cache
+    hanya dihitung untuk vocabulary cv_database. Iterasi berhenti saat time.time()
+    melewati deadline; stats["cvs_examined"] mencatat jumlah CV yang benar-benar diperiksa.
+    '''
+    keywords_clean = [kw.strip().lower() for kw in keywords if kw.strip()]
+    
+    cv_tokens = {}
+    for cv_id, cv_content in cv_database.items():
+        if cancel_token is not None and cancel_token.is_cancelled():
+            raise SearchCancelled()
+        cv_tokens[cv_id] = tokenize_with_offsets(cv_content)
+    vocabulary = {word for tokens in cv_tokens.values() for word, _ in tokens}
+    pass_cache = build_pass_cache(keywords_clean, qgram_index, stats, deadline, cancel_token, vocabulary)
+    
+    for examined, (cv_id, tokens) in enumerate(cv_tokens.items()):
+        if cancel_token is not None:
+            cancel_token.checkpoint(examined, len(cv_tokens))
+        if deadline is not None and time.time() >= deadline:
+            if stats is not None:
+                stats["budget_exhausted"] = True
+            return
+        
+        cv_matches, cv_positions = levenshtein_scan_tokens(tokens, keywords_clean, pass_cache)
         
-        detailed_results.append(cv_result)
+        if stats is not None:
+            stats["cvs_examined"] = stats.get("cvs_examined", 0) + 1
+        
+        total_score = sum(cv_matches.values())
+        if total_score > 0:
+            yield build_cv_result(cv_id, total_score, cv_matches, cv_positions)
+
+def levenshtein_results_from_index(index, cv_ids, keywords: list, top_n: int = 5, qgram_index=None, stats: dict = None,
+                                   deadline: float = None, cancel_token=None) -> list:
+    '''
+    Fallback Levenshtein tanpa memindai teks CV. pass_cache hanya dihitung untuk vocabulary
+    CV di cv_ids (index.doc_terms), lalu count dan posisi setiap CV dijumlahkan dari posting
+    positional index untuk term yang lolos. Semua CV di cv_ids diberi skor, jadi top_n yang
+    dikembalikan adalah yang terbaik, bukan yang pertama ditemukan. Jika deadline lewat saat
+    precompute, pasangan yang belum dihitung dianggap tidak lolos.
+    '''
+    keywords_clean = [kw.strip().lower() for kw in keywords if kw.strip()]
+    cv_ids = set(cv_ids)
+    
+    vocabulary = set()
+    for cv_id in cv_ids:
+        vocabulary.update(index.doc_terms.get(cv_id, ()))
+    pass_cache = build_pass_cache(keywords_clean, qgram_index, stats, deadline, cancel_token, vocabulary)
+    
+    hits = {}   # cv_id -> {keyword: [posisi token]}
+    for key in keywords_clean:
+        if cancel_token is not None and cancel_token.is_cancelled():
+            raise SearchCancelled()
+        for term in vocabulary:
+            if not pass_cache.get((term, key)):
+                continue
+            for cv_id, positions in index.term_postings(term).items():
+                if cv_id in cv_ids:
+                    hits.setdefault(cv_id, {}).setdefault(key, []).extend(positions)
+    
+    if stats is not None:
+        stats["cvs_examined"] = stats.get("cvs_examined", 0) + len(cv_ids)
+    
+    scores = {cv_id: sum(len(positions) for positions in cv_hits.values()) for cv_id, cv_hits in hits.items()}
+    ranked_cvs = sorted(scores.items(), key=lambda x: (-x[1], index.cv_order[x[0]]))
+    
+    detailed_results = []
+    for cv_id, score in ranked_cvs[:top_n]:
+        cv_matches = {}
+        cv_positions = {}
+        for key in keywords_clean:
+            token_positions = sorted(hits[cv_id].get(key, []))
+            cv_matches[key] = len(token_positions)
+            cv_positions[key] = index.char_positions(cv_id, token_positions)
+        detailed_results.append(build_cv_result(cv_id, score, cv_matches, cv_positions))
     
     return detailed_results
 
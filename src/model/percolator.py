@@ -0,0 +1,118 @@
+'''
+Implementasi Percolator: mencocokkan CV baru terhadap saved search
+'''
+
+from collections import defaultdict
+
+from model.aho_corasick import AhoCorasick
+from model.positional_index import PositionalIndex
+from model.query_parser import QuerySyntaxError, is_structured_query, parse_query, execute_query
+
+class Percolator:
+    '''
+    Kebalikan dari pencarian biasa: yang di-index adalah query, bukan CV. Keyword semua
+    saved search dikompilasi menjadi satu automaton Aho-Corasick sehingga CV baru cukup
+    dipindai sekali untuk mengetahui saved search mana yang terpenuhi. Saved search
+    berbentuk query terstruktur (AND/OR/NOT/phrase/NEAR) dievaluasi pada positional index
+    berisi CV itu saja.
+    '''
+    def __init__(self):
+        self.searches = {}      # search_id -> {"name", "keywords", "min_score"}
+        self.search_keywords = {}
+        self.keyword_searches = defaultdict(list)
+        self.structured = {}    # search_id -> plan query hasil parse
+        self.automaton = None
+
+    @classmethod
+    def from_saved_searches(cls, saved_searches: dict):
+        percolator = cls()
+        for search_id, search in saved_searches.items():
+            try:
+                percolator.add_search(search_id, search["name"], search["keywords"], search.get("min_score", 1))
+            except QuerySyntaxError as e:
+                # satu saved search rusak tidak boleh mematikan percolation untuk yang lain
+                print(f"Skipping saved search {search_id} ({search['name']!r}): {e}")
+        return percolator
+
+    def add_search(self, search_id, name: str, keywords_str: str, min_score: int = 1):
+        # query di-parse lebih dulu: QuerySyntaxError tidak meninggalkan saved search setengah jadi
+        plan = parse_query(keywords_str) if is_structured_query(keywords_str) else None
+        self.remove_search(search_id)
+        self.searches[search_id] = {"name": name, "keywords": keywords_str, "min_score": min_score}
+
+        if plan is not None:
+            self.structured[search_id] = plan
+            return
+
+        keywords = list(dict.fromkeys(kw.strip() for kw in keywords_str.split(',') if kw.strip()))
+        self.search_keywords[search_id] = keywords
+        for keyword_lower in dict.fromkeys(kw.lower() for kw in keywords):
+            self.keyword_searches[keyword_lower].append(search_id)
+        self.automaton = None  # dikompilasi ulang saat percolate berikutnya
+
+    def remove_search(self, search_id):
+        if search_id not in self.searches:
+            return
+        del self.searches[search_id]
+        self.structured.pop(search_id, None)
+        for keyword in self.search_keywords.pop(search_id, []):
+            search_ids = self.keyword_searches.get(keyword.lower(), [])
+            if search_id in search_ids:
+                search_ids.remove(search_id)
+            if not search_ids:
+                self.keyword_searches.pop(keyword.lower(), None)
+        self.automaton = None
+
+    def _compile(self):
+        self.automaton = AhoCorasick()
+        for keyword_lower in self.keyword_searches:
+            self.automaton.add_keyword(keyword_lower)
+
+    def percolate(self, cv_content: str) -> list:
+        '''
+        Mengembalikan saved search yang terpenuhi CV ini (skor >= min_score), terurut dari
+        skor tertinggi. Skor keyword biasa sama dengan total_score pencarian Aho-Corasick.
+        '''
+        if self.automaton is None:
+            self._compile()
+
+        matched = []
+
+        counts = self.automaton.search(cv_content.lower()) if self.keyword_searches else {}
+        touched = set()
+        for keyword_lower, count in counts.items():
+            if count:
+                touched.update(self.keyword_searches[keyword_lower])
+
+        for search_id in touched:
+            cv_matches = {kw: counts[kw.lower()] for kw in self.search_keywords[search_id]}
+            score = sum(cv_matches.values())
+            if score >= self.searches[search_id]["min_score"]:
+                matched.append(self._match(search_id, score, cv_matches))
+
+        if self.structured:
+            index = PositionalIndex.from_cv_database({"cv": cv_content})
+            for search_id, plan in self.structured.items():
+                scores, hits = execute_query(index, plan)
+                if "cv" not in scores:
+                    continue
+                score = round(scores["cv"], 2)
+                if float(score).is_integer():
+                    score = int(score)
+                if score >= self.searches[search_id]["min_score"]:
+                    cv_matches = {label: len(label_hits.get("cv", [])) for label, label_hits in hits.items()}
+                    matched.append(self._match(search_id, score, cv_matches))
+
+        matched.sort(key=lambda match: (-match["score"], str(match["search_id"])))
+        return matched
+
+    def _match(self, search_id, score, cv_matches: dict) -> dict:
+        return {
+            "search_id": search_id,
+            "name": self.searches[search_id]["name"],
+            "score": score,
+            "matches": {kw: count for kw, count in cv_matches.items() if count > 0}
+        }
+
+    def __len__(self):
+        return len(self.searches)
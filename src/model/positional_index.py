@@ -0,0 +1,144 @@
+'''
+Implementasi Positional Inverted Index
+'''
+
+import heapq
+
+from model.levenshtein_distance import tokenize_with_offsets
+
+class PositionalIndex:
+    '''
+    Inverted index posisional atas token alfanumerik CV (tokenisasi yang sama dengan
+    Levenshtein). Posting menyimpan nomor urut token per CV sehingga phrase dan
+    proximity bisa dicek lewat adjacency posisi, dan offsets menyimpan offset karakter
+    tiap token untuk highlight.
+    '''
+    def __init__(self):
+        self.postings = {}      # term -> {cv_id: [posisi token]}
+        self.offsets = {}       # cv_id -> [offset karakter token ke-i]
+        self.doc_terms = {}     # cv_id -> himpunan term di CV tersebut, untuk remove_document
+        self.cv_order = {}      # cv_id -> urutan masuk, untuk tie-break ranking
+        self.total_length = 0   # jumlah token seluruh korpus, untuk avgdl BM25
+        self._next_order = 0
+
+    @classmethod
+    def from_cv_database(cls, cv_database: dict):
+        index = cls()
+        for cv_id, cv_content in cv_database.items():
+            index.add_document(cv_id, cv_content)
+        return index
+
+    def add_document(self, cv_id: str, cv_content: str):
+        if cv_id in self.offsets:
+            self.remove_document(cv_id)
+
+        tokens = tokenize_with_offsets(cv_content)
+        self.offsets[cv_id] = [start for _, start in tokens]
+        self.total_length += len(tokens)
+        self.doc_terms[cv_id] = {word for word, _ in tokens}
+        self.cv_order[cv_id] = self._next_order
+        self._next_order += 1
+        for position, (word, _) in enumerate(tokens):
+            self.postings.setdefault(word, {}).setdefault(cv_id, []).append(position)
+
+    def remove_document(self, cv_id: str):
+        if cv_id not in self.offsets:
+            return
+        for term in self.doc_terms.pop(cv_id):
+            cv_postings = self.postings[term]
+            del cv_postings[cv_id]
+            if not cv_postings:
+                del self.postings[term]
+        self.total_length -= len(self.offsets.pop(cv_id))
+        del self.cv_order[cv_id]
+
+    def term_postings(self, term: str) -> dict:
+        return self.postings.get(term, {})
+
+    def phrase_postings(self, terms: list) -> dict:
+        # cv_id -> [posisi awal phrase], dicek dengan adjacency posisi token
+        if not terms:
+            return {}
+        if len(terms) == 1:
+            return self.term_postings(terms[0])
+
+        lists = [self.term_postings(term) for term in terms]
+        common = set(lists[0])
+        for cv_postings in sorted(lists[1:], key=len):
+            common &= cv_postings.keys()
+
+        result = {}
+        for cv_id in common:
+            following = [set(cv_postings[cv_id]) for cv_postings in lists[1:]]
+            starts = [
+                start for start in lists[0][cv_id]
+                if all(start + i + 1 in positions for i, positions in enumerate(following))
+            ]
+            if starts:
+                result[cv_id] = starts
+        return result
+
+    def near_postings(self, phrases: list, window: int) -> dict:
+        '''
+        cv_id -> (gap terkecil, [posisi awal tiap phrase yang masuk window]) untuk CV di mana
+        semua phrase muncul dengan paling banyak `window` kata lain di antaranya. Posisi
+        di-merge secara linear dengan heap atas list posisi yang sudah terurut: window dari
+        pointer saat ini dicek, lalu pointer dengan posisi terkecil dimajukan.
+        '''
+        lists = [self.phrase_postings(words) for words in phrases]
+        if not lists or not all(lists):
+            return {}
+        lengths = [len(words) for words in phrases]
+        total_length = sum(lengths)
+
+        common = set(lists[0])
+        for cv_postings in sorted(lists[1:], key=len):
+            common &= cv_postings.keys()
+
+        result = {}
+        for cv_id in common:
+            positions = [cv_postings[cv_id] for cv_postings in lists]
+            pointers = [0] * len(positions)
+            heap = [(starts[0], i) for i, starts in enumerate(positions)]
+            heapq.heapify(heap)
+            max_end = max(starts[0] + lengths[i] - 1 for i, starts in enumerate(positions))
+
+            best_gap = None
+            matched = [set() for _ in positions]
+            while True:
+                start, i = heap[0]
+                gap = max(0, max_end - start + 1 - total_length)
+                if gap <= window:
+                    best_gap = gap if best_gap is None else min(best_gap, gap)
+                    for j, pointer in enumerate(pointers):
+                        matched[j].add(positions[j][pointer])
+
+                pointers[i] += 1
+                if pointers[i] == len(positions[i]):
+                    break
+                next_start = positions[i][pointers[i]]
+                heapq.heapreplace(heap, (next_start, i))
+                max_end = max(max_end, next_start + lengths[i] - 1)
+
+            if best_gap is not None:
+                result[cv_id] = (best_gap, [sorted(starts) for starts in matched])
+        return result
+
+    def char_positions(self, cv_id: str, token_positions: list) -> list:
+        offsets = self.offsets[cv_id]
+        return [offsets[position] for position in token_positions]
+
+    def doc_length(self, cv_id: str) -> int:
+        return len(self.offsets[cv_id])
+
+    def avg_doc_length(self) -> float:
+        return self.total_length / len(self.offsets) if self.offsets else 0.0
+
+    def document_frequency(self, term: str) -> int:
+        return len(self.postings.get(term, ()))
+
+    def vocabulary(self):
+        return self.postings.keys()
+
+    def __len__(self):
+        return len(self.offsets)
@@ -0,0 +1,104 @@
+'''
+Implementasi q-gram Index untuk Filtering Kandidat Fuzzy Matching
+'''
+
+from collections import Counter, defaultdict
+
+from model.levenshtein_distance import threshold, tokenize_with_offsets
+
+_PAD_START = '\x02'
+_PAD_END = '\x03'
+
+class QGramIndex:
+    '''
+    Index q-gram atas vocabulary korpus. Memakai count filtering lemma: jika
+    ed(s, t) <= k maka s dan t berbagi minimal max(|s|, |t|) + q - 1 - k * q
+    q-gram (dengan padding), sehingga term yang tidak memenuhi batas itu pasti
+    tidak lolos threshold similarity dan tidak perlu dihitung jaraknya.
+    '''
+    def __init__(self, q: int = 2):
+        self.q = q
+        self.terms = []
+        self.term_ids = {}
+        self.postings = defaultdict(list)  # gram -> [(term_id, jumlah gram di term)]
+        self.lengths = defaultdict(int)    # panjang term -> jumlah term
+
+    @classmethod
+    def from_cv_database(cls, cv_database: dict, q: int = 2):
+        index = cls(q)
+        for cv_content in cv_database.values():
+            for word, _ in tokenize_with_offsets(cv_content):
+                index.add_term(word)
+        return index
+
+    @classmethod
+    def from_terms(cls, terms, q: int = 2):
+        index = cls(q)
+        for term in terms:
+            index.add_term(term)
+        return index
+
+    def _grams(self, term: str) -> Counter:
+        padded = _PAD_START * (self.q - 1) + term + _PAD_END * (self.q - 1)
+        return Counter(padded[i:i + self.q] for i in range(len(padded) - self.q + 1))
+
+    def add_term(self, term: str):
+        if term in self.term_ids:
+            return
+        term_id = len(self.terms)
+        self.terms.append(term)
+        self.term_ids[term] = term_id
+        self.lengths[len(term)] += 1
+        for gram, count in self._grams(term).items():
+            self.postings[gram].append((term_id, count))
+
+    @staticmethod
+    def max_distance(longest: int) -> int:
+        # distance terbesar yang masih lolos is_pass untuk string terpanjang sepanjang longest
+        k = int(longest * (1 - threshold))
+        while k >= 0 and not (1 - (k / longest)) > threshold:
+            k -= 1
+        return k
+
+    def _min_shared(self, term_len: int, keyword_len: int) -> int:
+        # None jika panjang term membuatnya mustahil lolos (length filter)
+        longest = max(term_len, keyword_len)
+        k = self.max_distance(longest) if longest else 0
+        if k < 0 or abs(term_len - keyword_len) > k:
+            return None
+        return longest + self.q - 1 - k * self.q
+
+    def candidates(self, keyword: str) -> set:
+        keyword_len = len(keyword)
+
+        required = {}
+        unfiltered = []
+        for term_len in self.lengths:
+            need = self._min_shared(term_len, keyword_len)
+            if need is None:
+                continue
+            if need <= 0:
+                unfiltered.append(term_len)  # lemma tidak bisa memangkas panjang ini
+            else:
+                required[term_len] = need
+
+        shared = defaultdict(int)
+        for gram, count in self._grams(keyword).items():
+            for term_id, term_count in self.postings.get(gram, ()):
+                shared[term_id] += min(count, term_count)
+
+        survivors = set()
+        for term_id, count in shared.items():
+            term = self.terms[term_id]
+            need = required.get(len(term))
+            if need is not None and count >= need:
+                survivors.add(term)
+
+        if unfiltered:
+            lengths = set(unfiltered)
+            survivors.update(term for term in self.terms if len(term) in lengths)
+
+        return survivors
+
+    def __len__(self):
+        return len(self.terms)
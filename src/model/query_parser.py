@@ -0,0 +1,300 @@
+'''
+Implementasi Query Language Boolean dan Phrase di atas Positional Index
+
+Grammar (operator harus huruf kapital):
+    query   := and_expr ( (OR | ,) and_expr )*              -> koma = OR, sama seperti daftar keyword biasa
+    and_expr:= unary ( AND unary | NOT unary | unary )*     -> spasi = AND implisit
+    unary   := NOT unary | near
+    near    := primary ( NEAR[/k] primary )*                -> operand harus term/phrase
+    primary := TERM [^bobot] | "phrase" [^bobot] | ( query )
+
+Contoh: python AND (django OR flask) NOT intern
+        "machine learning"^2 OR "data science"
+        python NEAR/10 "machine learning"
+'''
+
+import re
+
+from model.bm25 import bm25_term_scores
+from model.levenshtein_distance import tokenize_with_offsets
+
+_QUERY_TOKEN_RX = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|\^\s*(\d+(?:\.\d+)?)|([^\s()",^]+)|(,))')
+_OPERATORS = {"AND", "OR", "NOT"}
+_NEAR_RX = re.compile(r'NEAR(?:/(\d+))?')
+_STRUCTURED_RX = re.compile(r'\b(?:AND|OR|NOT|NEAR(?:/\d+)?)(?![\w/])|["()^]')
+
+# jumlah kata maksimum di antara operand NEAR tanpa /k
+NEAR_DEFAULT_WINDOW = 10
+
+class QuerySyntaxError(ValueError):
+    pass
+
+class TermNode:
+    def __init__(self, words: list, label: str, weight: float = 1.0):
+        self.words = words    # satu kata untuk term, beberapa kata untuk phrase
+        self.label = label
+        self.weight = weight
+
+class AndNode:
+    def __init__(self, children: list):
+        self.children = children
+
+class OrNode:
+    def __init__(self, children: list):
+        self.children = children
+
+class NotNode:
+    def __init__(self, child):
+        self.child = child
+
+class NearNode:
+    def __init__(self, children: list, window: int):
+        self.children = children    # TermNode, semuanya harus muncul dalam satu window
+        self.window = window
+
+def is_structured_query(query: str) -> bool:
+    return bool(_STRUCTURED_RX.search(query or ""))
+
+def _tokenize_query(query: str) -> list:
+    tokens = []
+    pos = 0
+    query = query.rstrip()
+    while pos < len(query):
+        match = _QUERY_TOKEN_RX.match(query, pos)
+        if not match or match.end() == pos:
+            raise QuerySyntaxError(f"Unexpected character at position {pos}: {query[pos]!r}")
+        pos = match.end()
+        lparen, rparen, phrase, weight, word, comma = match.groups()
+        if lparen:
+            tokens.append(("(", None))
+        elif rparen:
+            tokens.append((")", None))
+        elif phrase is not None:
+            tokens.append(("PHRASE", phrase))
+        elif weight is not None:
+            tokens.append(("WEIGHT", float(weight)))
+        elif comma:
+            tokens.append(("OR", None))
+        elif word is not None:
+            near = _NEAR_RX.fullmatch(word)
+            if near:
+                tokens.append(("NEAR", int(near.group(1)) if near.group(1) else NEAR_DEFAULT_WINDOW))
+            elif word in _OPERATORS:
+                tokens.append((word, None))
+            else:
+                tokens.append(("TERM", word))
+    return tokens
+
+class _Parser:
+    def __init__(self, tokens: list):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def next(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise QuerySyntaxError("Empty query")
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise QuerySyntaxError(f"Unexpected {self.tokens[self.pos][1] or self.peek()!r}")
+        return node
+
+    def parse_or(self):
+        children = [self.parse_and()]
+        while self.peek() == "OR":
+            self.next()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else OrNode(children)
+
+    def parse_and(self):
+        children = [self.parse_unary()]
+        while True:
+            kind = self.peek()
+            if kind == "AND":
+                self.next()
+                children.append(self.parse_unary())
+            elif kind == "NOT":
+                # "a NOT b" berarti a AND NOT b
+                self.next()
+                children.append(NotNode(self.parse_unary()))
+            elif kind in ("TERM", "PHRASE", "("):
+                children.append(self.parse_unary())
+            else:
+                break
+        return children[0] if len(children) == 1 else AndNode(children)
+
+    def parse_unary(self):
+        if self.peek() == "NOT":
+            self.next()
+            return NotNode(self.parse_unary())
+        return self.parse_near()
+
+    def parse_near(self):
+        children = [self.parse_primary()]
+        windows = []
+        while self.peek() == "NEAR":
+            windows.append(self.next()[1])
+            children.append(self.parse_primary())
+        if not windows:
+            return children[0]
+        if not all(isinstance(child, TermNode) and child.words for child in children):
+            raise QuerySyntaxError("NEAR operands must be terms or quoted phrases")
+        # rantai "a NEAR/5 b NEAR/3 c" memakai window paling ketat untuk semua operand
+        return NearNode(children, min(windows))
+
+    def parse_primary(self):
+        kind = self.peek()
+        if kind == "(":
+            self.next()
+            node = self.parse_or()
+            if self.peek() != ")":
+                raise QuerySyntaxError("Missing closing parenthesis")
+            self.next()
+            return node
+        if kind in ("TERM", "PHRASE"):
+            _, text = self.next()
+            words = [word for word, _ in tokenize_with_offsets(text)]
+            label = f'"{text}"' if kind == "PHRASE" else text
+            weight = 1.0
+            if self.peek() == "WEIGHT":
+                weight = self.next()[1]
+            return TermNode(words, label, weight)
+        if kind is None:
+            raise QuerySyntaxError("Unexpected end of query")
+        raise QuerySyntaxError(f"Unexpected {kind!r}")
+
+def parse_query(query: str):
+    return _Parser(_tokenize_query(query)).parse()
+
+def execute_query(index, node, bm25: bool = False) -> tuple:
+    '''
+    Menjalankan plan query sebagai aljabar posting list: AND = irisan (mulai dari posting
+    terkecil), OR = gabungan, NOT = selisih, NEAR = merge list posisi. Mengembalikan
+    (skor per cv_id, hits) dengan hits[label][cv_id] = posisi token kemunculan term/phrase
+    yang bernilai positif. Skor NEAR naik semakin rapat window terkecilnya.
+    Skor term adalah jumlah kemunculan, atau skor BM25 jika bm25=True, dikali bobotnya.
+    '''
+    hits = {}
+    scores = _evaluate(index, node, hits, True, bm25)
+    # label yang muncul lebih dari sekali di query (mis. "python OR python") tidak menggandakan posisi
+    hits = {
+        label: {cv_id: sorted(set(positions)) for cv_id, positions in label_hits.items()}
+        for label, label_hits in hits.items()
+    }
+    return scores, hits
+
+def _evaluate(index, node, hits: dict, positive: bool, bm25: bool) -> dict:
+    if isinstance(node, TermNode):
+        postings = index.phrase_postings(node.words)
+        if positive:
+            label_hits = hits.setdefault(node.label, {})
+            for cv_id, positions in postings.items():
+                label_hits.setdefault(cv_id, []).extend(positions)
+        if bm25:
+            return {cv_id: node.weight * score for cv_id, score in bm25_term_scores(index, postings).items()}
+        return {cv_id: node.weight * len(positions) for cv_id, positions in postings.items()}
+
+    if isinstance(node, OrNode):
+        scores = {}
+        for child in node.children:
+            for cv_id, score in _evaluate(index, child, hits, positive, bm25).items():
+                scores[cv_id] = scores.get(cv_id, 0) + score
+        return scores
+
+    if isinstance(node, AndNode):
+        included = [child for child in node.children if not isinstance(child, NotNode)]
+        excluded = [child.child for child in node.children if isinstance(child, NotNode)]
+
+        if included:
+            child_scores = sorted((_evaluate(index, child, hits, positive, bm25) for child in included), key=len)
+            common = set(child_scores[0])
+            for other in child_scores[1:]:
+                common &= other.keys()
+            scores = {cv_id: sum(child[cv_id] for child in child_scores) for cv_id in common}
+        else:
+            scores = {cv_id: 0 for cv_id in index.offsets}
+
+        for child in excluded:
+            for cv_id in _evaluate(index, child, hits, not positive, bm25):
+                scores.pop(cv_id, None)
+        return scores
+
+    if isinstance(node, NearNode):
+        near = index.near_postings([child.words for child in node.children], node.window)
+        if positive:
+            for i, child in enumerate(node.children):
+                label_hits = hits.setdefault(child.label, {})
+                for cv_id, (_, matched) in near.items():
+                    label_hits.setdefault(cv_id, []).extend(matched[i])
+        # window paling rapat mendapat skor tertinggi (gap 0 -> window + 1)
+        tightness = {cv_id: node.window + 1 - gap for cv_id, (gap, _) in near.items()}
+        if bm25:
+            relevance = {}
+            for child in node.children:
+                for cv_id, score in bm25_term_scores(index, index.phrase_postings(child.words)).items():
+                    if cv_id in near:
+                        relevance[cv_id] = relevance.get(cv_id, 0) + child.weight * score
+            return {cv_id: relevance[cv_id] * tightness[cv_id] / (node.window + 1) for cv_id in near}
+        weight = sum(child.weight for child in node.children) / len(node.children)
+        return {cv_id: weight * tightness[cv_id] for cv_id in near}
+
+    if isinstance(node, NotNode):
+        excluded = _evaluate(index, node.child, hits, not positive, bm25)
+        return {cv_id: 0 for cv_id in index.offsets if cv_id not in excluded}
+
+    raise QuerySyntaxError(f"Unknown query node {node!r}")
+
+def search_cvs_with_query(index, query: str, top_n: int = 5, bm25: bool = False) -> list:
+    scores, hits = execute_query(index, parse_query(query), bm25)
+
+    # CV yang hanya lolos karena klausa NOT (skor 0) bukan hasil pencarian
+    ranked_cvs = sorted(((cv_id, score) for cv_id, score in scores.items() if score > 0),
+                        key=lambda x: (-x[1], index.cv_order[x[0]]))
+
+    detailed_results = []
+
+    for cv_id, score in ranked_cvs[:top_n]:
+        score = round(score, 4 if bm25 else 2)
+        if not bm25 and float(score).is_integer():
+            score = int(score)
+
+        cv_matches = {}
+        cv_positions = {}
+        for label, label_hits in hits.items():
+            token_positions = sorted(label_hits.get(cv_id, []))
+            cv_matches[label] = len(token_positions)
+            cv_positions[label] = index.char_positions(cv_id, token_positions)
+
+        cv_result = {
+            "cv_id": cv_id,
+            "total_score": score,
+            "matches": cv_matches,
+            "keyword_positions": cv_positions,
+            "matched_keywords": [
+                kw for kw, count in cv_matches.items()
+                if count > 0
+            ],
+            "match_summary": []
+        }
+
+        for keyword, count in cv_matches.items():
+            if count > 0:
+                cv_result["match_summary"].append({
+                    "keyword": keyword,
+                    "count": count,
+                    "positions": cv_positions[keyword][:3]
+                })
+
+        if bm25:
+            cv_result["match_count"] = sum(cv_matches.values())
+
+        detailed_results.append(cv_result)
+
+    return detailed_results
@@ -0,0 +1,174 @@
+'''
+Implementasi Substring Index (suffix array atas vocabulary token)
+'''
+
+from bisect import bisect_left, bisect_right
+import re
+
+# karakter terbesar, dipakai sebagai batas atas range prefix pada bisect
+_MAX_CHAR = '\U0010ffff'
+
+_TOKEN_RX = re.compile(r"\S+")
+
+# panjang maksimum suffix yang disimpan; memori index menjadi O(panjang token x batas ini),
+# bukan kuadratik terhadap panjang token (URL, hash, dsb.)
+MAX_SUFFIX_LENGTH = 16
+
+class SubstringIndex:
+    '''
+    Index untuk menjawab "CV mana yang memuat keyword sebagai substring" tanpa memindai teks.
+    Keyword tanpa spasi pasti berada di dalam satu token whitespace, dan setiap substring
+    sebuah token adalah prefix dari salah satu suffix-nya. Semua suffix dari vocabulary,
+    dipotong sepanjang MAX_SUFFIX_LENGTH, disimpan terurut sehingga lookup cukup dengan
+    bisect pada prefix keyword. Keyword yang lebih panjang dicari lewat prefix
+    sepanjang batas itu lalu diverifikasi pada token kandidat. Posting
+    menyimpan offset awal setiap kemunculan token, jadi count dan posisi kemunculan
+    keyword (termasuk yang overlap) bisa dihitung langsung dari index.
+    '''
+    def __init__(self):
+        self.tokens = []
+        self.postings = []      # token_id -> {cv_id: [offset awal token di teks lowercase]}
+        self.suffixes = []      # suffix terurut
+        self.suffix_token = []  # token_id pemilik suffix pada indeks yang sama
+        self.cv_order = {}      # cv_id -> urutan di cv_database, untuk tie-break ranking
+
+    @classmethod
+    def from_cv_database(cls, cv_database: dict):
+        index = cls()
+        token_ids = {}
+        for cv_id, cv_content in cv_database.items():
+            index.cv_order[cv_id] = len(index.cv_order)
+            for match in _TOKEN_RX.finditer(cv_content.lower()):
+                token = match.group()
+                token_id = token_ids.get(token)
+                if token_id is None:
+                    token_id = len(index.tokens)
+                    token_ids[token] = token_id
+                    index.tokens.append(token)
+                    index.postings.append({})
+                index.postings[token_id].setdefault(cv_id, []).append(match.start())
+
+        pairs = sorted({
+            (token[i:i + MAX_SUFFIX_LENGTH], token_id)
+            for token_id, token in enumerate(index.tokens)
+            for i in range(len(token))
+        })
+        index.suffixes = [suffix for suffix, _ in pairs]
+        index.suffix_token = [token_id for _, token_id in pairs]
+        return index
+
+    @staticmethod
+    def supports(keyword: str) -> bool:
+        return bool(keyword) and not any(char.isspace() for char in keyword)
+
+    def prefix_range(self, keyword: str, lo: int = 0, hi: int = None) -> tuple:
+        # range suffix yang diawali keyword; range keyword sebelumnya (prefix-nya) bisa dipakai ulang
+        if hi is None:
+            hi = len(self.suffixes)
+        keyword = keyword[:MAX_SUFFIX_LENGTH]
+        start = bisect_left(self.suffixes, keyword, lo, hi)
+        stop = bisect_right(self.suffixes, keyword + _MAX_CHAR, start, hi)
+        return start, stop
+
+    def _matching_tokens(self, keyword: str, suffix_range: tuple) -> dict:
+        # token_id -> offset kemunculan keyword di dalam token (overlap dihitung)
+        start, stop = suffix_range
+        matching = {}
+        for token_id in set(self.suffix_token[start:stop]):
+            token = self.tokens[token_id]
+            offsets = []
+            pos = token.find(keyword)
+            while pos != -1:
+                offsets.append(pos)
+                pos = token.find(keyword, pos + 1)
+            # keyword lebih panjang dari suffix terpotong: kandidat belum tentu memuatnya
+            if offsets:
+                matching[token_id] = offsets
+        return matching
+
+    def cv_ids_in_range(self, suffix_range: tuple) -> set:
+        # untuk keyword lebih panjang dari MAX_SUFFIX_LENGTH hasilnya superset (kandidat)
+        start, stop = suffix_range
+        cv_ids = set()
+        for token_id in set(self.suffix_token[start:stop]):
+            cv_ids.update(self.postings[token_id])
+        return cv_ids
+
+    def keyword_counts(self, keyword: str, suffix_range: tuple) -> dict:
+        counts = {}
+        for token_id, offsets in self._matching_tokens(keyword, suffix_range).items():
+            for cv_id, starts in self.postings[token_id].items():
+                counts[cv_id] = counts.get(cv_id, 0) + len(starts) * len(offsets)
+        return counts
+
+    def keyword_positions(self, keyword: str, suffix_range: tuple, cv_id: str) -> list:
+        positions = []
+        for token_id, offsets in self._matching_tokens(keyword, suffix_range).items():
+            for start in self.postings[token_id].get(cv_id, ()):
+                positions.extend(start + offset for offset in offsets)
+        return sorted(positions)
+
+    def __len__(self):
+        return len(self.tokens)
+
+def search_cvs_with_substring_index(index: SubstringIndex, keywords: list, top_n: int = 5,
+                                    suffix_ranges: dict = None) -> list:
+    '''
+    Hasil setara pencarian exact (KMP/BM/Aho-Corasick) untuk keyword tanpa spasi, tetapi
+    dihitung dari posting SubstringIndex tanpa memindai teks CV. suffix_ranges berisi
+    range yang sudah dipersempit dari keystroke sebelumnya (opsional).
+    '''
+    suffix_ranges = suffix_ranges or {}
+    keywords_lower = [kw.lower().strip() for kw in keywords if kw.strip()]
+
+    cv_scores = {}
+    keyword_hits = {}
+
+    for word in keywords_lower:
+        suffix_range = suffix_ranges.get(word) or index.prefix_range(word)
+        counts = index.keyword_counts(word, suffix_range)
+
+        original_word = next((kw for kw in keywords if kw.lower().strip() == word), word)
+        keyword_hits[original_word] = (word, suffix_range, counts)
+        for cv_id, count in counts.items():
+            cv_scores[cv_id] = cv_scores.get(cv_id, 0) + count
+
+    ranked_cvs = sorted(cv_scores.items(), key=lambda x: (-x[1], index.cv_order[x[0]]))
+
+    detailed_results = []
+
+    for cv_id, score in ranked_cvs[:top_n]:
+        if score == 0:
+            continue
+
+        cv_matches = {}
+        cv_positions = {}
+        for original_word, (word, suffix_range, counts) in keyword_hits.items():
+            cv_matches[original_word] = counts.get(cv_id, 0)
+            cv_positions[original_word] = (
+                index.keyword_positions(word, suffix_range, cv_id) if cv_matches[original_word] else []
+            )
+
+        cv_result = {
+            "cv_id": cv_id,
+            "total_score": score,
+            "matches": cv_matches,
+            "keyword_positions": cv_positions,
+            "matched_keywords": [
+                kw for kw, count in cv_matches.items()
+                if count > 0
+            ],
+            "match_summary": []
+        }
+
+        for keyword, count in cv_matches.items():
+            if count > 0:
+                cv_result["match_summary"].append({
+                    "keyword": keyword,
+                    "count": count,
+                    "positions": cv_positions[keyword][:3]
+                })
+
+        detailed_results.append(cv_result)
+
+    return detailed_results
@@ -0,0 +1,61 @@
+'''
+Batch search tanpa -o: stdout hanya boleh berisi hasil (JSON Lines atau CSV).
+Korpus sintetis dibuat di database SQLite sementara.
+
+Contoh (dari root project):
+    python -m pytest tests
+'''
+
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.append(str(SRC))
+
+import pytest
+
+pytest.importorskip("faker")
+
+# konfigurasi database dibaca saat db_setup di-import
+os.environ["SIGNHIRE_DB_BACKEND"] = "sqlite"
+os.environ["SIGNHIRE_SQLITE_PATH"] = str(Path(tempfile.mkdtemp()) / "batch_search.db")
+
+REQUISITIONS = {
+    "backend": "python, sql",
+    "structured": "\"project management\" OR python",
+}
+
+@pytest.fixture(scope="module")
+def requisitions_path(tmp_path_factory):
+    for script in (["db_setup.py"], ["corpus_generator.py", "--count", "30", "--seed", "38"]):
+        subprocess.run([sys.executable, str(SRC / "database" / script[0]), *script[1:]],
+                       check=True, capture_output=True)
+    path = tmp_path_factory.mktemp("batch") / "requisitions.json"
+    path.write_text(json.dumps(REQUISITIONS), encoding="utf-8")
+    return path
+
+def run_main(capsys, argv):
+    from controller import batch_search
+    capsys.readouterr()
+    batch_search.main(argv)
+    return capsys.readouterr().out
+
+def test_json_lines_on_stdout(capsys, requisitions_path):
+    out = run_main(capsys, [str(requisitions_path), "--top", "3"])
+    records = [json.loads(line) for line in out.splitlines()]
+    assert [record["requisition"] for record in records] == list(REQUISITIONS)
+    assert any(record["results"] for record in records)
+    for record in records:
+        assert len(record["results"]) <= 3
+
+def test_csv_on_stdout(capsys, requisitions_path):
+    out = run_main(capsys, [str(requisitions_path), "--format", "csv", "--top", "3"])
+    rows = list(csv.DictReader(io.StringIO(out)))
+    assert rows
+    assert {row["requisition"] for row in rows} <= set(REQUISITIONS)
+    assert all(row["cv_id"].startswith("cv_") for row in rows)
@@ -0,0 +1,95 @@
+'''
+Differential test: bit-vector Myers harus selalu sama dengan DP Levenshtein biasa,
+dan fallback dari positional index harus sama dengan pemindaian penuh.
+
+Contoh (dari root project):
+    python -m pytest tests
+'''
+
+import random
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pytest
+
+from model.levenshtein_distance import (MYERS_WORD_SIZE, levenshtein_calculation, levenshtein_dp,
+                                        levenshtein_results_from_index, myers_calculation,
+                                        search_cvs_with_levenshtein)
+from model.positional_index import PositionalIndex
+from model.qgram_index import QGramIndex
+
+ASCII_ALPHABET = "abcde"
+# huruf beraksen, CJK, dan emoji (di luar BMP) sebagai karakter di luar ASCII
+UNICODE_ALPHABET = "aéñüß中文字😀"
+
+def random_string(rng, alphabet: str, length: int) -> str:
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+def assert_same_distance(pattern: str, text: str):
+    expected = levenshtein_dp(pattern, text)
+    assert myers_calculation(pattern, text) == expected, (pattern, text)
+    assert levenshtein_calculation(pattern, text) == expected, (pattern, text)
+    assert levenshtein_calculation(text, pattern) == expected, (text, pattern)
+
+def test_random_strings():
+    rng = random.Random(26)
+    for _ in range(2000):
+        pattern = random_string(rng, ASCII_ALPHABET, rng.randint(1, 20))
+        text = random_string(rng, ASCII_ALPHABET, rng.randint(0, 30))
+        assert_same_distance(pattern, text)
+
+@pytest.mark.parametrize("pattern, text", [
+    ("", ""),
+    ("", "python"),
+    ("python", ""),
+])
+def test_empty_strings(pattern, text):
+    assert_same_distance(pattern, text)
+
+@pytest.mark.parametrize("length", [MYERS_WORD_SIZE - 1, MYERS_WORD_SIZE, MYERS_WORD_SIZE + 1])
+def test_word_size_boundary(length):
+    rng = random.Random(length)
+    for _ in range(50):
+        pattern = random_string(rng, ASCII_ALPHABET, length)
+        text = random_string(rng, ASCII_ALPHABET, rng.randint(0, 2 * length))
+        assert_same_distance(pattern, text)
+
+    # mismatch di bit paling tinggi pattern
+    pattern = "a" * length
+    assert_same_distance(pattern, "a" * (length - 1) + "b")
+    assert_same_distance(pattern, "b" + "a" * length)
+
+def test_non_ascii():
+    rng = random.Random(2026)
+    for _ in range(1000):
+        pattern = random_string(rng, UNICODE_ALPHABET, rng.randint(1, 16))
+        text = random_string(rng, UNICODE_ALPHABET, rng.randint(0, 24))
+        assert_same_distance(pattern, text)
+
+    assert_same_distance("café", "cafe")
+    assert_same_distance("naïve", "naive")
+    assert_same_distance("中文", "中文字")
+
+def test_fallback_from_index_ranks_all_remaining_cvs():
+    rng = random.Random(30)
+    vocabulary = ["python", "pyton", "sql", "sqll", "docker"] + [random_string(rng, "fghijk", 6) for _ in range(200)]
+    cv_database = {
+        f"cv_{i}": " ".join(rng.choice(vocabulary) for _ in range(rng.randint(10, 60)))
+        for i in range(300)
+    }
+    # CV dengan skor tertinggi sengaja diletakkan paling akhir
+    cv_database["cv_best"] = "pyton sqll " * 20
+
+    index = PositionalIndex.from_cv_database(cv_database)
+    qgram_index = QGramIndex.from_terms(index.vocabulary())
+    remaining = {cv_id: content for cv_id, content in cv_database.items() if not cv_id.endswith("0")}
+    keywords = ["pythn", "sqll"]
+
+    def summary(results):
+        return [(r["cv_id"], r["total_score"], r["keyword_positions"]) for r in results]
+
+    expected = search_cvs_with_levenshtein(remaining, keywords, 5, qgram_index)
+    actual = levenshtein_results_from_index(index, remaining, keywords, 5, qgram_index)
+    assert summary(actual) == summary(expected)
+    assert actual[0]["cv_id"] == "cv_best"
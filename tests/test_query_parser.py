@@ -0,0 +1,43 @@
+'''
+Query language: koma berarti OR seperti daftar keyword biasa, dan label yang berulang
+tidak menggandakan jumlah match maupun posisi.
+
+Contoh (dari root project):
+    python -m pytest tests
+'''
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pytest
+
+from model.positional_index import PositionalIndex
+from model.query_parser import QuerySyntaxError, parse_query, search_cvs_with_query
+
+CV_DATABASE = {
+    "cv_1": "python developer",
+    "cv_2": "sql and docker engineer",
+    "cv_3": "sql analyst",
+    "cv_4": "python python sql docker",
+}
+
+@pytest.fixture
+def index():
+    return PositionalIndex.from_cv_database(CV_DATABASE)
+
+def matched_ids(index, query):
+    return {result["cv_id"] for result in search_cvs_with_query(index, query, top_n=10)}
+
+def test_comma_is_or(index):
+    assert matched_ids(index, "python, sql AND docker") == matched_ids(index, "python OR (sql AND docker)")
+    assert matched_ids(index, "python, sql AND docker") == {"cv_1", "cv_2", "cv_4"}
+
+def test_trailing_comma_is_syntax_error():
+    with pytest.raises(QuerySyntaxError):
+        parse_query("python, ")
+
+def test_repeated_label_is_not_double_counted(index):
+    results = {result["cv_id"]: result for result in search_cvs_with_query(index, "python OR python", top_n=10)}
+    assert results["cv_4"]["matches"] == {"python": 2}
+    assert results["cv_4"]["keyword_positions"]["python"] == [0, 7]